@@ -1,6 +1,7 @@
 """Oura API Client - A Python library for the Oura Ring API."""
 
 from .api.client import OuraClient
+from .aio.client import AsyncOuraClient
 from .exceptions import (
     OuraAPIError,
     OuraAuthenticationError,
@@ -12,12 +13,16 @@ from .exceptions import (
     OuraConnectionError,
     OuraTimeoutError
 )
-from .utils import RetryConfig
+from .utils import RetryConfig, RateLimiter, ResponseCache
+from .sync import OuraSync
+from .aggregation import HeartRateResampler, resample_heartrate
+from .store import HeartRateStore
 
 __version__ = "0.1.0"
 
 __all__ = [
     "OuraClient",
+    "AsyncOuraClient",
     "OuraAPIError",
     "OuraAuthenticationError",
     "OuraAuthorizationError",
@@ -27,5 +32,11 @@ __all__ = [
     "OuraClientError",
     "OuraConnectionError",
     "OuraTimeoutError",
-    "RetryConfig"
+    "RetryConfig",
+    "RateLimiter",
+    "ResponseCache",
+    "OuraSync",
+    "HeartRateResampler",
+    "resample_heartrate",
+    "HeartRateStore"
 ]
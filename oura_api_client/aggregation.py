@@ -0,0 +1,244 @@
+"""Single-pass resampling of heart rate streams into time buckets."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .models.heartrate import HeartRateColumns
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Bucket widths, in seconds, accepted by name
+RESAMPLE_FREQUENCIES = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+class HeartRateAggregate(NamedTuple):
+    """Heart rate statistics of one time bucket (and source)."""
+
+    start: datetime
+    source: Optional[str]
+    count: int
+    min: int
+    max: int
+    mean: float
+
+
+def _bucket_width(freq: Union[str, int, timedelta]) -> int:
+    """Return the bucket width in seconds for a frequency name, seconds or timedelta."""
+    if isinstance(freq, timedelta):
+        return int(freq.total_seconds())
+    if isinstance(freq, str):
+        if freq not in RESAMPLE_FREQUENCIES:
+            raise ValueError(
+                f"Unknown frequency {freq!r}; expected one of {', '.join(RESAMPLE_FREQUENCIES)} "
+                "or a number of seconds"
+            )
+        return RESAMPLE_FREQUENCIES[freq]
+    return int(freq)
+
+
+def _sample_fields(sample: Any) -> Tuple[float, int, str]:
+    """Return the epoch seconds, bpm and source of a heart rate model or raw dict."""
+    if isinstance(sample, dict):
+        timestamp = sample["timestamp"]
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return timestamp.timestamp(), sample["bpm"], sample["source"]
+    return sample.timestamp.timestamp(), sample.bpm, sample.source
+
+
+class HeartRateResampler:
+    """Aggregate chronological heart rate samples into fixed time buckets.
+
+    Only the buckets of the current period are kept open, so memory stays
+    constant however long the stream is. A bucket is emitted as soon as a
+    sample from a later bucket arrives; samples must therefore come in
+    chronological order, as the heart rate ``stream()`` yields them.
+
+    Accepts HeartRateSample models, raw sample dicts and HeartRateColumns
+    chunks (``stream(columnar=True)``), which are aggregated with NumPy when
+    it is installed.
+
+    Example:
+        >>> resampler = HeartRateResampler("hour")
+        >>> for chunk in client.heartrate.stream(start_date="2024-01-01", columnar=True):
+        ...     for aggregate in resampler.add(chunk):
+        ...         print(aggregate.start, aggregate.source, aggregate.mean)
+        >>> remaining = resampler.flush()
+    """
+
+    def __init__(
+        self,
+        freq: Union[str, int, timedelta] = "hour",
+        by_source: bool = True,
+        utc_offset: timedelta = timedelta(0)
+    ):
+        """Initialize the resampler.
+
+        Args:
+            freq: Bucket size: "minute", "hour", "day", a number of seconds
+                or a timedelta
+            by_source: Aggregate each source (awake, rest, sleep, ...)
+                separately; when False, all sources share one bucket
+            utc_offset: Offset of the time zone buckets are aligned to, so
+                that e.g. daily buckets follow local days
+
+        Raises:
+            ValueError: If the frequency is unknown or not positive
+        """
+        self.width = _bucket_width(freq)
+        if self.width <= 0:
+            raise ValueError("The bucket width must be positive")
+        self.by_source = by_source
+        self.tz = timezone(utc_offset)
+        self._offset = int(utc_offset.total_seconds())
+        # (bucket index, source) -> [count, sum, min, max]
+        self._open: Dict[Tuple[int, Optional[str]], List[float]] = {}
+        self._latest_bucket: Optional[int] = None
+
+    def add(self, item: Any) -> List[HeartRateAggregate]:
+        """Add a sample or a columnar chunk.
+
+        Args:
+            item: HeartRateSample, raw sample dict or HeartRateColumns
+
+        Returns:
+            The aggregates of the buckets completed by this item
+        """
+        latest = self._latest_bucket
+        if isinstance(item, HeartRateColumns):
+            if np is not None:
+                self._add_columns(item)
+            else:
+                for timestamp, bpm, code in zip(item.timestamps, item.bpm, item.source_codes):
+                    self._add_sample(timestamp, bpm, item.sources[code])
+        else:
+            self._add_sample(*_sample_fields(item))
+        if self._latest_bucket == latest:
+            return []
+        return self._emit(self._latest_bucket)
+
+    def flush(self) -> List[HeartRateAggregate]:
+        """Emit every open bucket, e.g. at the end of the stream."""
+        return self._emit(None)
+
+    def _merge(self, key: Tuple[int, Optional[str]], count: int, total: float, low: float, high: float) -> None:
+        stats = self._open.get(key)
+        if stats is None:
+            self._open[key] = [count, total, low, high]
+        else:
+            stats[0] += count
+            stats[1] += total
+            stats[2] = min(stats[2], low)
+            stats[3] = max(stats[3], high)
+        if self._latest_bucket is None or key[0] > self._latest_bucket:
+            self._latest_bucket = key[0]
+
+    def _add_sample(self, timestamp: float, bpm: int, source: str) -> None:
+        key = ((int(timestamp) + self._offset) // self.width, source if self.by_source else None)
+        stats = self._open.get(key)
+        if stats is None:
+            self._merge(key, 1, bpm, bpm, bpm)
+            return
+        stats[0] += 1
+        stats[1] += bpm
+        if bpm < stats[2]:
+            stats[2] = bpm
+        elif bpm > stats[3]:
+            stats[3] = bpm
+
+    def _add_columns(self, columns: HeartRateColumns) -> None:
+        """Aggregate a columnar chunk in a few vectorized passes."""
+        if not len(columns):
+            return
+        buckets = (np.asarray(columns.timestamps, dtype="int64") + self._offset) // self.width
+        codes = np.asarray(columns.source_codes, dtype="int64") if self.by_source else np.zeros(len(buckets), "int64")
+        bpm = np.asarray(columns.bpm, dtype="int64")
+
+        keys, groups = np.unique(buckets * 256 + codes, return_inverse=True)
+        counts = np.bincount(groups)
+        totals = np.bincount(groups, weights=bpm)
+        lows = np.full(len(keys), np.iinfo("int64").max)
+        highs = np.full(len(keys), np.iinfo("int64").min)
+        np.minimum.at(lows, groups, bpm)
+        np.maximum.at(highs, groups, bpm)
+
+        for key, count, total, low, high in zip(
+            keys.tolist(), counts.tolist(), totals.tolist(), lows.tolist(), highs.tolist()
+        ):
+            source = columns.sources[key % 256] if self.by_source else None
+            self._merge((key // 256, source), count, total, low, high)
+
+    def _emit(self, before: Optional[int]) -> List[HeartRateAggregate]:
+        """Close and return the open buckets older than ``before`` (all when None)."""
+        done = sorted(
+            (key for key in self._open if before is None or key[0] < before),
+            key=lambda key: (key[0], key[1] or "")
+        )
+        aggregates = []
+        for key in done:
+            count, total, low, high = self._open.pop(key)
+            aggregates.append(HeartRateAggregate(
+                start=datetime.fromtimestamp(key[0] * self.width - self._offset, self.tz),
+                source=key[1],
+                count=int(count),
+                min=int(low),
+                max=int(high),
+                mean=total / count
+            ))
+        return aggregates
+
+
+def resample_heartrate(
+    samples: Iterable[Any],
+    freq: Union[str, int, timedelta] = "hour",
+    by_source: bool = True,
+    utc_offset: timedelta = timedelta(0)
+) -> Iterator[HeartRateAggregate]:
+    """Resample a heart rate stream into per-bucket count, min, max and mean.
+
+    Args:
+        samples: Chronological HeartRateSample models, raw sample dicts or
+            HeartRateColumns chunks, e.g. ``client.heartrate.stream(...)``
+        freq: Bucket size: "minute", "hour", "day", seconds or a timedelta
+        by_source: Aggregate each source separately
+        utc_offset: Offset of the time zone buckets are aligned to
+
+    Yields:
+        HeartRateAggregate: One per bucket (and source), in time order
+    """
+    resampler = HeartRateResampler(freq, by_source, utc_offset)
+    for item in samples:
+        yield from resampler.add(item)
+    yield from resampler.flush()
+
+
+async def async_resample_heartrate(
+    samples: AsyncIterable[Any],
+    freq: Union[str, int, timedelta] = "hour",
+    by_source: bool = True,
+    utc_offset: timedelta = timedelta(0)
+) -> AsyncIterator[HeartRateAggregate]:
+    """Async version of resample_heartrate, for AsyncOuraClient streams.
+
+    Args:
+        samples: Async iterable of samples or HeartRateColumns chunks
+        freq: Bucket size: "minute", "hour", "day", seconds or a timedelta
+        by_source: Aggregate each source separately
+        utc_offset: Offset of the time zone buckets are aligned to
+
+    Yields:
+        HeartRateAggregate: One per bucket (and source), in time order
+    """
+    resampler = HeartRateResampler(freq, by_source, utc_offset)
+    async for item in samples:
+        for aggregate in resampler.add(item):
+            yield aggregate
+    for aggregate in resampler.flush():
+        yield aggregate
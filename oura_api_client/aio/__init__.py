@@ -0,0 +1,5 @@
+"""Asynchronous (asyncio) client for the Oura API."""
+
+from .client import AsyncOuraClient
+
+__all__ = ["AsyncOuraClient"]
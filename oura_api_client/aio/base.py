@@ -0,0 +1,24 @@
+"""Base class for asynchronous endpoint routers."""
+from ..models.frames import async_iter_document_batches
+from ..models.lazy import async_filtered_fetch
+from ..router import RouterMixin
+from ..utils.bulk import async_fetch_many
+from ..utils.pagination import AsyncResumableStream, async_stream_paginated_data
+from ..utils.sharding import async_stream_sharded_data
+
+
+class AsyncBaseRouter(RouterMixin):
+    """Router of an AsyncOuraClient.
+
+    Shares parsing, validation and stream dispatch with BaseRouter through
+    RouterMixin; only the pagination, sharding, bulk lookup and batching
+    helpers are the async variants. ``stream()`` and ``stream_batches()``
+    return async iterators, and ``get_many()`` returns an awaitable.
+    """
+
+    _paginate = staticmethod(async_stream_paginated_data)
+    _shard = staticmethod(async_stream_sharded_data)
+    _resumable = AsyncResumableStream
+    _fetch_many = staticmethod(async_fetch_many)
+    _filter_fetch = staticmethod(async_filtered_fetch)
+    _batches = staticmethod(async_iter_document_batches)
@@ -0,0 +1,349 @@
+"""Asynchronous Oura API client implementation."""
+
+from datetime import date
+from typing import Optional, Dict, Any, Iterable, Union, AsyncIterator
+
+from ..api.client import OuraClient
+from ..models.adapters import check_model_backend
+from ..snapshot import Snapshot, async_take_snapshot
+from ..summary import DAILY_SUMMARY_COLLECTIONS, DailySummary, async_merge_daily_documents
+from ..transports import AsyncTransport, AsyncHttpxTransport, TransportError
+from ..utils import (
+    RetryConfig,
+    RateLimiter,
+    ResponseCache,
+    JSONDecoder,
+    get_json_decoder,
+    async_retry_with_backoff
+)
+
+from .heartrate import AsyncHeartRateEndpoints
+from .personal import AsyncPersonalEndpoints
+from .daily_activity import AsyncDailyActivity
+from .daily_sleep import AsyncDailySleep
+from .daily_readiness import AsyncDailyReadiness
+from .sleep import AsyncSleep
+from .session import AsyncSession
+from .tag import AsyncTag
+from .workout import AsyncWorkout
+from .enhanced_tag import AsyncEnhancedTag
+from .daily_spo2 import AsyncDailySpo2
+from .sleep_time import AsyncSleepTime
+from .rest_mode_period import AsyncRestModePeriod
+from .ring_configuration import AsyncRingConfiguration
+from .daily_stress import AsyncDailyStress
+from .daily_resilience import AsyncDailyResilience
+from .daily_cardiovascular_age import AsyncDailyCardiovascularAge
+from .vo2_max import AsyncVo2Max
+from .webhook import AsyncWebhook
+
+
+class AsyncOuraClient:
+    """Asynchronous client for interacting with the Oura API v2.
+
+    Mirrors OuraClient, but every endpoint method is a coroutine and every
+    ``stream()`` returns an async iterator, so many requests can be in
+    flight on a single event loop. The default transport requires the
+    optional ``httpx`` package.
+    """
+
+    BASE_URL = OuraClient.BASE_URL
+
+    def __init__(
+        self,
+        access_token: str,
+        retry_config: Optional[RetryConfig] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        http_client: Optional[Any] = None,
+        transport: Optional[AsyncTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        json_decoder: Union[str, JSONDecoder] = "auto",
+        model_backend: str = "pydantic"
+    ):
+        """Initialize the async Oura client with an access token.
+
+        Args:
+            access_token (str): Your Oura API personal access token
+            retry_config (RetryConfig, optional): Configuration for retry behavior
+            client_id (str, optional): Client ID for webhook operations
+            client_secret (str, optional): Client secret for webhook operations
+            pool_maxsize (int): Maximum number of pooled connections
+            keep_alive (bool): Whether to reuse connections between requests
+            http_client (httpx.AsyncClient, optional): Pre-configured client to use
+                instead of creating one (pool settings are then ignored); aclose()
+                leaves it open
+            transport (AsyncTransport, optional): HTTP transport to send requests with
+                (defaults to an AsyncHttpxTransport)
+            rate_limiter (RateLimiter, optional): Token bucket every request passes
+                through (defaults to Oura's budget of 5000 requests per 5 minutes)
+            cache (ResponseCache, optional): Persistent cache for GET responses
+            json_decoder (str or callable): JSON decoder for response bodies:
+                "orjson", "msgspec", "json" (stdlib), "auto" (fastest installed)
+                or a callable taking the body bytes
+            model_backend (str): "pydantic" (default) to return pydantic models,
+                or "struct" to return the faster, lighter msgspec Structs
+                generated from the OpenAPI spec (requires msgspec)
+
+        Raises:
+            ImportError: If httpx is not installed and no transport is given
+        """
+        self.access_token = access_token
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        self.retry_config = retry_config or RetryConfig()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.json_decoder = get_json_decoder(json_decoder)
+        self.model_backend = check_model_backend(model_backend)
+        self.transport = transport or AsyncHttpxTransport(
+            http_client,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive
+        )
+        # The httpx client, when the transport is httpx based
+        self.http_client = getattr(self.transport, "client", None)
+
+        # Initialize endpoint modules
+        self.heartrate = AsyncHeartRateEndpoints(self)
+        self.personal = AsyncPersonalEndpoints(self)
+        self.daily_activity = AsyncDailyActivity(self)
+        self.daily_sleep = AsyncDailySleep(self)
+        self.daily_readiness = AsyncDailyReadiness(self)
+        self.sleep = AsyncSleep(self)
+        self.session = AsyncSession(self)
+        self.tag = AsyncTag(self)
+        self.workout = AsyncWorkout(self)
+        self.enhanced_tag = AsyncEnhancedTag(self)
+        self.daily_spo2 = AsyncDailySpo2(self)
+        self.sleep_time = AsyncSleepTime(self)
+        self.rest_mode_period = AsyncRestModePeriod(self)
+        self.ring_configuration = AsyncRingConfiguration(self)
+        self.daily_stress = AsyncDailyStress(self)
+        self.daily_resilience = AsyncDailyResilience(self)
+        self.daily_cardiovascular_age = AsyncDailyCardiovascularAge(self)
+        self.vo2_max = AsyncVo2Max(self)
+        self.webhook = AsyncWebhook(self)
+
+    async def aclose(self) -> None:
+        """Close the transport and release pooled connections."""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncOuraClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def daily_summary(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 1,
+        return_model: bool = True
+    ) -> AsyncIterator[DailySummary]:
+        """Stream the daily collections concurrently, joined into one row per day.
+
+        Async counterpart of OuraClient.daily_summary.
+
+        Args:
+            start_date: Start date for the period
+            end_date: End date for the period
+            prefetch: Pages each collection fetches ahead in the background
+            return_model: Join validated models (True) or raw dicts (False)
+
+        Returns:
+            AsyncIterator[DailySummary]: One row per day, in day order
+
+        Example:
+            >>> async for row in client.daily_summary("2024-01-01", "2024-03-31"):
+            ...     print(row.day, row.sleep and row.sleep.score)
+        """
+        return async_merge_daily_documents({
+            field: getattr(self, collection).stream(
+                start_date=start_date, end_date=end_date, prefetch=prefetch, return_model=return_model
+            )
+            for collection, field in DAILY_SUMMARY_COLLECTIONS.items()
+        })
+
+    async def snapshot(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        collections: Optional[Iterable[str]] = None,
+        return_model: bool = True
+    ) -> Snapshot:
+        """Fetch every date-ranged collection concurrently.
+
+        Async counterpart of OuraClient.snapshot; each collection is
+        streamed by its own task.
+
+        Args:
+            start_date: Start date for the period
+            end_date: End date for the period
+            collections: Collections to fetch (defaults to SNAPSHOT_COLLECTIONS)
+            return_model: Fetch validated models (True) or raw dicts (False)
+
+        Returns:
+            Snapshot: Documents per collection, with per-collection timings
+            and errors
+
+        Example:
+            >>> snap = await client.snapshot("2024-03-01", "2024-03-07")
+            >>> print(len(snap.sleep), snap.errors)
+        """
+        return await async_take_snapshot(self, start_date, end_date, collections, return_model)
+
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        timeout: Optional[float] = 30.0,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Make a request to the Oura API.
+
+        Args:
+            endpoint (str): The API endpoint to call (should start with /)
+            params (dict, optional): Query parameters for the request
+            method (str): HTTP method to use (default: GET)
+            timeout (float, optional): Request timeout in seconds
+            json_data (dict, optional): JSON data for request body (POST/PUT/PATCH)
+            headers (dict, optional): Additional headers to merge with default headers
+            decode (bool): Decode the JSON body (True) or return the raw body
+                bytes so it can be validated straight into a model (False)
+
+        Returns:
+            dict: The JSON response from the API, or bytes: its raw body
+
+        Raises:
+            OuraAPIError: If the API request fails with specific error details
+        """
+        endpoint = OuraClient._normalize_endpoint(endpoint)
+        url = f"{self.BASE_URL}{endpoint}"
+
+        use_cache = self.cache is not None and method.upper() == "GET"
+        if use_cache:
+            namespace = OuraClient._cache_namespace(self.headers, headers)
+            cached = await self.cache.async_get(endpoint, params, namespace=namespace)
+            if cached is not None:
+                return self.json_decoder(cached) if decode else cached
+
+        # Wrap the actual request in retry logic if enabled
+        if self.retry_config.enabled:
+            response = await self._make_request_with_retry(
+                url, method, params, timeout, endpoint, json_data, headers, decode
+            )
+        else:
+            response = await self._make_single_request(
+                url, method, params, timeout, endpoint, json_data, headers, decode
+            )
+
+        if use_cache:
+            await self.cache.async_set(endpoint, params, response, namespace=namespace)
+        return response
+
+    async def _make_single_request(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Make a single HTTP request without retry logic.
+
+        Args:
+            url: Full URL to request
+            method: HTTP method
+            params: Query parameters
+            timeout: Request timeout
+            endpoint: Original endpoint for error context
+            json_data: JSON data for request body
+            headers: Additional headers to merge with default headers
+            decode: Decode the JSON body (True) or return the raw body bytes
+
+        Returns:
+            dict: The JSON response from the API, or bytes: its raw body
+
+        Raises:
+            OuraAPIError: If the request fails
+        """
+        method_upper = method.upper()
+        if method_upper not in OuraClient.SUPPORTED_METHODS:
+            raise ValueError(f"HTTP method {method} is not supported")
+
+        # Merge headers with default client headers
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        await self.rate_limiter.async_acquire()
+        try:
+            response = await self.transport.request(
+                method_upper,
+                url,
+                request_headers,
+                params=params,
+                json_data=json_data if method_upper in OuraClient.BODY_METHODS else None,
+                timeout=timeout,
+            )
+        except TransportError as e:
+            raise OuraClient._translate_transport_error(e, endpoint, timeout) from e
+
+        return OuraClient._decode_response(response, endpoint, decode, self.json_decoder)
+
+    async def _make_request_with_retry(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
+        """Make HTTP request with retry logic and non-blocking backoff.
+
+        Args:
+            url: Full URL to request
+            method: HTTP method
+            params: Query parameters
+            timeout: Request timeout
+            endpoint: Original endpoint for error context
+            json_data: JSON data for request body
+            headers: Additional headers to merge with default headers
+            decode: Decode the JSON body (True) or return the raw body bytes
+
+        Returns:
+            dict: The JSON response from the API, or bytes: its raw body
+
+        Raises:
+            OuraAPIError: If all retries fail
+        """
+        @async_retry_with_backoff(
+            max_retries=self.retry_config.max_retries,
+            base_delay=self.retry_config.base_delay,
+            max_delay=self.retry_config.max_delay,
+            jitter=self.retry_config.jitter
+        )
+        async def make_request():
+            return await self._make_single_request(
+                url, method, params, timeout, endpoint, json_data, headers, decode
+            )
+
+        return await make_request()
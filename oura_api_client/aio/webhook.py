@@ -0,0 +1,132 @@
+from typing import Optional, List
+from oura_api_client.aio.base import AsyncBaseRouter
+from oura_api_client.api.webhook import Webhook
+from oura_api_client.models.webhook import (
+    WebhookSubscriptionModel,
+    WebhookSubscriptionCreateRequest,
+    WebhookSubscriptionUpdateRequest,
+    WebhookOperation,
+    ExtApiV2DataType
+)
+
+
+class AsyncWebhook(AsyncBaseRouter):
+    # Header construction only depends on client credentials, so it is
+    # shared with the synchronous router.
+    _get_webhook_headers = Webhook._get_webhook_headers
+
+    async def list_webhook_subscriptions(self) -> List[WebhookSubscriptionModel]:
+        """
+        List all existing webhook subscriptions.
+        API Path: GET /v2/webhook/subscription
+        """
+        headers = self._get_webhook_headers()
+        response_data = await self.client._make_request(
+            "/webhook/subscription",
+            headers=headers
+        )
+        # API returns a list of subscriptions directly
+        return [WebhookSubscriptionModel(**item) for item in response_data]
+
+    async def create_webhook_subscription(
+        self,
+        callback_url: str,
+        event_type: WebhookOperation,
+        data_type: ExtApiV2DataType,
+        verification_token: str,
+    ) -> WebhookSubscriptionModel:
+        """
+        Create a new webhook subscription.
+        API Path: POST /v2/webhook/subscription
+        """
+        headers = self._get_webhook_headers()
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        request_body = WebhookSubscriptionCreateRequest(
+            callback_url=callback_url,
+            event_type=event_type,
+            data_type=data_type,
+            verification_token=verification_token,
+        )
+        response_data = await self.client._make_request(
+            "/webhook/subscription",
+            method="POST",
+            json_data=request_body.model_dump(by_alias=True),
+            headers=headers
+        )
+        return WebhookSubscriptionModel(**response_data)
+
+    async def get_webhook_subscription(
+        self, subscription_id: str
+    ) -> WebhookSubscriptionModel:
+        """
+        Get details for a specific webhook subscription.
+        API Path: GET /v2/webhook/subscription/{subscription_id}
+        """
+        headers = self._get_webhook_headers()
+        response_data = await self.client._make_request(
+            f"/webhook/subscription/{subscription_id}",
+            headers=headers
+        )
+        return WebhookSubscriptionModel(**response_data)
+
+    async def update_webhook_subscription(
+        self,
+        subscription_id: str,
+        verification_token: str,
+        callback_url: Optional[str] = None,
+        event_type: Optional[WebhookOperation] = None,
+        data_type: Optional[ExtApiV2DataType] = None,
+    ) -> WebhookSubscriptionModel:
+        """
+        Update an existing webhook subscription.
+        API Path: PUT /v2/webhook/subscription/{subscription_id}
+        """
+        headers = self._get_webhook_headers()
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        request_body = WebhookSubscriptionUpdateRequest(
+            verification_token=verification_token,
+            callback_url=callback_url,
+            event_type=event_type,
+            data_type=data_type,
+        )
+        response_data = await self.client._make_request(
+            f"/webhook/subscription/{subscription_id}",
+            method="PUT",
+            json_data=request_body.model_dump(
+                by_alias=True, exclude_none=True
+            ),
+            headers=headers
+        )
+        return WebhookSubscriptionModel(**response_data)
+
+    async def delete_webhook_subscription(self, subscription_id: str) -> None:
+        """
+        Delete a webhook subscription.
+        API Path: DELETE /v2/webhook/subscription/{subscription_id}
+        """
+        headers = self._get_webhook_headers()
+        await self.client._make_request(
+            f"/webhook/subscription/{subscription_id}",
+            method="DELETE",
+            headers=headers
+        )
+        return None
+
+    async def renew_webhook_subscription(
+        self, subscription_id: str
+    ) -> WebhookSubscriptionModel:
+        """
+        Renew an existing webhook subscription.
+        API Path: PUT /v2/webhook/subscription/renew/{subscription_id}
+        """
+        headers = self._get_webhook_headers()
+        response_data = await self.client._make_request(
+            f"/webhook/subscription/renew/{subscription_id}",
+            method="PUT",
+            headers=headers
+        )
+        return WebhookSubscriptionModel(**response_data)
@@ -1,36 +1,18 @@
-from typing import Iterator, Callable, TypeVar, Any, Optional, Union
-from datetime import date
-from ..utils.pagination import stream_paginated_data
+"""Base class for synchronous endpoint routers."""
+from ..models.frames import iter_document_batches
+from ..models.lazy import filtered_fetch
+from ..router import RouterMixin
+from ..utils.bulk import fetch_many
+from ..utils.pagination import ResumableStream, stream_paginated_data
+from ..utils.sharding import stream_sharded_data
 
-T = TypeVar('T')
 
+class BaseRouter(RouterMixin):
+    """Router of a synchronous OuraClient; see RouterMixin for the shared logic."""
 
-class BaseRouter:
-    def __init__(self, client):
-        self.client = client
-    
-    def _stream_documents(
-        self,
-        fetch_function: Callable[..., Any],
-        start_date: Optional[Union[str, date]] = None,
-        end_date: Optional[Union[str, date]] = None,
-        **kwargs: Any
-    ) -> Iterator[T]:
-        """
-        Stream all documents from a paginated endpoint.
-
-        Args:
-            fetch_function: The endpoint method to call for fetching documents
-            start_date: Optional start date for filtering
-            end_date: Optional end date for filtering
-            **kwargs: Additional parameters to pass to the fetch function
-
-        Yields:
-            Individual document items from the API response
-        """
-        return stream_paginated_data(
-            fetch_function,
-            start_date=start_date,
-            end_date=end_date,
-            **kwargs
-        )
+    _paginate = staticmethod(stream_paginated_data)
+    _shard = staticmethod(stream_sharded_data)
+    _resumable = ResumableStream
+    _fetch_many = staticmethod(fetch_many)
+    _filter_fetch = staticmethod(filtered_fetch)
+    _batches = staticmethod(iter_document_batches)
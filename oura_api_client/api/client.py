@@ -1,10 +1,28 @@
 """Oura API client implementation."""
 
 import requests
-from typing import Optional, Dict, Any
+from datetime import date
+from typing import Optional, Dict, Any, Iterable, Union, Iterator
 
-from ..exceptions import create_api_error, OuraConnectionError, OuraTimeoutError
-from ..utils import RetryConfig, retry_with_backoff
+from ..exceptions import create_api_error, OuraAPIError, OuraConnectionError, OuraTimeoutError
+from ..models.adapters import check_model_backend
+from ..snapshot import Snapshot, take_snapshot
+from ..summary import DAILY_SUMMARY_COLLECTIONS, DailySummary, merge_daily_documents
+from ..transports import (
+    Transport,
+    RequestsTransport,
+    TransportError,
+    TransportTimeoutError,
+    TransportConnectionError
+)
+from ..utils import (
+    RetryConfig,
+    RateLimiter,
+    ResponseCache,
+    JSONDecoder,
+    get_json_decoder,
+    retry_with_backoff
+)
 
 from .heartrate import HeartRateEndpoints
 from .personal import PersonalEndpoints
@@ -31,13 +49,24 @@ class OuraClient:
     """Client for interacting with the Oura API v2."""
 
     BASE_URL = "https://api.ouraring.com/v2"
+    SUPPORTED_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+    BODY_METHODS = ("POST", "PUT", "PATCH")
 
     def __init__(
         self, 
         access_token: str, 
         retry_config: Optional[RetryConfig] = None,
         client_id: Optional[str] = None,
-        client_secret: Optional[str] = None
+        client_secret: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        http_session: Optional[requests.Session] = None,
+        transport: Optional[Transport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        json_decoder: Union[str, JSONDecoder] = "auto",
+        model_backend: str = "pydantic"
     ):
         """Initialize the Oura client with an access token.
 
@@ -46,6 +75,23 @@ class OuraClient:
             retry_config (RetryConfig, optional): Configuration for retry behavior
             client_id (str, optional): Client ID for webhook operations
             client_secret (str, optional): Client secret for webhook operations
+            pool_connections (int): Number of per-host connection pools to cache
+            pool_maxsize (int): Maximum number of pooled connections per host
+            keep_alive (bool): Whether to reuse connections between requests
+            http_session (requests.Session, optional): Pre-configured session to use
+                instead of creating one (pool settings are then ignored); close()
+                leaves it open
+            transport (Transport, optional): HTTP transport to send requests with
+                (defaults to a RequestsTransport over the pooled session)
+            rate_limiter (RateLimiter, optional): Token bucket every request passes
+                through (defaults to Oura's budget of 5000 requests per 5 minutes)
+            cache (ResponseCache, optional): Persistent cache for GET responses
+            json_decoder (str or callable): JSON decoder for response bodies:
+                "orjson", "msgspec", "json" (stdlib), "auto" (fastest installed)
+                or a callable taking the body bytes
+            model_backend (str): "pydantic" (default) to return pydantic models,
+                or "struct" to return the faster, lighter msgspec Structs
+                generated from the OpenAPI spec (requires msgspec)
         """
         self.access_token = access_token
         self.client_id = client_id
@@ -55,6 +101,18 @@ class OuraClient:
             "Content-Type": "application/json",
         }
         self.retry_config = retry_config or RetryConfig()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.json_decoder = get_json_decoder(json_decoder)
+        self.model_backend = check_model_backend(model_backend)
+        self.transport = transport or RequestsTransport(
+            http_session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive
+        )
+        # The pooled requests session, when the transport is requests based
+        self.http_session = getattr(self.transport, "session", None)
 
         # Initialize endpoint modules
         self.heartrate = HeartRateEndpoints(self)
@@ -77,6 +135,89 @@ class OuraClient:
         self.vo2_max = Vo2Max(self)
         self.webhook = Webhook(self)
 
+    def close(self) -> None:
+        """Close the transport and release pooled connections."""
+        self.transport.close()
+
+    def __enter__(self) -> "OuraClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def daily_summary(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 1,
+        return_model: bool = True
+    ) -> Iterator[DailySummary]:
+        """Stream the daily collections concurrently, joined into one row per day.
+
+        Streams daily_sleep, daily_readiness, daily_activity, daily_stress,
+        daily_spo2, daily_resilience and daily_cardiovascular_age side by
+        side, each prefetching pages on its own background thread, and
+        merge-joins them on ``day``. Only the current document of each
+        collection (plus its prefetched pages) is held in memory. Days a
+        collection has no document for leave its field as None.
+
+        Args:
+            start_date: Start date for the period
+            end_date: End date for the period
+            prefetch: Pages each collection fetches ahead in the background
+            return_model: Join validated models (True) or raw dicts (False)
+
+        Returns:
+            Iterator[DailySummary]: One row per day, in day order
+
+        Example:
+            >>> for row in client.daily_summary("2024-01-01", "2024-03-31"):
+            ...     print(row.day, row.sleep and row.sleep.score, row.readiness and row.readiness.score)
+        """
+        return merge_daily_documents({
+            field: getattr(self, collection).stream(
+                start_date=start_date, end_date=end_date, prefetch=prefetch, return_model=return_model
+            )
+            for collection, field in DAILY_SUMMARY_COLLECTIONS.items()
+        })
+
+    def snapshot(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        collections: Optional[Iterable[str]] = None,
+        return_model: bool = True
+    ) -> Snapshot:
+        """Fetch every date-ranged collection concurrently.
+
+        Streams all the collections in SNAPSHOT_COLLECTIONS (every
+        usercollection except ring_configuration) over the same range, each
+        on its own thread, so the whole snapshot takes about as long as the
+        slowest collection rather than the sum of all of them. A collection
+        that fails does not abort the others: its field is left empty and
+        its error is kept in ``errors``.
+
+        Args:
+            start_date: Start date for the period
+            end_date: End date for the period
+            collections: Collections to fetch (defaults to SNAPSHOT_COLLECTIONS)
+            return_model: Fetch validated models (True) or raw dicts (False)
+
+        Returns:
+            Snapshot: Documents per collection, with per-collection timings
+            and errors
+
+        Raises:
+            ValueError: If a collection is unknown
+
+        Example:
+            >>> snap = client.snapshot("2024-03-01", "2024-03-07")
+            >>> for night in snap.daily_sleep:
+            ...     print(night.day, night.score)
+            >>> print(snap.timings, snap.errors)
+        """
+        return take_snapshot(self, start_date, end_date, collections, return_model)
+
     def _make_request(
         self,
         endpoint: str,
@@ -85,7 +226,8 @@ class OuraClient:
         timeout: Optional[float] = 30.0,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
         """Make a request to the Oura API.
 
         Args:
@@ -95,13 +237,55 @@ class OuraClient:
             timeout (float, optional): Request timeout in seconds
             json_data (dict, optional): JSON data for request body (POST/PUT/PATCH)
             headers (dict, optional): Additional headers to merge with default headers
+            decode (bool): Decode the JSON body (True) or return the raw body
+                bytes so it can be validated straight into a model (False)
 
         Returns:
-            dict: The JSON response from the API
+            dict: The JSON response from the API, or bytes: its raw body
 
         Raises:
             OuraAPIError: If the API request fails with specific error details
         """
+        endpoint = self._normalize_endpoint(endpoint)
+        url = f"{self.BASE_URL}{endpoint}"
+
+        use_cache = self.cache is not None and method.upper() == "GET"
+        if use_cache:
+            namespace = self._cache_namespace(self.headers, headers)
+            cached = self.cache.get(endpoint, params, namespace=namespace)
+            if cached is not None:
+                return self.json_decoder(cached) if decode else cached
+
+        # Wrap the actual request in retry logic if enabled
+        if self.retry_config.enabled:
+            response = self._make_request_with_retry(
+                url, method, params, timeout, endpoint, json_data, headers, decode
+            )
+        else:
+            response = self._make_single_request(
+                url, method, params, timeout, endpoint, json_data, headers, decode
+            )
+
+        if use_cache:
+            self.cache.set(endpoint, params, response, namespace=namespace)
+        return response
+
+    @staticmethod
+    def _cache_namespace(default_headers: Dict[str, str], headers: Optional[Dict[str, str]] = None) -> str:
+        """Return the cache namespace of a request, derived from its Authorization header."""
+        merged = {**default_headers, **(headers or {})}
+        return ResponseCache.namespace_for(merged.get("Authorization", ""))
+
+    @staticmethod
+    def _normalize_endpoint(endpoint: str) -> str:
+        """Normalize an endpoint path relative to BASE_URL.
+
+        Args:
+            endpoint (str): The API endpoint, with or without leading / or /v2
+
+        Returns:
+            str: The endpoint starting with a single / and without /v2 prefix
+        """
         # Ensure endpoint starts with /
         if not endpoint.startswith('/'):
             endpoint = f"/{endpoint}"
@@ -110,13 +294,7 @@ class OuraClient:
         if endpoint.startswith('/v2/'):
             endpoint = endpoint[3:]  # Remove '/v2' prefix
         
-        url = f"{self.BASE_URL}{endpoint}"
-
-        # Wrap the actual request in retry logic if enabled
-        if self.retry_config.enabled:
-            return self._make_request_with_retry(url, method, params, timeout, endpoint, json_data, headers)
-        else:
-            return self._make_single_request(url, method, params, timeout, endpoint, json_data, headers)
+        return endpoint
 
     def _make_single_request(
         self,
@@ -127,7 +305,8 @@ class OuraClient:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
         """Make a single HTTP request without retry logic.
         
         Args:
@@ -138,58 +317,99 @@ class OuraClient:
             endpoint: Original endpoint for error context
             json_data: JSON data for request body
             headers: Additional headers to merge with default headers
+            decode: Decode the JSON body (True) or return the raw body bytes
             
         Returns:
-            dict: The JSON response from the API
+            dict: The JSON response from the API, or bytes: its raw body
             
         Raises:
             OuraAPIError: If the request fails
         """
+        method_upper = method.upper()
+        if method_upper not in self.SUPPORTED_METHODS:
+            raise ValueError(f"HTTP method {method} is not supported")
+
+        # Merge headers with default client headers
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        self.rate_limiter.acquire()
         try:
-            # Merge headers with default client headers
-            request_headers = self.headers.copy()
-            if headers:
-                request_headers.update(headers)
-
-            method_upper = method.upper()
-            if method_upper == "GET":
-                response = requests.get(url, headers=request_headers, params=params, timeout=timeout)
-            elif method_upper == "POST":
-                if json_data is not None:
-                    response = requests.post(url, headers=request_headers, params=params, json=json_data, timeout=timeout)
-                else:
-                    response = requests.post(url, headers=request_headers, params=params, timeout=timeout)
-            elif method_upper == "PUT":
-                if json_data is not None:
-                    response = requests.put(url, headers=request_headers, params=params, json=json_data, timeout=timeout)
-                else:
-                    response = requests.put(url, headers=request_headers, params=params, timeout=timeout)
-            elif method_upper == "PATCH":
-                if json_data is not None:
-                    response = requests.patch(url, headers=request_headers, params=params, json=json_data, timeout=timeout)
-                else:
-                    response = requests.patch(url, headers=request_headers, params=params, timeout=timeout)
-            elif method_upper == "DELETE":
-                response = requests.delete(url, headers=request_headers, params=params, timeout=timeout)
-            else:
-                raise ValueError(f"HTTP method {method} is not supported")
-
-            # Check for HTTP errors
-            if not response.ok:
-                raise create_api_error(response, endpoint)
-
-            # Handle empty responses (e.g., for DELETE requests)
-            if response.status_code == 204 or not response.content.strip():
-                return {}
-            
-            return response.json()
+            response = self.transport.request(
+                method_upper,
+                url,
+                request_headers,
+                params=params,
+                json_data=json_data if method_upper in self.BODY_METHODS else None,
+                timeout=timeout,
+            )
+        except TransportError as e:
+            raise self._translate_transport_error(e, endpoint, timeout) from e
+
+        return self._decode_response(response, endpoint, decode, self.json_decoder)
+
+    @staticmethod
+    def _translate_transport_error(
+        error: TransportError, endpoint: str, timeout: Optional[float]
+    ) -> OuraAPIError:
+        """Map a transport failure onto the OuraAPIError hierarchy.
+
+        Args:
+            error: The error raised by the transport
+            endpoint: Original endpoint for error context
+            timeout: Request timeout that was in effect
+
+        Returns:
+            OuraAPIError: The exception to raise
+        """
+        if isinstance(error, TransportTimeoutError):
+            return OuraTimeoutError(f"Request timed out after {timeout} seconds", endpoint=endpoint)
+        if isinstance(error, TransportConnectionError):
+            return OuraConnectionError(f"Failed to connect to API: {str(error)}", endpoint=endpoint)
+        if error.response is not None:
+            return create_api_error(error.response, endpoint, str(error))
+        return OuraAPIError(str(error), endpoint=endpoint)
+
+    @staticmethod
+    def _decode_response(
+        response: Any,
+        endpoint: str,
+        decode: bool = True,
+        json_decoder: Optional[JSONDecoder] = None
+    ) -> Union[Dict[str, Any], bytes]:
+        """Check a transport response for errors and decode its JSON body.
+
+        Args:
+            response: Response returned by the transport
+            endpoint: Original endpoint for error context
+            decode: Decode the JSON body (True) or return the raw body bytes
+            json_decoder: Decoder applied to the body bytes (defaults to
+                the response's own json())
+
+        Returns:
+            dict: The JSON response from the API, or bytes: its raw body
+
+        Raises:
+            OuraAPIError: If the response has an error status
+        """
+        # Check for HTTP errors
+        if not response.ok:
+            raise create_api_error(response, endpoint)
+
+        # Handle empty responses (e.g., for DELETE requests)
+        if response.status_code == 204 or not response.content.strip():
+            return {}
 
-        except requests.exceptions.Timeout as e:
-            raise OuraTimeoutError(f"Request timed out after {timeout} seconds", endpoint=endpoint) from e
-        except requests.exceptions.ConnectionError as e:
-            raise OuraConnectionError(f"Failed to connect to API: {str(e)}", endpoint=endpoint) from e
-        except requests.exceptions.RequestException as e:
-            raise create_api_error(getattr(e, 'response', None), endpoint, str(e)) from e
+        # Transport responses carry the body as bytes; anything else is decoded
+        # by the response itself
+        content = response.content
+        if isinstance(content, (bytes, bytearray)):
+            if not decode:
+                return bytes(content)
+            if json_decoder is not None:
+                return json_decoder(content)
+        return response.json()
 
     def _make_request_with_retry(
         self,
@@ -200,7 +420,8 @@ class OuraClient:
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
         """Make HTTP request with retry logic.
         
         Args:
@@ -211,9 +432,10 @@ class OuraClient:
             endpoint: Original endpoint for error context
             json_data: JSON data for request body
             headers: Additional headers to merge with default headers
+            decode: Decode the JSON body (True) or return the raw body bytes
             
         Returns:
-            dict: The JSON response from the API
+            dict: The JSON response from the API, or bytes: its raw body
             
         Raises:
             OuraAPIError: If all retries fail
@@ -225,6 +447,8 @@ class OuraClient:
             jitter=self.retry_config.jitter
         )
         def make_request():
-            return self._make_single_request(url, method, params, timeout, endpoint, json_data, headers)
+            return self._make_single_request(
+                url, method, params, timeout, endpoint, json_data, headers, decode
+            )
         
         return make_request()
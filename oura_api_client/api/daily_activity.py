@@ -1,17 +1,24 @@
-from typing import Optional, Union, Iterator
+from typing import Optional, Union, Iterator, Dict, Any, Callable
 from datetime import date
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.models.daily_activity import DailyActivityResponse, DailyActivityModel
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 
 
 class DailyActivity(BaseRouter):
+    document_model = DailyActivityModel
+    document_getter = "get_daily_activity_document"
+
     def get_daily_activity_documents(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
         next_token: Optional[str] = None,
-    ) -> DailyActivityResponse:
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[DailyActivityResponse, LazyPage[DailyActivityModel], Dict[str, Any]]:
         """
         Get daily activity documents.
 
@@ -19,44 +26,78 @@ class DailyActivity(BaseRouter):
             start_date: Start date for the period.
             end_date: End date for the period.
             next_token: Token for pagination.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             DailyActivityResponse: Response containing daily activity data.
         """
         params = build_query_params(start_date, end_date, next_token)
         response = self.client._make_request(
-            "/usercollection/daily_activity", params=params
+            "/usercollection/daily_activity", params=params, decode=False
         )
-        return DailyActivityResponse(**response)
+        return self._parse(DailyActivityResponse, response, return_model, lazy)
 
     def get_daily_activity_document(
-        self, document_id: str
-    ) -> DailyActivityModel:
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[DailyActivityModel, Dict[str, Any]]:
         """
         Get a single daily activity document.
 
         Args:
             document_id: ID of the document.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             DailyActivityModel: Response containing daily activity data.
         """
         response = self.client._make_request(
-            f"/usercollection/daily_activity/{document_id}"
+            f"/usercollection/daily_activity/{document_id}", decode=False
         )
-        return DailyActivityModel(**response)
+        return self._parse(DailyActivityModel, response, return_model)
 
     def stream(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
-    ) -> Iterator[DailyActivityModel]:
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[DailyActivityModel, Dict[str, Any]]]:
         """
         Stream all daily activity documents automatically handling pagination.
         
         Args:
             start_date: Start date for the period.
             end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
             
         Yields:
             DailyActivityModel: Individual daily activity documents.
@@ -68,5 +109,12 @@ class DailyActivity(BaseRouter):
         return self._stream_documents(
             self.get_daily_activity_documents,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
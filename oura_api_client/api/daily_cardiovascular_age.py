@@ -1,7 +1,9 @@
-from typing import Optional, Union
+from typing import Optional, Union, Iterator, Dict, Any, Callable
 from datetime import date
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 from oura_api_client.models.daily_cardiovascular_age import (
     DailyCardiovascularAgeResponse,
     DailyCardiovascularAgeModel
@@ -9,12 +11,17 @@ from oura_api_client.models.daily_cardiovascular_age import (
 
 
 class DailyCardiovascularAge(BaseRouter):
+    document_model = DailyCardiovascularAgeModel
+    document_getter = "get_daily_cardiovascular_age_document"
+
     def get_daily_cardiovascular_age_documents(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
         next_token: Optional[str] = None,
-    ) -> DailyCardiovascularAgeResponse:
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[DailyCardiovascularAgeResponse, LazyPage[DailyCardiovascularAgeModel], Dict[str, Any]]:
         """
         Get daily cardiovascular age documents.
 
@@ -22,6 +29,10 @@ class DailyCardiovascularAge(BaseRouter):
             start_date: Start date for the period.
             end_date: End date for the period.
             next_token: Token for pagination.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             DailyCardiovascularAgeResponse: Response containing daily
@@ -29,24 +40,86 @@ class DailyCardiovascularAge(BaseRouter):
         """
         params = build_query_params(start_date, end_date, next_token)
         response = self.client._make_request(
-            "/usercollection/daily_cardiovascular_age", params=params
+            "/usercollection/daily_cardiovascular_age", params=params, decode=False
         )
-        return DailyCardiovascularAgeResponse(**response)
+        return self._parse(DailyCardiovascularAgeResponse, response, return_model, lazy)
 
     def get_daily_cardiovascular_age_document(
-        self, document_id: str
-    ) -> DailyCardiovascularAgeModel:
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[DailyCardiovascularAgeModel, Dict[str, Any]]:
         """
         Get a single daily cardiovascular age document.
 
         Args:
             document_id: ID of the document.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             DailyCardiovascularAgeModel: Response containing daily
                 cardiovascular age data.
         """
         response = self.client._make_request(
-            f"/usercollection/daily_cardiovascular_age/{document_id}"
+            f"/usercollection/daily_cardiovascular_age/{document_id}", decode=False
+        )
+        return self._parse(DailyCardiovascularAgeModel, response, return_model)
+
+    def stream(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[DailyCardiovascularAgeModel, Dict[str, Any]]]:
+        """
+        Stream all daily cardiovascular age documents automatically handling pagination.
+
+        Args:
+            start_date: Start date for the period.
+            end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
+
+        Yields:
+            DailyCardiovascularAgeModel: Individual daily cardiovascular age documents.
+
+        Example:
+            >>> for record in client.daily_cardiovascular_age.stream(start_date="2024-01-01"):
+            ...     print(f"Vascular age: {record.vascular_age}")
+        """
+        return self._stream_documents(
+            self.get_daily_cardiovascular_age_documents,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
-        return DailyCardiovascularAgeModel(**response)
@@ -1,7 +1,9 @@
-from typing import Optional, Union, Iterator
+from typing import Optional, Union, Iterator, Dict, Any, Callable
 from datetime import date
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 from oura_api_client.models.daily_readiness import (
     DailyReadinessResponse,
     DailyReadinessModel
@@ -9,12 +11,17 @@ from oura_api_client.models.daily_readiness import (
 
 
 class DailyReadiness(BaseRouter):
+    document_model = DailyReadinessModel
+    document_getter = "get_daily_readiness_document"
+
     def get_daily_readiness_documents(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
         next_token: Optional[str] = None,
-    ) -> DailyReadinessResponse:
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[DailyReadinessResponse, LazyPage[DailyReadinessModel], Dict[str, Any]]:
         """
         Get daily readiness documents.
 
@@ -22,44 +29,78 @@ class DailyReadiness(BaseRouter):
             start_date: Start date for the period.
             end_date: End date for the period.
             next_token: Token for pagination.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             DailyReadinessResponse: Response containing daily readiness data.
         """
         params = build_query_params(start_date, end_date, next_token)
         response = self.client._make_request(
-            "/usercollection/daily_readiness", params=params
+            "/usercollection/daily_readiness", params=params, decode=False
         )
-        return DailyReadinessResponse(**response)
+        return self._parse(DailyReadinessResponse, response, return_model, lazy)
 
     def get_daily_readiness_document(
-        self, document_id: str
-    ) -> DailyReadinessModel:
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[DailyReadinessModel, Dict[str, Any]]:
         """
         Get a single daily readiness document.
 
         Args:
             document_id: ID of the document.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             DailyReadinessModel: Response containing daily readiness data.
         """
         response = self.client._make_request(
-            f"/usercollection/daily_readiness/{document_id}"
+            f"/usercollection/daily_readiness/{document_id}", decode=False
         )
-        return DailyReadinessModel(**response)
+        return self._parse(DailyReadinessModel, response, return_model)
 
     def stream(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
-    ) -> Iterator[DailyReadinessModel]:
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[DailyReadinessModel, Dict[str, Any]]]:
         """
         Stream all daily readiness documents automatically handling pagination.
         
         Args:
             start_date: Start date for the period.
             end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
             
         Yields:
             DailyReadinessModel: Individual daily readiness documents.
@@ -71,5 +112,12 @@ class DailyReadiness(BaseRouter):
         return self._stream_documents(
             self.get_daily_readiness_documents,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
@@ -1,22 +1,29 @@
 """Heart rate endpoint implementations."""
 
-from typing import Optional, Dict, Any, Union, Iterator
-from datetime import date
+from typing import Optional, Dict, Any, Union, Iterator, Callable
+from datetime import date, timedelta
 
 from .base import BaseRouter
-from ..models.heartrate import HeartRateResponse, HeartRateSample
+from ..models.heartrate import HeartRateResponse, HeartRateSample, HeartRateColumns
+from ..models.lazy import LazyPage
+from ..utils.pagination import CheckpointCallback, StreamCursor
+from ..aggregation import HeartRateAggregate, resample_heartrate
 
 
 class HeartRateEndpoints(BaseRouter):
     """Heart rate related API endpoints."""
 
+    document_model = HeartRateSample
+
     def get_heartrate(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
         next_token: Optional[str] = None,
         return_model: bool = True,
-    ) -> Union[Dict[str, Any], HeartRateResponse]:
+        columnar: bool = False,
+        lazy: bool = False,
+    ) -> Union[Dict[str, Any], HeartRateResponse, HeartRateColumns, LazyPage[HeartRateSample]]:
         """Get heart rate data for a specified date range.
 
         Args:
@@ -24,9 +31,13 @@ class HeartRateEndpoints(BaseRouter):
             end_date: End date in YYYY-MM-DD format or date object
             next_token: Token for pagination
             return_model: Whether to return a parsed model or raw dict
+            columnar: Return HeartRateColumns (compact epoch-second, bpm and
+                source-code arrays) instead of one model per sample
+            lazy: Return a LazyPage whose samples are validated one by one
+                on first access instead of all up front
 
         Returns:
-            Union[Dict[str, Any], HeartRateResponse]: Heart rate data
+            Union[Dict[str, Any], HeartRateResponse, HeartRateColumns, LazyPage]: Heart rate data
         """
         params = {}
         if start_date:
@@ -43,28 +54,61 @@ class HeartRateEndpoints(BaseRouter):
             params["next_token"] = next_token
 
         response = self.client._make_request(
-            "/usercollection/heartrate", params=params
+            "/usercollection/heartrate", params=params, decode=False
         )
 
-        if return_model:
-            return HeartRateResponse.from_dict(response)
+        if columnar:
+            return HeartRateColumns.from_dict(self._decode(response))
 
-        return response
+        return self._parse(HeartRateResponse, response, return_model, lazy)
 
     def stream(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
-    ) -> Iterator[HeartRateSample]:
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        columnar: bool = False,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[HeartRateSample, HeartRateColumns, Dict[str, Any]]]:
         """
         Stream all Heart Rate data automatically handling pagination.
         
         Args:
             start_date: Start date for the period.
             end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            columnar: Yield one HeartRateColumns chunk per page instead of
+                individual samples (use HeartRateColumns.concat to merge
+                them). Automatic shard sizing is not available in this
+                mode: sharding without shard_days raises ValueError.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each sample only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
+                Cannot be combined with columnar.
             
         Yields:
-            HeartRateSample: Individual heart rate data points.
+            HeartRateSample: Individual heart rate data points, or
+            HeartRateColumns: One chunk per page when columnar is True.
             
         Example:
             >>> for hr_sample in client.heartrate.stream(start_date="2024-01-01"):
@@ -73,5 +117,64 @@ class HeartRateEndpoints(BaseRouter):
         return self._stream_documents(
             self.get_heartrate,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            columnar=columnar,
+            **self._parse_kwargs(return_model, lazy)
+        )
+
+    def resample(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        freq: Union[str, int, timedelta] = "hour",
+        by_source: bool = True,
+        utc_offset: timedelta = timedelta(0),
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+    ) -> Iterator[HeartRateAggregate]:
+        """
+        Stream per-bucket heart rate statistics in a single pass.
+
+        Pages are streamed in columnar form and folded into the open
+        buckets as they arrive, so memory stays constant over any range.
+
+        Args:
+            start_date: Start date for the period.
+            end_date: End date for the period.
+            freq: Bucket size: "minute", "hour", "day", a number of
+                seconds or a timedelta.
+            by_source: Aggregate each source (awake, rest, sleep, ...)
+                separately.
+            utc_offset: Offset of the time zone buckets are aligned to.
+            prefetch: Number of pages to fetch ahead in the background.
+            max_workers: Number of date shards to fetch concurrently.
+            shard_days: Days per shard when sharding (required when
+                max_workers is above 1, as for columnar streams).
+
+        Yields:
+            HeartRateAggregate: Count, min, max and mean bpm per bucket and source.
+
+        Example:
+            >>> for hourly in client.heartrate.resample("2024-01-01", "2024-03-31"):
+            ...     print(hourly.start, hourly.source, hourly.mean)
+        """
+        return resample_heartrate(
+            self.stream(
+                start_date=start_date,
+                end_date=end_date,
+                prefetch=prefetch,
+                max_workers=max_workers,
+                shard_days=shard_days,
+                columnar=True
+            ),
+            freq=freq,
+            by_source=by_source,
+            utc_offset=utc_offset
         )
@@ -1,7 +1,9 @@
-from typing import Optional, Union  # Union is not strictly needed here but kept for consistency
+from typing import Optional, Union, Iterator, Dict, Any, Callable  # Union is not strictly needed here but kept for consistency
 from datetime import date  # date is not used by ring_configuration but kept for consistency
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 from oura_api_client.models.ring_configuration import (
     RingConfigurationResponse,
     RingConfigurationModel
@@ -9,6 +11,9 @@ from oura_api_client.models.ring_configuration import (
 
 
 class RingConfiguration(BaseRouter):
+    document_model = RingConfigurationModel
+    document_getter = "get_ring_configuration_document"
+
     def get_ring_configuration_documents(
         self,
         # Ring Configuration usually doesn't have start/end_date or pagination in typical REST APIs
@@ -17,7 +22,9 @@ class RingConfiguration(BaseRouter):
         start_date: Optional[Union[str, date]] = None,  # Kept for potential future use or specific API design
         end_date: Optional[Union[str, date]] = None,   # Kept for potential future use
         next_token: Optional[str] = None,
-    ) -> RingConfigurationResponse:
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[RingConfigurationResponse, LazyPage[RingConfigurationModel], Dict[str, Any]]:
         """
         Get ring configuration documents.
         Note: Oura API v2 documentation for Ring Configuration typically implies a single
@@ -28,6 +35,10 @@ class RingConfiguration(BaseRouter):
             start_date: Start date for filtering (if supported by API).
             end_date: End date for filtering (if supported by API).
             next_token: Token for pagination (if supported by API).
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             RingConfigurationResponse: Response containing ring configuration data.
@@ -36,23 +47,86 @@ class RingConfiguration(BaseRouter):
 
         response = self.client._make_request(
             "/usercollection/ring_configuration",
-            params=params if params else None
+            params=params if params else None,
+            decode=False
         )
-        return RingConfigurationResponse(**response)
+        return self._parse(RingConfigurationResponse, response, return_model, lazy)
 
     def get_ring_configuration_document(
-        self, document_id: str
-    ) -> RingConfigurationModel:
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[RingConfigurationModel, Dict[str, Any]]:
         """
         Get a single ring configuration document.
 
         Args:
             document_id: ID of the document (specific ring's configuration ID).
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             RingConfigurationModel: Response containing ring configuration data.
         """
         response = self.client._make_request(
-            f"/usercollection/ring_configuration/{document_id}"
+            f"/usercollection/ring_configuration/{document_id}", decode=False
+        )
+        return self._parse(RingConfigurationModel, response, return_model)
+
+    def stream(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[RingConfigurationModel, Dict[str, Any]]]:
+        """
+        Stream all ring configuration documents automatically handling pagination.
+
+        Args:
+            start_date: Start date for the period.
+            end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
+
+        Yields:
+            RingConfigurationModel: Individual ring configuration documents.
+
+        Example:
+            >>> for ring in client.ring_configuration.stream(start_date="2024-01-01"):
+            ...     print(f"Firmware: {ring.firmware_version}")
+        """
+        return self._stream_documents(
+            self.get_ring_configuration_documents,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
-        return RingConfigurationModel(**response)
@@ -1,12 +1,17 @@
-from typing import Optional, Union, Iterator
+from typing import Optional, Union, Iterator, Dict, Any, Callable
 from datetime import date  # Using date for start_date and end_date
 # as per other endpoints
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.models.session import SessionResponse, SessionModel
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 
 
 class Session(BaseRouter):
+    document_model = SessionModel
+    document_getter = "get_session_document"
+
     def get_session_documents(
         self,
         start_date: Optional[Union[str, date]] = None,  # Changed from
@@ -14,7 +19,9 @@ class Session(BaseRouter):
         end_date: Optional[Union[str, date]] = None,    # Changed from
         # end_datetime for consistency
         next_token: Optional[str] = None,
-    ) -> SessionResponse:
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[SessionResponse, LazyPage[SessionModel], Dict[str, Any]]:
         """
         Get session documents.
 
@@ -22,42 +29,78 @@ class Session(BaseRouter):
             start_date: Start date for the period.
             end_date: End date for the period.
             next_token: Token for pagination.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             SessionResponse: Response containing session data.
         """
         params = build_query_params(start_date, end_date, next_token)
         response = self.client._make_request(
-            "/usercollection/session", params=params
+            "/usercollection/session", params=params, decode=False
         )
-        return SessionResponse(**response)
+        return self._parse(SessionResponse, response, return_model, lazy)
 
-    def get_session_document(self, document_id: str) -> SessionModel:
+    def get_session_document(
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[SessionModel, Dict[str, Any]]:
         """
         Get a single session document.
 
         Args:
             document_id: ID of the document.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             SessionModel: Response containing session data.
         """
         response = self.client._make_request(
-            f"/usercollection/session/{document_id}"
+            f"/usercollection/session/{document_id}", decode=False
         )
-        return SessionModel(**response)
+        return self._parse(SessionModel, response, return_model)
 
     def stream(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
-    ) -> Iterator[SessionModel]:
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[SessionModel, Dict[str, Any]]]:
         """
         Stream all session documents automatically handling pagination.
         
         Args:
             start_date: Start date for the period.
             end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
             
         Yields:
             SessionModel: Individual session documents.
@@ -69,5 +112,12 @@ class Session(BaseRouter):
         return self._stream_documents(
             self.get_session_documents,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
@@ -1,7 +1,9 @@
-from typing import Optional, Union
+from typing import Optional, Union, Iterator, Dict, Any, Callable
 from datetime import date  # Keep date for start/end_date
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 from oura_api_client.models.sleep import (
     SleepResponse,
     SleepModel  # Updated model import
@@ -9,6 +11,9 @@ from oura_api_client.models.sleep import (
 
 
 class Sleep(BaseRouter):  # Renamed class to Sleep
+    document_model = SleepModel
+    document_getter = "get_sleep_document"
+
     def get_sleep_documents(  # Renamed method
         self,
         start_date: Optional[Union[str, date]] = None,  # Changed
@@ -16,7 +21,9 @@ class Sleep(BaseRouter):  # Renamed class to Sleep
         end_date: Optional[Union[str, date]] = None,    # Changed
         # parameter name for clarity
         next_token: Optional[str] = None,
-    ) -> SleepResponse:  # Updated return type
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[SleepResponse, LazyPage[SleepModel], Dict[str, Any]]:  # Updated return type
         """
         Get sleep documents.
 
@@ -24,6 +31,10 @@ class Sleep(BaseRouter):  # Renamed class to Sleep
             start_date: Start date for the period.
             end_date: End date for the period.
             next_token: Token for pagination.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             SleepResponse: Response containing sleep data.
@@ -31,24 +42,86 @@ class Sleep(BaseRouter):  # Renamed class to Sleep
         params = build_query_params(start_date, end_date, next_token)
         # Corrected endpoint URL from daily_sleep to sleep
         response = self.client._make_request(
-            "/usercollection/sleep", params=params
+            "/usercollection/sleep", params=params, decode=False
         )
-        return SleepResponse(**response)
+        return self._parse(SleepResponse, response, return_model, lazy)
 
     def get_sleep_document(
-        self, document_id: str
-    ) -> SleepModel:  # Renamed method and updated return type
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[SleepModel, Dict[str, Any]]:  # Renamed method and updated return type
         """
         Get a single sleep document.
 
         Args:
             document_id: ID of the document.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             SleepModel: Response containing sleep data.
         """
         # Corrected endpoint URL from daily_sleep to sleep
         response = self.client._make_request(
-            f"/usercollection/sleep/{document_id}"
+            f"/usercollection/sleep/{document_id}", decode=False
+        )
+        return self._parse(SleepModel, response, return_model)
+
+    def stream(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[SleepModel, Dict[str, Any]]]:
+        """
+        Stream all sleep documents automatically handling pagination.
+
+        Args:
+            start_date: Start date for the period.
+            end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
+
+        Yields:
+            SleepModel: Individual sleep documents.
+
+        Example:
+            >>> for sleep in client.sleep.stream(start_date="2024-01-01"):
+            ...     print(f"Sleep efficiency: {sleep.efficiency}")
+        """
+        return self._stream_documents(
+            self.get_sleep_documents,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
-        return SleepModel(**response)
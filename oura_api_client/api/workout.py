@@ -1,17 +1,24 @@
-from typing import Optional, Union
+from typing import Optional, Union, Iterator, Dict, Any, Callable
 from datetime import date  # Using date for start_date and end_date
 from oura_api_client.api.base import BaseRouter
 from oura_api_client.models.workout import WorkoutResponse, WorkoutModel
 from oura_api_client.utils import build_query_params
+from oura_api_client.models.lazy import LazyPage
+from oura_api_client.utils.pagination import CheckpointCallback, StreamCursor
 
 
 class Workout(BaseRouter):
+    document_model = WorkoutModel
+    document_getter = "get_workout_document"
+
     def get_workout_documents(
         self,
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
         next_token: Optional[str] = None,
-    ) -> WorkoutResponse:
+        return_model: bool = True,
+        lazy: bool = False,
+    ) -> Union[WorkoutResponse, LazyPage[WorkoutModel], Dict[str, Any]]:
         """
         Get workout documents.
 
@@ -19,27 +26,95 @@ class Workout(BaseRouter):
             start_date: Start date for the period.
             end_date: End date for the period.
             next_token: Token for pagination.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
+            lazy: Return a LazyPage whose documents are validated one by
+                one on first access instead of all up front.
 
         Returns:
             WorkoutResponse: Response containing workout data.
         """
         params = build_query_params(start_date, end_date, next_token)
         response = self.client._make_request(
-            "/usercollection/workout", params=params
+            "/usercollection/workout", params=params, decode=False
         )
-        return WorkoutResponse(**response)
+        return self._parse(WorkoutResponse, response, return_model, lazy)
 
-    def get_workout_document(self, document_id: str) -> WorkoutModel:
+    def get_workout_document(
+        self,
+        document_id: str,
+        return_model: bool = True,
+    ) -> Union[WorkoutModel, Dict[str, Any]]:
         """
         Get a single workout document.
 
         Args:
             document_id: ID of the document.
+            return_model: Return a validated model (True) or the raw response
+                dict without validation (False).
 
         Returns:
             WorkoutModel: Response containing workout data.
         """
         response = self.client._make_request(
-            f"/usercollection/workout/{document_id}"
+            f"/usercollection/workout/{document_id}", decode=False
+        )
+        return self._parse(WorkoutModel, response, return_model)
+
+    def stream(
+        self,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        return_model: bool = True,
+        lazy: bool = False,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[Union[WorkoutModel, Dict[str, Any]]]:
+        """
+        Stream all workout documents automatically handling pagination.
+
+        Args:
+            start_date: Start date for the period.
+            end_date: End date for the period.
+            prefetch: Number of pages to fetch ahead in the background
+                while the current one is consumed (0 disables prefetching).
+            max_workers: Number of date shards to fetch concurrently. Values
+                above 1 split the range (start_date and end_date required)
+                into shards whose pagination chains are fetched in parallel.
+            shard_days: Days per shard when sharding, or None to size shards
+                automatically from the density of the first page.
+            return_model: Yield validated models (True) or raw dicts without
+                validation (False).
+            lazy: Validate each document only when it is reached, so
+                consumers that stop early skip validating the rest of a page.
+            cursor: Position to resume an interrupted stream from, as
+                passed to a previous stream's checkpoint callback.
+            checkpoint: Called with the stream's StreamCursor after each
+                fully consumed page; the returned ResumableStream also
+                exposes it as ``cursor``.
+            where: Predicate on each raw document dict, run before
+                validation; only matching documents are validated and yielded.
+
+        Yields:
+            WorkoutModel: Individual workout documents.
+
+        Example:
+            >>> for workout in client.workout.stream(start_date="2024-01-01"):
+            ...     print(f"Workout: {workout.activity} on {workout.day}")
+        """
+        return self._stream_documents(
+            self.get_workout_documents,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+            max_workers=max_workers,
+            shard_days=shard_days,
+            cursor=cursor,
+            checkpoint=checkpoint,
+            where=where,
+            **self._parse_kwargs(return_model, lazy)
         )
-        return WorkoutModel(**response)
@@ -0,0 +1,131 @@
+"""Registry of prebuilt parsers used to turn API responses into models.
+
+Responses are parsed into pydantic models by default. The optional
+``struct`` backend parses them into the msgspec Structs generated in
+``models/structs.py`` instead.
+"""
+
+import threading
+from typing import Any, Dict, Type, TypeVar, Union
+
+from pydantic import TypeAdapter
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+T = TypeVar("T")
+
+MODEL_BACKENDS = ("pydantic", "struct")
+
+_ADAPTERS: Dict[Any, TypeAdapter] = {}
+_STRUCT_DECODERS: Dict[str, Any] = {}
+_LOCK = threading.Lock()
+
+
+def get_adapter(model_type: Type[T]) -> "TypeAdapter[T]":
+    """Return the shared TypeAdapter for a response type, building it once.
+
+    Args:
+        model_type: Model class or type expression (e.g. ``List[Model]``)
+
+    Returns:
+        The TypeAdapter registered for ``model_type``
+    """
+    adapter = _ADAPTERS.get(model_type)
+    if adapter is None:
+        with _LOCK:
+            adapter = _ADAPTERS.get(model_type)
+            if adapter is None:
+                adapter = _ADAPTERS[model_type] = TypeAdapter(model_type)
+    return adapter
+
+
+def parse_model(model_type: Type[T], body: Union[bytes, str, Dict[str, Any]]) -> T:
+    """Validate a response body into its model.
+
+    Bytes and strings are validated straight from JSON with ``validate_json``,
+    so no intermediate dict is built; already decoded bodies (e.g. from a
+    cache or a test double) go through ``validate_python``.
+
+    Args:
+        model_type: Model class or type expression to validate against
+        body: Raw JSON body or decoded JSON
+
+    Returns:
+        The validated model
+
+    Raises:
+        pydantic.ValidationError: If the body does not match the model
+    """
+    adapter = get_adapter(model_type)
+    if isinstance(body, (bytes, bytearray, str)):
+        return adapter.validate_json(body)
+    return adapter.validate_python(body)
+
+
+def check_model_backend(backend: str) -> str:
+    """Validate a model backend name.
+
+    Args:
+        backend: "pydantic" or "struct"
+
+    Returns:
+        The backend name
+
+    Raises:
+        ImportError: If the struct backend is requested without msgspec
+        ValueError: If the backend name is unknown
+    """
+    if backend not in MODEL_BACKENDS:
+        raise ValueError(
+            f"Unknown model backend {backend!r}; expected one of {', '.join(MODEL_BACKENDS)}"
+        )
+    if backend == "struct" and msgspec is None:
+        raise ImportError(
+            "The 'struct' model backend requires the 'msgspec' package. "
+            "Install it with: pip install oura-api-client[msgspec]"
+        )
+    return backend
+
+
+def get_struct_decoder(model_type: Type[Any]) -> Any:
+    """Return the shared msgspec decoder for the Struct mirroring a model.
+
+    Args:
+        model_type: pydantic model class; the Struct with the same name in
+            ``models/structs.py`` is decoded
+
+    Returns:
+        A ``msgspec.json.Decoder`` for the matching Struct
+    """
+    name = model_type.__name__
+    decoder = _STRUCT_DECODERS.get(name)
+    if decoder is None:
+        from . import structs
+
+        with _LOCK:
+            decoder = _STRUCT_DECODERS.get(name)
+            if decoder is None:
+                decoder = _STRUCT_DECODERS[name] = msgspec.json.Decoder(getattr(structs, name))
+    return decoder
+
+
+def parse_struct(model_type: Type[Any], body: Union[bytes, str, Dict[str, Any]]) -> Any:
+    """Parse a response body into the msgspec Struct mirroring a model.
+
+    Args:
+        model_type: pydantic model class of the response
+        body: Raw JSON body or decoded JSON
+
+    Returns:
+        The Struct instance
+
+    Raises:
+        msgspec.ValidationError: If the body does not match the Struct
+    """
+    decoder = get_struct_decoder(model_type)
+    if isinstance(body, (bytes, bytearray, str)):
+        return decoder.decode(body)
+    return msgspec.convert(body, decoder.type)
@@ -1,12 +1,15 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date, datetime
 
+from .time_series import ACTIVITY_CLASSES, CategorySeries, SampleSeries
+from .frames import FrameExportMixin
+
 
 class MetData(BaseModel):
     """MET (Metabolic Equivalent of Task) time series data."""
     interval: float = Field(..., description="Interval between measurements in minutes")
-    items: List[float] = Field(..., description="MET values for each interval")
+    items: List[Optional[float]] = Field(..., description="MET values for each interval")
     timestamp: str = Field(..., description="Timestamp for the data")
 
 
@@ -63,7 +66,22 @@ class DailyActivityModel(BaseModel):
     day: date
     timestamp: datetime
 
+    def activity_class_series(self) -> Optional[CategorySeries]:
+        """Decode class_5_min into uint8 activity classes (see ACTIVITY_CLASSES) from timestamp."""
+        return CategorySeries.from_string(self.class_5_min, 300, self.timestamp, ACTIVITY_CLASSES)
+
+    def met_series(self) -> Optional[SampleSeries]:
+        """Decode the MET samples into a float64 array (NaN where missing)."""
+        if self.met is None:
+            return None
+        return SampleSeries.from_samples(self.met.items, self.met.interval, self.met.timestamp)
+
+    def activity_minutes(self) -> Dict[str, float]:
+        """Return the minutes spent in each activity class, counted from class_5_min."""
+        series = self.activity_class_series()
+        return series.minutes() if series is not None else {label: 0.0 for label in ACTIVITY_CLASSES}
+
 
-class DailyActivityResponse(BaseModel):
+class DailyActivityResponse(FrameExportMixin, BaseModel):
     data: List[DailyActivityModel]
     next_token: Optional[str] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class DailyCardiovascularAgeModel(BaseModel):
@@ -22,7 +23,7 @@ class DailyCardiovascularAgeModel(BaseModel):
     timestamp: datetime  # Timestamp of the summary
 
 
-class DailyCardiovascularAgeResponse(BaseModel):
+class DailyCardiovascularAgeResponse(FrameExportMixin, BaseModel):
     data: List[DailyCardiovascularAgeModel]
     next_token: Optional[str] = None  # Pagination token
     source: Optional[str] = None  # Data source
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional  # Added List
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class ReadinessContributors(BaseModel):
@@ -54,6 +55,6 @@ class DailyReadinessModel(BaseModel):
     # )  # This was in sleep, likely not here
 
 
-class DailyReadinessResponse(BaseModel):
+class DailyReadinessResponse(FrameExportMixin, BaseModel):
     data: List[DailyReadinessModel]
     next_token: Optional[str] = None
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from typing import List, Optional
 
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class ResilienceContributors(BaseModel):
@@ -31,6 +32,6 @@ class DailyResilienceModel(BaseModel):
     timestamp: datetime  # Timestamp of the summary
 
 
-class DailyResilienceResponse(BaseModel):
+class DailyResilienceResponse(FrameExportMixin, BaseModel):
     data: List[DailyResilienceModel]
     next_token: Optional[str] = None
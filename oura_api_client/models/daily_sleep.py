@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class SleepContributors(BaseModel):
@@ -47,6 +48,6 @@ class DailySleepModel(BaseModel):
     temperature_trend_deviation: Optional[float] = Field(None, alias="temperature_trend_deviation")
 
 
-class DailySleepResponse(BaseModel):
+class DailySleepResponse(FrameExportMixin, BaseModel):
     data: List[DailySleepModel]
     next_token: Optional[str] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime  # Added datetime
+from .frames import FrameExportMixin
 
 
 class DailySpO2AggregatedValuesModel(BaseModel):  # Renamed from Spo2Readings to DailySpO2AggregatedValuesModel for clarity
@@ -36,6 +37,6 @@ class DailySpO2Model(BaseModel):
     )  # Added timestamp
 
 
-class DailySpO2Response(BaseModel):
+class DailySpO2Response(FrameExportMixin, BaseModel):
     data: List[DailySpO2Model]
     next_token: Optional[str] = None
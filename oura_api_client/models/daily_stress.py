@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class DailyStressModel(BaseModel):
@@ -31,6 +32,6 @@ class DailyStressModel(BaseModel):
     )  # Summary of the day's stress
 
 
-class DailyStressResponse(BaseModel):
+class DailyStressResponse(FrameExportMixin, BaseModel):
     data: List[DailyStressModel]
     next_token: Optional[str] = None
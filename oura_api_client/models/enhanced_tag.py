@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class EnhancedTagModel(BaseModel):
@@ -26,6 +27,6 @@ class EnhancedTagModel(BaseModel):
     # If a more detailed spec is available, other fields like 'icon' or 'source' could be added.
 
 
-class EnhancedTagResponse(BaseModel):
+class EnhancedTagResponse(FrameExportMixin, BaseModel):
     data: List[EnhancedTagModel]
     next_token: Optional[str] = None
@@ -0,0 +1,351 @@
+"""Columnar export of documents to Arrow record batches and pandas frames.
+
+pyarrow (and pandas, for DataFrames) are optional dependencies. Columns
+are built one field at a time straight from the documents, with types
+derived once per model:
+
+- scores, score deltas, contributor scores and bpm are int16
+- fields the API declares as enums (sleep type, workout source, ...) are
+  dictionary-encoded, which pandas turns into categoricals
+- days are date32 and timestamps are UTC timestamps
+- sub-models such as ``contributors`` are flattened into
+  ``contributors_<field>`` columns
+
+Time series sub-models and list or dict fields are left out; use the
+models' series accessors for those.
+"""
+
+import datetime
+import enum
+import functools
+import itertools
+import typing
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, NamedTuple, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from .lazy import page_item_type
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+# Outputs accepted by stream_batches()
+FRAME_OUTPUTS = ("arrow", "pandas")
+
+# String fields declared as enums in the OpenAPI spec
+CATEGORICAL_FIELDS = frozenset({
+    "color",
+    "data_type",
+    "day_summary",
+    "design",
+    "event_type",
+    "hardware_type",
+    "intensity",
+    "level",
+    "mood",
+    "recommendation",
+    "sleep_algorithm_version",
+    "source",
+    "status",
+    "type",
+})
+
+# Integer fields whose names end with one of these are stored as int16
+INT16_SUFFIXES = ("score", "score_delta", "bpm")
+
+_SCALAR_KINDS = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    str: "string",
+    datetime.date: "date",
+    datetime.datetime: "timestamp",
+}
+
+
+class Column(NamedTuple):
+    """A column of a document model's frame."""
+
+    name: str
+    path: Tuple[str, ...]
+    kind: str
+
+
+def _field_type(annotation: Any) -> Any:
+    """Strip Optional from an annotation."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_time_series(model_type: Type[BaseModel]) -> bool:
+    """Return True for sub-models holding sample lists, such as MetData."""
+    return any(
+        typing.get_origin(_field_type(field.annotation)) in (list, List)
+        for field in model_type.model_fields.values()
+    )
+
+
+def _column_kind(name: str, field_type: Any, in_contributors: bool) -> Any:
+    """Return the column kind of a scalar field, or None if it has no column."""
+    if typing.get_origin(field_type) is typing.Literal:
+        return "category"
+    if isinstance(field_type, type) and issubclass(field_type, enum.Enum):
+        return "category"
+    kind = _SCALAR_KINDS.get(field_type)
+    if kind == "int64" and (in_contributors or name.endswith(INT16_SUFFIXES)):
+        return "int16"
+    if kind == "string" and name in CATEGORICAL_FIELDS:
+        return "category"
+    return kind
+
+
+@functools.lru_cache(maxsize=None)
+def document_columns(model_type: Type[BaseModel]) -> Tuple[Column, ...]:
+    """Return the columns of a document model, flattening sub-models.
+
+    Args:
+        model_type: Document model, e.g. DailySleepModel
+
+    Returns:
+        The model's columns, in field order
+    """
+    columns = []
+
+    def add_fields(model: Type[BaseModel], prefix: Tuple[str, ...]) -> None:
+        in_contributors = model.__name__.endswith("Contributors")
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            field_type = _field_type(field.annotation)
+            if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+                if not _is_time_series(field_type):
+                    add_fields(field_type, prefix + (key,))
+                continue
+            kind = _column_kind(name, field_type, in_contributors)
+            if kind is not None:
+                columns.append(Column("_".join(prefix + (key,)), prefix + (key,), kind))
+
+    add_fields(model_type, ())
+    return tuple(columns)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow and DataFrame export; "
+            "install it with: pip install oura-api-client[arrow]"
+        )
+
+
+def _require_pandas() -> None:
+    _require_pyarrow()
+    if pd is None:
+        raise ImportError(
+            "pandas is required for DataFrame export; "
+            "install it with: pip install oura-api-client[pandas]"
+        )
+
+
+def check_frame_output(output: str) -> str:
+    """Validate a stream_batches() output and check its dependencies.
+
+    Args:
+        output: "arrow" for RecordBatches or "pandas" for DataFrames
+
+    Returns:
+        The output name
+
+    Raises:
+        ValueError: If the output is unknown
+        ImportError: If pyarrow (or pandas) is not installed
+    """
+    if output not in FRAME_OUTPUTS:
+        raise ValueError(f"Unknown output {output!r}; expected one of {', '.join(FRAME_OUTPUTS)}")
+    if output == "pandas":
+        _require_pandas()
+    else:
+        _require_pyarrow()
+    return output
+
+
+def _arrow_type(kind: str) -> Any:
+    return {
+        "bool": pa.bool_(),
+        "int16": pa.int16(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "date": pa.date32(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }[kind]
+
+
+def arrow_schema(model_type: Type[BaseModel]) -> Any:
+    """Return the pyarrow schema of a document model's record batches."""
+    _require_pyarrow()
+    return pa.schema([(column.name, _arrow_type(column.kind)) for column in document_columns(model_type)])
+
+
+def _values(documents: Sequence[Any], path: Tuple[str, ...], raw: bool) -> List[Any]:
+    """Return one field of every document, or None where a sub-model is missing."""
+    if len(path) == 1:
+        key = path[0]
+        if raw:
+            return [document.get(key) for document in documents]
+        return [getattr(document, key, None) for document in documents]
+    values = _values(documents, path[:1], raw)
+    for key in path[1:]:
+        if raw:
+            values = [None if value is None else value.get(key) for value in values]
+        else:
+            values = [getattr(value, key, None) for value in values]
+    return values
+
+
+def _with_utc_offset(value: Any) -> Any:
+    """Append a UTC offset to an ISO timestamp string that has none.
+
+    Validated models read such timestamps as UTC, and Arrow refuses to cast
+    them to a zoned timestamp, so raw mode treats them as UTC too.
+    """
+    if value is None:
+        return None
+    time_part = value[10:]
+    if time_part.endswith(("Z", "z")) or "+" in time_part or "-" in time_part:
+        return value
+    return value + "+00:00"
+
+
+def _arrow_column(values: List[Any], kind: str, raw: bool) -> Any:
+    if kind == "category":
+        return pa.array([getattr(value, "value", value) for value in values], pa.string()).dictionary_encode()
+    if raw and kind == "timestamp":
+        values = [_with_utc_offset(value) for value in values]
+    if raw and kind in ("date", "timestamp"):
+        # ISO strings, with the documents' UTC offsets, are parsed by Arrow
+        return pa.array(values, pa.string()).cast(_arrow_type(kind))
+    return pa.array(values, _arrow_type(kind))
+
+
+def documents_to_arrow(documents: Sequence[Any], model_type: Type[BaseModel]) -> Any:
+    """Convert documents to a pyarrow RecordBatch, one column at a time.
+
+    Args:
+        documents: Document models, msgspec Structs or raw document dicts
+            (as returned with ``return_model=False``)
+        model_type: Document model the columns are derived from
+
+    Returns:
+        pyarrow.RecordBatch: One row per document
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    _require_pyarrow()
+    documents = list(documents)
+    raw = bool(documents) and isinstance(documents[0], dict)
+    columns = document_columns(model_type)
+    return pa.RecordBatch.from_arrays(
+        [_arrow_column(_values(documents, column.path, raw), column.kind, raw) for column in columns],
+        schema=arrow_schema(model_type)
+    )
+
+
+def arrow_to_dataframe(table: Any) -> Any:
+    """Convert a pyarrow Table or RecordBatch to pandas, keeping tight dtypes.
+
+    Integers and booleans become nullable pandas dtypes (Int16, Int64,
+    boolean) rather than float64 or object, dictionary columns become
+    categoricals and days become datetime64 values.
+    """
+    _require_pandas()
+    dtypes = {
+        pa.int16(): pd.Int16Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.bool_(): pd.BooleanDtype(),
+    }
+    return table.to_pandas(types_mapper=dtypes.get, date_as_object=False)
+
+
+def documents_to_dataframe(documents: Sequence[Any], model_type: Type[BaseModel]) -> Any:
+    """Convert documents to a pandas DataFrame; see documents_to_arrow."""
+    _require_pandas()
+    return arrow_to_dataframe(documents_to_arrow(documents, model_type))
+
+
+def _batch(documents: List[Any], model_type: Type[BaseModel], output: str) -> Any:
+    batch = documents_to_arrow(documents, model_type)
+    return arrow_to_dataframe(batch) if output == "pandas" else batch
+
+
+def iter_document_batches(
+    documents: Iterable[Any],
+    model_type: Type[BaseModel],
+    batch_size: int,
+    output: str = "arrow"
+) -> Iterator[Any]:
+    """Group a document stream into RecordBatches or DataFrames.
+
+    Args:
+        documents: Document models or raw dicts, e.g. a router's stream()
+        model_type: Document model the columns are derived from
+        batch_size: Maximum number of rows per batch
+        output: "arrow" for RecordBatches or "pandas" for DataFrames
+
+    Yields:
+        One batch per ``batch_size`` documents; the last may be smaller
+    """
+    iterator = iter(documents)
+    while True:
+        chunk = list(itertools.islice(iterator, batch_size))
+        if not chunk:
+            return
+        yield _batch(chunk, model_type, output)
+
+
+async def async_iter_document_batches(
+    documents: AsyncIterable[Any],
+    model_type: Type[BaseModel],
+    batch_size: int,
+    output: str = "arrow"
+) -> AsyncIterator[Any]:
+    """Async version of iter_document_batches, for AsyncOuraClient streams."""
+    chunk = []
+    async for document in documents:
+        chunk.append(document)
+        if len(chunk) == batch_size:
+            yield _batch(chunk, model_type, output)
+            chunk = []
+    if chunk:
+        yield _batch(chunk, model_type, output)
+
+
+class FrameExportMixin:
+    """Adds Arrow and pandas export to paginated response models."""
+
+    def to_arrow(self) -> Any:
+        """Return the page's documents as a pyarrow Table.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        batch = documents_to_arrow(self.data, page_item_type(type(self)))
+        return pa.Table.from_batches([batch])
+
+    def to_dataframe(self) -> Any:
+        """Return the page's documents as a pandas DataFrame.
+
+        Raises:
+            ImportError: If pyarrow or pandas is not installed
+        """
+        return documents_to_dataframe(self.data, page_item_type(type(self)))
@@ -1,8 +1,14 @@
 """Models for heart rate data."""
 
 from pydantic import BaseModel
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+
+from ..utils.arrays import make_array, concat_arrays, array_typecode, epoch_seconds
+from .frames import FrameExportMixin
+
+# Known heart rate sources, in the order of their categorical codes
+HEART_RATE_SOURCES = ("awake", "rest", "sleep", "session", "live", "workout")
 
 
 class HeartRateSample(BaseModel):
@@ -28,7 +34,7 @@ class HeartRateSample(BaseModel):
         return cls(**data)
 
 
-class HeartRateResponse(BaseModel):
+class HeartRateResponse(FrameExportMixin, BaseModel):
     """Represents the full heart rate response."""
     
     data: List[HeartRateSample]
@@ -48,3 +54,139 @@ class HeartRateResponse(BaseModel):
             HeartRateResponse: Instantiated object
         """
         return cls(**response)
+
+
+class HeartRateColumns:
+    """Heart rate samples stored column-wise in compact typed arrays.
+
+    Instead of one HeartRateSample per reading, a page is kept as three
+    parallel arrays (NumPy arrays when NumPy is installed, ``array.array``
+    otherwise):
+
+    - ``timestamps``: epoch seconds (int64)
+    - ``bpm``: beats per minute (uint8, or int16 if a value does not fit)
+    - ``source_codes``: indexes into ``sources`` (uint8)
+
+    Columns behave like a single-item page (``data`` is ``[self]``), so
+    columnar pages can be streamed with the regular pagination helpers.
+    """
+
+    __slots__ = ("timestamps", "bpm", "source_codes", "sources", "next_token")
+
+    def __init__(
+        self,
+        timestamps: Any,
+        bpm: Any,
+        source_codes: Any,
+        sources: Sequence[str] = HEART_RATE_SOURCES,
+        next_token: Optional[str] = None
+    ):
+        """Initialize the columns.
+
+        Args:
+            timestamps: Epoch-second timestamps
+            bpm: Heart rate values
+            source_codes: Source category code of each sample
+            sources: Source names indexed by the codes
+            next_token: Token for the next page, if any
+        """
+        self.timestamps = timestamps
+        self.bpm = bpm
+        self.source_codes = source_codes
+        self.sources: Tuple[str, ...] = tuple(sources)
+        self.next_token = next_token
+
+    @classmethod
+    def from_dict(cls, response: Dict[str, Any]) -> "HeartRateColumns":
+        """Create columns directly from a raw heart rate API response.
+
+        Args:
+            response: Dictionary containing the API response
+
+        Returns:
+            HeartRateColumns: Columnar heart rate data
+        """
+        samples = response.get("data") or []
+        sources = list(HEART_RATE_SOURCES)
+        codes_by_source = {source: code for code, source in enumerate(sources)}
+
+        bpm = [sample["bpm"] for sample in samples]
+        source_names = [sample["source"] for sample in samples]
+        try:
+            source_codes = [codes_by_source[source] for source in source_names]
+        except KeyError:
+            source_codes = []
+            for source in source_names:
+                code = codes_by_source.get(source)
+                if code is None:
+                    code = codes_by_source[source] = len(sources)
+                    sources.append(source)
+                source_codes.append(code)
+
+        bpm_typecode = "B" if not bpm or (min(bpm) >= 0 and max(bpm) <= 255) else "h"
+        return cls(
+            epoch_seconds([sample["timestamp"] for sample in samples]),
+            make_array(bpm_typecode, bpm),
+            make_array("B", source_codes),
+            sources,
+            response.get("next_token")
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["HeartRateColumns"]) -> "HeartRateColumns":
+        """Concatenate several column chunks (e.g. streamed pages) into one.
+
+        Args:
+            parts: Column chunks in chronological order
+
+        Returns:
+            HeartRateColumns: All samples of ``parts``; next_token is that of the last part
+        """
+        sources = list(HEART_RATE_SOURCES)
+        codes_by_source = {source: code for code, source in enumerate(sources)}
+        source_codes = []
+        for part in parts:
+            for source in part.sources:
+                if source not in codes_by_source:
+                    codes_by_source[source] = len(sources)
+                    sources.append(source)
+            if part.sources == tuple(sources[:len(part.sources)]):
+                source_codes.append(part.source_codes)
+            else:
+                remap = [codes_by_source[source] for source in part.sources]
+                source_codes.append(make_array("B", (remap[code] for code in part.source_codes)))
+
+        bpm_typecode = "B"
+        if any(array_typecode(part.bpm) != "B" for part in parts):
+            bpm_typecode = "h"
+
+        return cls(
+            concat_arrays("q", [part.timestamps for part in parts]),
+            concat_arrays(bpm_typecode, [part.bpm for part in parts]),
+            concat_arrays("B", source_codes),
+            sources,
+            parts[-1].next_token if parts else None
+        )
+
+    @property
+    def data(self) -> List["HeartRateColumns"]:
+        """The columns as a single-item page, for the pagination helpers."""
+        return [self]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def source_names(self) -> List[str]:
+        """Decode the categorical source codes into source names."""
+        return [self.sources[code] for code in self.source_codes]
+
+    def datetimes(self) -> List[datetime]:
+        """Decode the timestamps into timezone-aware UTC datetimes."""
+        return [datetime.fromtimestamp(int(ts), timezone.utc) for ts in self.timestamps]
+
+    def to_samples(self) -> List[HeartRateSample]:
+        """Expand the columns into HeartRateSample models (timestamps in UTC)."""
+        return [
+            HeartRateSample(timestamp=timestamp, bpm=int(bpm), source=self.sources[code])
+            for timestamp, bpm, code in zip(self.datetimes(), self.bpm, self.source_codes)
+        ]
@@ -0,0 +1,180 @@
+"""Pages whose documents are validated one by one, on first access."""
+
+import functools
+import typing
+from typing import Any, Awaitable, Callable, Dict, Generic, Iterator, List, Optional, Sequence, Type, TypeVar
+
+T = TypeVar("T")
+
+# Predicate on a raw document dict, run before the document is validated
+RawPredicate = Callable[[Dict[str, Any]], bool]
+
+# Marks items that have not been validated yet
+_UNPARSED = object()
+
+
+def page_item_type(response_type: Type[Any]) -> Type[Any]:
+    """Return the document model of a paginated response model.
+
+    Args:
+        response_type: Response model with a ``data: List[Model]`` field
+
+    Returns:
+        The model of the items in ``data``
+    """
+    return typing.get_args(response_type.model_fields["data"].annotation)[0]
+
+
+class LazyItems(Sequence[T]):
+    """The documents of a page, validated individually when first accessed.
+
+    The raw documents stay available through :meth:`raw` and :meth:`peek`,
+    so fields such as ``day`` or ``id`` can be checked without validating
+    the documents that are not needed.
+    """
+
+    __slots__ = ("_raw", "_parse", "_items")
+
+    def __init__(self, raw_items: List[Dict[str, Any]], parse_item: Callable[[Dict[str, Any]], T]):
+        """Wrap the raw documents of a page.
+
+        Args:
+            raw_items: Decoded documents from the page's ``data``
+            parse_item: Function validating one raw document into its model
+        """
+        self._raw = raw_items
+        self._parse = parse_item
+        self._items: List[Any] = [_UNPARSED] * len(raw_items)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is _UNPARSED:
+            item = self._items[index] = self._parse(self._raw[index])
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self._raw)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"LazyItems({len(self)} items, {self.validated_count} validated)"
+
+    @property
+    def validated_count(self) -> int:
+        """Number of documents validated so far."""
+        return sum(item is not _UNPARSED for item in self._items)
+
+    def raw(self, index: int) -> Dict[str, Any]:
+        """Return a document as the raw dict received from the API, without validating it."""
+        return self._raw[index]
+
+    def peek(self, field: str, default: Any = None) -> List[Any]:
+        """Return one raw field of every document, without validating any of them.
+
+        Values are returned as received: dates and timestamps are ISO
+        strings, which compare in chronological order.
+
+        Args:
+            field: Name of the field, e.g. "day" or "id"
+            default: Value for documents that lack the field
+
+        Returns:
+            The field value of each document, in page order
+        """
+        return [document.get(field, default) for document in self._raw]
+
+    def filter(self, predicate: RawPredicate) -> "LazyItems[T]":
+        """Return the documents whose raw dict matches a predicate, still unvalidated.
+
+        Documents that were already validated keep their model.
+
+        Args:
+            predicate: Called with each raw document
+
+        Returns:
+            LazyItems holding the matching documents, in page order
+        """
+        kept = [index for index, document in enumerate(self._raw) if predicate(document)]
+        filtered = LazyItems([self._raw[index] for index in kept], self._parse)
+        filtered._items = [self._items[index] for index in kept]
+        return filtered
+
+
+class LazyPage(Generic[T]):
+    """A page of documents whose items are validated on first access.
+
+    Returned by the routers' ``get_*_documents(lazy=True)``. Like the
+    response models it has ``data`` and ``next_token``, so it works with
+    ``stream()`` and the pagination helpers.
+
+    Example:
+        >>> page = client.daily_readiness.get_daily_readiness_documents(lazy=True)
+        >>> days = page.data.peek("day")
+        >>> latest = page.data[days.index(max(days))]  # validates one document
+    """
+
+    __slots__ = ("data", "next_token")
+
+    def __init__(self, data: LazyItems[T], next_token: Optional[str] = None):
+        self.data = data
+        self.next_token = next_token
+
+    @classmethod
+    def from_dict(cls, body: Dict[str, Any], parse_item: Callable[[Dict[str, Any]], T]) -> "LazyPage[T]":
+        """Wrap a decoded page.
+
+        Args:
+            body: Decoded response with ``data`` and ``next_token``
+            parse_item: Function validating one raw document into its model
+
+        Returns:
+            The lazy page
+        """
+        return cls(LazyItems(body.get("data") or [], parse_item), body.get("next_token"))
+
+    def __repr__(self) -> str:
+        return f"LazyPage(data={self.data!r}, next_token={self.next_token!r})"
+
+
+def filter_page(page: Any, where: RawPredicate) -> Any:
+    """Drop the documents of a lazy page or raw dict page that do not match ``where``.
+
+    Args:
+        page: LazyPage, or decoded page dict (``return_model=False``)
+        where: Predicate on each raw document
+
+    Returns:
+        A page of the same kind holding the matching documents
+
+    Raises:
+        TypeError: If the page was already validated into a model
+    """
+    if isinstance(page, dict):
+        return dict(page, data=[document for document in page.get("data") or [] if where(document)])
+    if isinstance(page, LazyPage):
+        return LazyPage(page.data.filter(where), page.next_token)
+    raise TypeError(f"Cannot filter raw documents of a validated {type(page).__name__}")
+
+
+def filtered_fetch(fetch_function: Callable[..., Any], where: RawPredicate) -> Callable[..., Any]:
+    """Wrap a page fetch function so its pages only hold documents matching ``where``."""
+    @functools.wraps(fetch_function)
+    def fetch(**kwargs: Any) -> Any:
+        return filter_page(fetch_function(**kwargs), where)
+    return fetch
+
+
+def async_filtered_fetch(
+    fetch_function: Callable[..., Awaitable[Any]],
+    where: RawPredicate
+) -> Callable[..., Awaitable[Any]]:
+    """Async version of filtered_fetch."""
+    @functools.wraps(fetch_function)
+    async def fetch(**kwargs: Any) -> Any:
+        return filter_page(await fetch_function(**kwargs), where)
+    return fetch
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class RestModeEpisode(BaseModel):
@@ -70,6 +71,6 @@ class RestModePeriodModel(BaseModel):
     # 'start_time' is already included
 
 
-class RestModePeriodResponse(BaseModel):
+class RestModePeriodResponse(FrameExportMixin, BaseModel):
     data: List[RestModePeriodModel]
     next_token: Optional[str] = None
@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 # Enum-like fields will be handled with Literal
 from typing import Literal
+from .frames import FrameExportMixin
 
 
 class RingConfigurationModel(BaseModel):
@@ -57,6 +58,6 @@ class RingConfigurationModel(BaseModel):
     # then separate models would be appropriate. The task implies they are simple enums.
 
 
-class RingConfigurationResponse(BaseModel):
+class RingConfigurationResponse(FrameExportMixin, BaseModel):
     data: List[RingConfigurationModel]
     next_token: Optional[str] = None
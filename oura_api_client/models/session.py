@@ -1,10 +1,13 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, date  # Added date for day field
 
 # MomentType and MomentMood are enums, but Pydantic uses Literal for this
 from typing import Literal
 
+from .time_series import SampleSeries
+from .frames import FrameExportMixin
+
 
 class SessionModel(BaseModel):
     id: str
@@ -39,14 +42,15 @@ class SessionModel(BaseModel):
         "tired",
         "undefined"
     ]] = None
-    heart_rate: Optional[str] = Field(
+    # Sample objects (interval, items, timestamp); JSON strings are also accepted
+    heart_rate: Optional[Union[Dict[str, Any], str]] = Field(
      None, alias="heart_rate"
- )  # Assuming string, adjust if complex
-    heart_rate_variability: Optional[str] = Field(
+ )
+    heart_rate_variability: Optional[Union[Dict[str, Any], str]] = Field(
 
         None, alias="heart_rate_variability"
 
-    )  # Assuming string
+    )
     motion_count: Optional[int] = Field(
 
         None, alias="motion_count"
@@ -67,7 +71,15 @@ class SessionModel(BaseModel):
     sleep_score_delta: Optional[int] = Field(None, alias="sleep_score_delta")
     stress: Optional[float] = Field(None, alias="stress")
 
+    def heart_rate_series(self) -> Optional[SampleSeries]:
+        """Decode the heart rate samples of the session (bpm, NaN where missing)."""
+        return SampleSeries.from_value(self.heart_rate)
+
+    def heart_rate_variability_series(self) -> Optional[SampleSeries]:
+        """Decode the HRV samples of the session (ms, NaN where missing)."""
+        return SampleSeries.from_value(self.heart_rate_variability)
+
 
-class SessionResponse(BaseModel):
+class SessionResponse(FrameExportMixin, BaseModel):
     data: List[SessionModel]
     next_token: Optional[str] = None
@@ -1,7 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import date, datetime
 
+from .time_series import SampleSeries, CategorySeries, SLEEP_PHASES, MOVEMENT_CLASSES
+from .frames import FrameExportMixin
+
 
 class SleepContributors(BaseModel):
     """Sleep contributors model for sleep data."""
@@ -37,8 +40,9 @@ class SleepModel(BaseModel):
     day: date
     deep_sleep_duration: Optional[int] = Field(None, alias="deep_sleep_duration")
     efficiency: Optional[int] = Field(None, alias="efficiency")
-    heart_rate: Optional[str] = Field(None, alias="heart_rate")
-    hrv: Optional[str] = Field(None, alias="hrv")
+    # Sample objects (interval, items, timestamp); JSON strings are also accepted
+    heart_rate: Optional[Union[Dict[str, Any], str]] = Field(None, alias="heart_rate")
+    hrv: Optional[Union[Dict[str, Any], str]] = Field(None, alias="hrv")
     latency: Optional[int] = Field(None, alias="latency")
     light_sleep_duration: Optional[int] = Field(None, alias="light_sleep_duration")
     low_battery_alert: Optional[bool] = Field(None, alias="low_battery_alert")
@@ -61,7 +65,23 @@ class SleepModel(BaseModel):
     type: Optional[str] = Field(None, alias="type")
     contributors: SleepContributors
 
+    def heart_rate_series(self) -> Optional[SampleSeries]:
+        """Decode the heart rate samples of the period (bpm, NaN where missing)."""
+        return SampleSeries.from_value(self.heart_rate)
+
+    def hrv_series(self) -> Optional[SampleSeries]:
+        """Decode the HRV samples of the period (ms, NaN where missing)."""
+        return SampleSeries.from_value(self.hrv)
+
+    def movement_series(self) -> Optional[CategorySeries]:
+        """Decode the 30-second movement classes (see MOVEMENT_CLASSES) from bedtime_start."""
+        return CategorySeries.from_string(self.movement_30_sec, 30, self.bedtime_start, MOVEMENT_CLASSES)
+
+    def sleep_phase_series(self) -> Optional[CategorySeries]:
+        """Decode the 5-minute sleep phases (see SLEEP_PHASES) from bedtime_start."""
+        return CategorySeries.from_string(self.sleep_phase_5_min, 300, self.bedtime_start, SLEEP_PHASES)
+
 
-class SleepResponse(BaseModel):
+class SleepResponse(FrameExportMixin, BaseModel):
     data: List[SleepModel]
     next_token: Optional[str] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime  # Added datetime
+from .frames import FrameExportMixin
 
 # Enum-like fields will be handled with Literal as per previous patterns if needed,
 # but based on the provided snippet, direct enum models are not explicitly requested here.
@@ -62,6 +63,6 @@ class SleepTimeModel(BaseModel):
     )  # Added timestamp
 
 
-class SleepTimeResponse(BaseModel):
+class SleepTimeResponse(FrameExportMixin, BaseModel):
     data: List[SleepTimeModel]
     next_token: Optional[str] = None
@@ -0,0 +1,458 @@
+"""msgspec Struct model backend for Oura API responses.
+
+Generated by ``python parse_openapi.py --structs`` from openapi_spec.json;
+do not edit by hand. Requires the optional ``msgspec`` package.
+
+Every field defaults to None, so documents that omit fields still decode.
+Enumerations are kept as plain strings.
+"""
+
+import datetime
+from typing import List, Optional
+
+import msgspec
+
+
+class ActivityContributors(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining activity score contributors."""
+
+    meet_daily_targets: Optional[int] = None
+    move_every_hour: Optional[int] = None
+    recovery_time: Optional[int] = None
+    stay_active: Optional[int] = None
+    training_frequency: Optional[int] = None
+    training_volume: Optional[int] = None
+
+
+class SampleModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the SampleModel schema."""
+
+    interval: Optional[float] = None
+    items: Optional[List[Optional[float]]] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class DailyActivityModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the DailyActivityModel schema."""
+
+    id: Optional[str] = None
+    class_5_min: Optional[str] = None
+    score: Optional[int] = None
+    active_calories: Optional[int] = None
+    average_met_minutes: Optional[float] = None
+    contributors: Optional[ActivityContributors] = None
+    equivalent_walking_distance: Optional[int] = None
+    high_activity_met_minutes: Optional[int] = None
+    high_activity_time: Optional[int] = None
+    inactivity_alerts: Optional[int] = None
+    low_activity_met_minutes: Optional[int] = None
+    low_activity_time: Optional[int] = None
+    medium_activity_met_minutes: Optional[int] = None
+    medium_activity_time: Optional[int] = None
+    met: Optional[SampleModel] = None
+    meters_to_target: Optional[int] = None
+    non_wear_time: Optional[int] = None
+    resting_time: Optional[int] = None
+    sedentary_met_minutes: Optional[int] = None
+    sedentary_time: Optional[int] = None
+    steps: Optional[int] = None
+    target_calories: Optional[int] = None
+    target_meters: Optional[int] = None
+    total_calories: Optional[int] = None
+    day: Optional[datetime.date] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class DailyCardiovascularAgeModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the DailyCardiovascularAgeModel schema."""
+
+    day: Optional[datetime.date] = None
+    vascular_age: Optional[int] = None
+
+
+class ReadinessContributors(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining readiness score contributors."""
+
+    activity_balance: Optional[int] = None
+    body_temperature: Optional[int] = None
+    hrv_balance: Optional[int] = None
+    previous_day_activity: Optional[int] = None
+    previous_night: Optional[int] = None
+    recovery_index: Optional[int] = None
+    resting_heart_rate: Optional[int] = None
+    sleep_balance: Optional[int] = None
+
+
+class DailyReadinessModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the DailyReadinessModel schema."""
+
+    id: Optional[str] = None
+    contributors: Optional[ReadinessContributors] = None
+    day: Optional[datetime.date] = None
+    score: Optional[int] = None
+    temperature_deviation: Optional[float] = None
+    temperature_trend_deviation: Optional[float] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class ResilienceContributors(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the ResilienceContributors schema."""
+
+    sleep_recovery: Optional[float] = None
+    daytime_recovery: Optional[float] = None
+    stress: Optional[float] = None
+
+
+class DailyResilienceModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the DailyResilienceModel schema."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    contributors: Optional[ResilienceContributors] = None
+    level: Optional[str] = None
+
+
+class SleepContributors(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining sleep score contributors."""
+
+    deep_sleep: Optional[int] = None
+    efficiency: Optional[int] = None
+    latency: Optional[int] = None
+    rem_sleep: Optional[int] = None
+    restfulness: Optional[int] = None
+    timing: Optional[int] = None
+    total_sleep: Optional[int] = None
+
+
+class DailySleepModel(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining daily sleep."""
+
+    id: Optional[str] = None
+    contributors: Optional[SleepContributors] = None
+    day: Optional[datetime.date] = None
+    score: Optional[int] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class DailySpO2AggregatedValuesModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the DailySpO2AggregatedValuesModel schema."""
+
+    average: Optional[float] = None
+
+
+class DailySpO2Model(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the DailySpO2Model schema."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    spo2_percentage: Optional[DailySpO2AggregatedValuesModel] = None
+    breathing_disturbance_index: Optional[int] = None
+
+
+class DailyStressModel(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining daily stress."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    stress_high: Optional[int] = None
+    recovery_high: Optional[int] = None
+    day_summary: Optional[str] = None
+
+
+class EnhancedTagModel(msgspec.Struct, kw_only=True, gc=False):
+    """An EnhancedTagModel maps an ASSATag. An ASSATag in ExtAPIV2 is called a EnhancedTag."""
+
+    id: Optional[str] = None
+    tag_type_code: Optional[str] = None
+    start_time: Optional[datetime.datetime] = None
+    end_time: Optional[datetime.datetime] = None
+    start_day: Optional[datetime.date] = None
+    end_day: Optional[datetime.date] = None
+    comment: Optional[str] = None
+    custom_name: Optional[str] = None
+
+
+class HeartRateSample(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the HeartRateModel schema."""
+
+    bpm: Optional[int] = None
+    source: Optional[str] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class DailyActivityResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailyActivityModel_ schema."""
+
+    data: Optional[List[DailyActivityModel]] = None
+    next_token: Optional[str] = None
+
+
+class DailyCardiovascularAgeResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailyCardiovascularAgeModel_ schema."""
+
+    data: Optional[List[DailyCardiovascularAgeModel]] = None
+    next_token: Optional[str] = None
+
+
+class DailyReadinessResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailyReadinessModel_ schema."""
+
+    data: Optional[List[DailyReadinessModel]] = None
+    next_token: Optional[str] = None
+
+
+class DailyResilienceResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailyResilienceModel_ schema."""
+
+    data: Optional[List[DailyResilienceModel]] = None
+    next_token: Optional[str] = None
+
+
+class DailySleepResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailySleepModel_ schema."""
+
+    data: Optional[List[DailySleepModel]] = None
+    next_token: Optional[str] = None
+
+
+class DailySpO2Response(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailySpO2Model_ schema."""
+
+    data: Optional[List[DailySpO2Model]] = None
+    next_token: Optional[str] = None
+
+
+class DailyStressResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_DailyStressModel_ schema."""
+
+    data: Optional[List[DailyStressModel]] = None
+    next_token: Optional[str] = None
+
+
+class EnhancedTagResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_EnhancedTagModel_ schema."""
+
+    data: Optional[List[EnhancedTagModel]] = None
+    next_token: Optional[str] = None
+
+
+class RestModeEpisode(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining a Rest Mode episode."""
+
+    tags: Optional[List[str]] = None
+    timestamp: Optional[datetime.datetime] = None
+
+
+class RestModePeriodModel(msgspec.Struct, kw_only=True, gc=False):
+    """Object contains information about rest mode episode."""
+
+    id: Optional[str] = None
+    end_day: Optional[datetime.date] = None
+    end_time: Optional[datetime.datetime] = None
+    episodes: Optional[List[RestModeEpisode]] = None
+    start_day: Optional[datetime.date] = None
+    start_time: Optional[datetime.datetime] = None
+
+
+class RestModePeriodResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_RestModePeriodModel_ schema."""
+
+    data: Optional[List[RestModePeriodModel]] = None
+    next_token: Optional[str] = None
+
+
+class RingConfigurationModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the RingConfigurationModel schema."""
+
+    id: Optional[str] = None
+    color: Optional[str] = None
+    design: Optional[str] = None
+    firmware_version: Optional[str] = None
+    hardware_type: Optional[str] = None
+    set_up_at: Optional[datetime.datetime] = None
+    size: Optional[int] = None
+
+
+class RingConfigurationResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_RingConfigurationModel_ schema."""
+
+    data: Optional[List[RingConfigurationModel]] = None
+    next_token: Optional[str] = None
+
+
+class SessionModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the SessionModel schema."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    start_datetime: Optional[datetime.datetime] = None
+    end_datetime: Optional[datetime.datetime] = None
+    type: Optional[str] = None
+    heart_rate: Optional[SampleModel] = None
+    heart_rate_variability: Optional[SampleModel] = None
+    mood: Optional[str] = None
+    motion_count: Optional[SampleModel] = None
+
+
+class SessionResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_SessionModel_ schema."""
+
+    data: Optional[List[SessionModel]] = None
+    next_token: Optional[str] = None
+
+
+class ReadinessSummary(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the ReadinessSummary schema."""
+
+    contributors: Optional[ReadinessContributors] = None
+    score: Optional[int] = None
+    temperature_deviation: Optional[float] = None
+    temperature_trend_deviation: Optional[float] = None
+
+
+class SleepModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the SleepModel schema."""
+
+    id: Optional[str] = None
+    average_breath: Optional[float] = None
+    average_heart_rate: Optional[float] = None
+    average_hrv: Optional[int] = None
+    awake_time: Optional[int] = None
+    bedtime_end: Optional[datetime.datetime] = None
+    bedtime_start: Optional[datetime.datetime] = None
+    day: Optional[datetime.date] = None
+    deep_sleep_duration: Optional[int] = None
+    efficiency: Optional[int] = None
+    heart_rate: Optional[SampleModel] = None
+    hrv: Optional[SampleModel] = None
+    latency: Optional[int] = None
+    light_sleep_duration: Optional[int] = None
+    low_battery_alert: Optional[bool] = None
+    lowest_heart_rate: Optional[int] = None
+    movement_30_sec: Optional[str] = None
+    period: Optional[int] = None
+    readiness: Optional[ReadinessSummary] = None
+    readiness_score_delta: Optional[int] = None
+    rem_sleep_duration: Optional[int] = None
+    restless_periods: Optional[int] = None
+    sleep_phase_5_min: Optional[str] = None
+    sleep_score_delta: Optional[int] = None
+    sleep_algorithm_version: Optional[str] = None
+    time_in_bed: Optional[int] = None
+    total_sleep_duration: Optional[int] = None
+    type: Optional[str] = None
+
+
+class SleepResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_SleepModel_ schema."""
+
+    data: Optional[List[SleepModel]] = None
+    next_token: Optional[str] = None
+
+
+class SleepTimeWindow(msgspec.Struct, kw_only=True, gc=False):
+    """Object defining sleep time window."""
+
+    day_tz: Optional[int] = None
+    end_offset: Optional[int] = None
+    start_offset: Optional[int] = None
+
+
+class SleepTimeModel(msgspec.Struct, kw_only=True, gc=False):
+    """Object contains suggested bedtime for the user."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    optimal_bedtime: Optional[SleepTimeWindow] = None
+    recommendation: Optional[str] = None
+    status: Optional[str] = None
+
+
+class SleepTimeResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_SleepTimeModel_ schema."""
+
+    data: Optional[List[SleepTimeModel]] = None
+    next_token: Optional[str] = None
+
+
+class TagModel(msgspec.Struct, kw_only=True, gc=False):
+    """A TagModel maps to an ASSANote. An ASSANote in ExtAPIV2 is called a Tag."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    text: Optional[str] = None
+    timestamp: Optional[datetime.datetime] = None
+    tags: Optional[List[str]] = None
+
+
+class TagResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_TagModel_ schema."""
+
+    data: Optional[List[TagModel]] = None
+    next_token: Optional[str] = None
+
+
+class Vo2MaxModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the VO2MaxModel schema."""
+
+    id: Optional[str] = None
+    day: Optional[datetime.date] = None
+    timestamp: Optional[datetime.datetime] = None
+    vo2_max: Optional[float] = None
+
+
+class Vo2MaxResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_VO2MaxModel_ schema."""
+
+    data: Optional[List[Vo2MaxModel]] = None
+    next_token: Optional[str] = None
+
+
+class WorkoutModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the WorkoutModel schema."""
+
+    id: Optional[str] = None
+    activity: Optional[str] = None
+    calories: Optional[float] = None
+    day: Optional[datetime.date] = None
+    distance: Optional[float] = None
+    end_datetime: Optional[datetime.datetime] = None
+    intensity: Optional[str] = None
+    label: Optional[str] = None
+    source: Optional[str] = None
+    start_datetime: Optional[datetime.datetime] = None
+
+
+class WorkoutResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the MultiDocumentResponse_WorkoutModel_ schema."""
+
+    data: Optional[List[WorkoutModel]] = None
+    next_token: Optional[str] = None
+
+
+class PersonalInfo(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the PersonalInfoResponse schema."""
+
+    id: Optional[str] = None
+    age: Optional[int] = None
+    weight: Optional[float] = None
+    height: Optional[float] = None
+    biological_sex: Optional[str] = None
+    email: Optional[str] = None
+
+
+class HeartRateResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the TimeSeriesResponse_HeartRateModel_ schema."""
+
+    data: Optional[List[HeartRateSample]] = None
+    next_token: Optional[str] = None
+
+
+class WebhookSubscriptionModel(msgspec.Struct, kw_only=True, gc=False):
+    """Generated from the WebhookSubscriptionModel schema."""
+
+    id: Optional[str] = None
+    callback_url: Optional[str] = None
+    event_type: Optional[str] = None
+    data_type: Optional[str] = None
+    expiration_time: Optional[datetime.datetime] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import date, datetime  # Added datetime
+from .frames import FrameExportMixin
 
 
 class TagModel(BaseModel):
@@ -21,6 +22,6 @@ class TagModel(BaseModel):
     # end_time: Optional[datetime] = Field(None, alias="end_time")
 
 
-class TagResponse(BaseModel):
+class TagResponse(FrameExportMixin, BaseModel):
     data: List[TagModel]
     next_token: Optional[str] = None
@@ -1,18 +1,126 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+import json
+import math
+from array import array
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+from ..utils.arrays import digit_codes, epoch_seconds, float_array, sample_times
 
-class TimeSeriesData(BaseModel):
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# A point in time: epoch seconds, an ISO 8601 string or a datetime
+TimeBound = Union[int, float, str, datetime]
+
+
+def _to_seconds(timestamp: TimeBound) -> float:
+    """Return the epoch seconds of an ISO 8601 string, datetime or epoch value."""
+    if isinstance(timestamp, str):
+        return int(epoch_seconds([timestamp])[0])
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return timestamp
+
+
+class EvenlySpacedSeries:
+    """Sample-time arithmetic shared by the evenly spaced series.
+
+    Subclasses provide ``interval``, ``timestamp`` (epoch seconds of the
+    first sample) and a float or integer array of values. Sample times are
+    always computed from these, never stored.
+    """
+
+    __slots__ = ()
+
+    def _values(self) -> Any:
+        """Return the sample values."""
+        return self.items
+
+    def _with_values(self, values: Any, timestamp: float) -> Any:
+        """Return a series of the same kind over other values."""
+        return type(self)(values, self.interval, timestamp)
+
+    def __len__(self) -> int:
+        return len(self._values())
+
+    def timestamps(self) -> Any:
+        """Return the epoch seconds of every sample as a float64 array."""
+        return sample_times(self.timestamp, self.interval, len(self))
+
+    def to_numpy(self) -> Any:
+        """Return the sample values as a NumPy array sharing their memory.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required for to_numpy(). Install it with: pip install oura-api-client[numpy]"
+            )
+        return np.asarray(self._values())
+
+    def to_pairs(self) -> Any:
+        """Return (epoch seconds, value) pairs for every sample.
+
+        Returns:
+            A float64 array of shape (n, 2) when NumPy is installed,
+            otherwise an iterator of (timestamp, value) tuples
+        """
+        if np is not None:
+            return np.column_stack((self.timestamps(), self.to_numpy()))
+        return zip(self.timestamps(), self._values())
+
+    def index_range(self, start: Optional[TimeBound] = None, end: Optional[TimeBound] = None) -> Tuple[int, int]:
+        """Return the indexes of the samples taken in [start, end).
+
+        Args:
+            start: First time to include (default: the first sample)
+            end: First time to exclude (default: after the last sample)
+
+        Returns:
+            (first index, end index), computed from the interval without
+            expanding the sample times
+        """
+        count = len(self)
+        first = 0 if start is None else math.ceil((_to_seconds(start) - self.timestamp) / self.interval)
+        stop = count if end is None else math.ceil((_to_seconds(end) - self.timestamp) / self.interval)
+        first = min(max(first, 0), count)
+        return first, max(min(stop, count), first)
+
+    def slice(self, start: Optional[TimeBound] = None, end: Optional[TimeBound] = None) -> Any:
+        """Return the samples taken in [start, end) as a series of the same kind.
+
+        Args:
+            start: First time to include (default: the first sample)
+            end: First time to exclude (default: after the last sample)
+
+        Returns:
+            A series starting at the first included sample
+        """
+        first, stop = self.index_range(start, end)
+        return self._with_values(self._values()[first:stop], self.timestamp + first * self.interval)
+
+
+class TimeSeriesData(EvenlySpacedSeries, BaseModel):
     """
     Time series data structure for various Oura metrics.
     
     This model represents time-series data with a consistent structure across different
     endpoints. The timestamp is automatically converted from ISO 8601 format to Unix
     timestamp for easier programmatic use.
+
+    Items are stored in a contiguous float64 ``array.array``, with NaN for
+    missing (null) samples. ``to_numpy()`` and ``memoryview(series.items)``
+    give zero-copy access to it, and ``timestamps()``, ``to_pairs()`` and
+    ``slice()`` compute sample times from the interval.
     """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     interval: int = Field(..., description="Interval in seconds between the sampled items.")
-    items: List[Optional[float]] = Field(..., description="Recorded sample items. Null values indicate missing data points.")
+    items: array = Field(..., description="Recorded sample items. NaN values indicate missing data points.")
     timestamp: int = Field(..., description="Unix timestamp (seconds since epoch) when the sample recording started.")
     
     @field_validator('timestamp', mode='before')
@@ -23,3 +131,179 @@ class TimeSeriesData(BaseModel):
             dt = datetime.fromisoformat(v.replace('Z', '+00:00'))
             return int(dt.timestamp())
         return v
+
+    @field_validator('items', mode='before')
+    @classmethod
+    def parse_items(cls, v):
+        """Store the sample items in a float64 array, with NaN for None."""
+        if isinstance(v, array) and v.typecode == 'd':
+            return v
+        if np is not None and isinstance(v, np.ndarray):
+            items = array('d')
+            items.frombytes(np.ascontiguousarray(v, dtype='float64').tobytes())
+            return items
+        return array('d', (math.nan if item is None else item for item in v))
+
+    @field_serializer('items')
+    def serialize_items(self, items: array) -> List[Optional[float]]:
+        """Serialize the items as a list, with None for missing samples."""
+        return [None if math.isnan(item) else item for item in items]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TimeSeriesData):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
+    def _with_values(self, values: Any, timestamp: float) -> "TimeSeriesData":
+        return TimeSeriesData(interval=self.interval, items=values, timestamp=int(timestamp))
+
+
+# Names of the sleep phase codes in SleepModel.sleep_phase_5_min
+SLEEP_PHASES = ("unknown", "deep", "light", "rem", "awake")
+
+# Names of the movement codes in SleepModel.movement_30_sec
+MOVEMENT_CLASSES = ("unknown", "no_motion", "restless", "tossing_and_turning", "active")
+
+# Names of the activity class codes in DailyActivityModel.class_5_min
+ACTIVITY_CLASSES = ("non_wear", "rest", "inactive", "low", "medium", "high")
+
+
+class SampleSeries(EvenlySpacedSeries):
+    """Evenly spaced numeric samples stored in a compact float64 array.
+
+    Decoded from the API's sample objects (``interval``, ``items`` and
+    ``timestamp``), such as the heart rate and HRV of a sleep period.
+    ``items`` is a NumPy array when NumPy is installed and an
+    ``array.array`` otherwise; missing samples are NaN.
+    """
+
+    __slots__ = ("items", "interval", "timestamp")
+
+    def __init__(self, items: Any, interval: float, timestamp: float):
+        """Initialize the series.
+
+        Args:
+            items: float64 sample values, NaN where missing
+            interval: Seconds between samples
+            timestamp: Epoch seconds of the first sample
+        """
+        self.items = items
+        self.interval = interval
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_value(cls, value: Union[str, Dict[str, Any], None]) -> Optional["SampleSeries"]:
+        """Decode a sample object, given as a dict or as a JSON string.
+
+        Args:
+            value: Sample object with interval, items and timestamp, or None
+
+        Returns:
+            SampleSeries, or None when value is None
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+        return cls.from_samples(value["items"], value["interval"], value["timestamp"])
+
+    @classmethod
+    def from_samples(
+        cls,
+        items: Sequence[Optional[float]],
+        interval: float,
+        timestamp: TimeBound
+    ) -> "SampleSeries":
+        """Build a series from sample values.
+
+        Args:
+            items: Sample values, None where missing
+            interval: Seconds between samples
+            timestamp: Time of the first sample
+
+        Returns:
+            SampleSeries
+        """
+        return cls(float_array(items), interval, _to_seconds(timestamp))
+
+
+class CategorySeries(EvenlySpacedSeries):
+    """Evenly spaced categorical samples stored as a uint8 array of codes.
+
+    Decoded from the API's digit strings, such as
+    ``SleepModel.sleep_phase_5_min`` where every character is the class of
+    one interval. ``labels[code]`` names each code.
+    """
+
+    __slots__ = ("codes", "interval", "timestamp", "labels")
+
+    def __init__(self, codes: Any, interval: float, timestamp: float, labels: Sequence[str] = ()):
+        """Initialize the series.
+
+        Args:
+            codes: uint8 category codes
+            interval: Seconds between samples
+            timestamp: Epoch seconds of the first sample
+            labels: Category names indexed by code
+        """
+        self.codes = codes
+        self.interval = interval
+        self.timestamp = timestamp
+        self.labels: Tuple[str, ...] = tuple(labels)
+
+    @classmethod
+    def from_string(
+        cls,
+        text: Optional[str],
+        interval: float,
+        timestamp: Union[str, int, float, datetime, None],
+        labels: Sequence[str] = ()
+    ) -> Optional["CategorySeries"]:
+        """Decode a digit string into category codes.
+
+        Args:
+            text: One digit per interval, or None
+            interval: Seconds covered by each digit
+            timestamp: Start of the first interval, or None
+            labels: Category names indexed by code
+
+        Returns:
+            CategorySeries, or None when text or timestamp is missing
+        """
+        if text is None or timestamp is None:
+            return None
+        return cls(digit_codes(text), interval, _to_seconds(timestamp), labels)
+
+    def _values(self) -> Any:
+        return self.codes
+
+    def _with_values(self, values: Any, timestamp: float) -> "CategorySeries":
+        return CategorySeries(values, self.interval, timestamp, self.labels)
+
+    def label_names(self) -> List[str]:
+        """Decode the codes into category names."""
+        return [self.labels[code] for code in self.codes]
+
+    def counts(self) -> List[int]:
+        """Count the samples of each code, from 0 to the highest label or code.
+
+        Counted with ``numpy.bincount`` when NumPy is installed, otherwise
+        with one ``bytes.count`` per code.
+        """
+        if np is not None:
+            return np.bincount(np.asarray(self.codes, dtype="uint8"), minlength=len(self.labels)).tolist()
+        codes = bytes(self.codes)
+        size = max(len(self.labels), max(codes) + 1 if codes else 0)
+        return [codes.count(code) for code in range(size)]
+
+    def minutes(self) -> Dict[str, float]:
+        """Return the minutes spent in each labeled category.
+
+        Returns:
+            Minutes per label, including categories with no samples
+        """
+        counts = self.counts()
+        return {
+            label: (counts[code] if code < len(counts) else 0) * self.interval / 60
+            for code, label in enumerate(self.labels)
+        }
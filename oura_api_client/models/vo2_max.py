@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
+from .frames import FrameExportMixin
 
 
 class Vo2MaxModel(BaseModel):
@@ -19,6 +20,6 @@ class Vo2MaxModel(BaseModel):
     timestamp: datetime  # Timestamp of the summary
 
 
-class Vo2MaxResponse(BaseModel):
+class Vo2MaxResponse(FrameExportMixin, BaseModel):
     data: List[Vo2MaxModel]
     next_token: Optional[str] = None
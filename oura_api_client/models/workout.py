@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import date, datetime  # Added date
 # WorkoutIntensity and WorkoutSource are enums, but Pydantic uses Literal for this
 from typing import Literal
+from .frames import FrameExportMixin
 
 
 class WorkoutModel(BaseModel):
@@ -40,6 +41,6 @@ class WorkoutModel(BaseModel):
     # )  # If GPS data was available
 
 
-class WorkoutResponse(BaseModel):
+class WorkoutResponse(FrameExportMixin, BaseModel):
     data: List[WorkoutModel]
     next_token: Optional[str] = None
@@ -0,0 +1,248 @@
+"""Logic shared by the sync and async endpoint routers.
+
+BaseRouter and AsyncBaseRouter only differ in the helpers that do I/O:
+they plug their sync or async pagination, sharding, bulk lookup and
+batching functions into the class attributes below.
+"""
+
+import functools
+import json
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Optional, Type, Union
+
+from .models.adapters import parse_model, parse_struct
+from .models.frames import check_frame_output
+from .models.lazy import LazyPage, RawPredicate, page_item_type
+from .utils.pagination import CheckpointCallback, StreamCursor
+
+
+class RouterMixin:
+    # Document model of the router's stream(), used for columnar export
+    document_model: Optional[Type[Any]] = None
+    # Name of the router's single-document getter, used by get_many()
+    document_getter: Optional[str] = None
+
+    # I/O helpers, set by BaseRouter (sync) and AsyncBaseRouter (async)
+    _paginate: Callable[..., Any]
+    _shard: Callable[..., Any]
+    _resumable: Callable[..., Any]
+    _fetch_many: Callable[..., Any]
+    _batches: Callable[..., Any]
+    _filter_fetch: Callable[..., Any]
+
+    def __init__(self, client):
+        self.client = client
+
+    def _decode(self, body: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        """Decode a raw JSON body returned by ``_make_request(..., decode=False)``.
+
+        Bytes are decoded with the client's JSON decoder.
+        """
+        if isinstance(body, (bytes, bytearray)):
+            return getattr(self.client, "json_decoder", json.loads)(body)
+        return body
+
+    def _parse(
+        self,
+        model: Type[Any],
+        response: Union[Dict[str, Any], bytes],
+        return_model: bool = True,
+        lazy: bool = False
+    ) -> Any:
+        """
+        Parse a response body into its model.
+
+        Raw JSON bytes are validated directly by the model's registered
+        TypeAdapter, without building an intermediate dict.
+
+        Args:
+            model: Model class of the response
+            response: Raw JSON body or decoded JSON response
+            return_model: Return the validated model (True) or the decoded
+                dict (False), which skips model validation entirely
+            lazy: Return a LazyPage of a paginated response, whose documents
+                are validated one by one when first accessed
+
+        Returns:
+            The model instance (a msgspec Struct with the client's "struct"
+            model backend), a LazyPage when lazy is True, or the decoded
+            dict when return_model is False
+        """
+        if not return_model:
+            return self._decode(response)
+        parse = parse_struct if getattr(self.client, "model_backend", "pydantic") == "struct" else parse_model
+        if lazy:
+            return LazyPage.from_dict(
+                self._decode(response), functools.partial(parse, page_item_type(model))
+            )
+        return parse(model, response)
+
+    @staticmethod
+    def _parse_kwargs(return_model: bool = True, lazy: bool = False) -> Dict[str, bool]:
+        """Return the parsing options stream() passes on to its fetch function.
+
+        Only non-default options are passed, so fetch functions are called
+        with the same arguments as before when the defaults are used.
+        """
+        kwargs = {} if return_model else {"return_model": False}
+        if lazy:
+            kwargs["lazy"] = True
+        return kwargs
+
+    def get_many(
+        self,
+        ids: Iterable[str],
+        max_concurrency: int = 8,
+        return_model: bool = True
+    ) -> Any:
+        """
+        Fetch many documents by ID concurrently.
+
+        Lookups share the client's connection pool (and rate limiter), at
+        most max_concurrency at a time. A failed lookup does not abort the
+        others: its document is None and its error is kept in the result.
+        On AsyncOuraClient the result must be awaited.
+
+        Args:
+            ids: Document IDs; duplicates are fetched once
+            max_concurrency: Maximum number of lookups in flight
+            return_model: Return validated models (True) or raw dicts (False)
+
+        Returns:
+            BulkResult: ``documents`` in the order of ``ids`` and ``errors``
+            keyed by the IDs that failed
+
+        Raises:
+            TypeError: If the router has no single-document endpoint
+            ValueError: If max_concurrency is not positive
+
+        Example:
+            >>> result = client.sleep.get_many(ids)
+            >>> for document_id, error in result.errors.items():
+            ...     log.warning("%s: %s", document_id, error)
+        """
+        if self.document_getter is None:
+            raise TypeError(f"{type(self).__name__} has no single-document endpoint")
+        kwargs = {} if return_model else {"return_model": False}
+        return self._fetch_many(getattr(self, self.document_getter), ids, max_concurrency, **kwargs)
+
+    def stream_batches(
+        self,
+        batch_size: int = 10000,
+        output: str = "arrow",
+        **stream_kwargs: Any
+    ) -> Any:
+        """
+        Stream documents as pyarrow RecordBatches or pandas DataFrames.
+
+        Pages are streamed as raw dicts and converted column by column, so
+        documents are never validated into models one row at a time.
+        Columns have tight types: int16 scores, categorical enums, date32
+        days, UTC timestamps and flattened contributor sub-models. On
+        AsyncOuraClient, iterate the result with ``async for``.
+
+        Args:
+            batch_size: Maximum number of documents per batch
+            output: "arrow" for RecordBatches or "pandas" for DataFrames
+            **stream_kwargs: Options of the router's stream(), such as
+                start_date, end_date, prefetch or max_workers
+
+        Returns:
+            An iterator of batches of up to batch_size documents
+
+        Raises:
+            TypeError: If the router has no document stream
+            ValueError: If the output is unknown
+            ImportError: If pyarrow (or pandas) is not installed
+
+        Example:
+            >>> for batch in client.daily_sleep.stream_batches(start_date="2024-01-01"):
+            ...     writer.write_batch(batch)
+        """
+        if self.document_model is None:
+            raise TypeError(f"{type(self).__name__} has no document stream")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        check_frame_output(output)
+        return self._batches(
+            self.stream(return_model=False, **stream_kwargs), self.document_model, batch_size, output
+        )
+
+    def _stream_documents(
+        self,
+        fetch_function: Callable[..., Any],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        max_workers: int = 1,
+        shard_days: Optional[int] = None,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        where: Optional[RawPredicate] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Stream all documents from a paginated endpoint.
+
+        Args:
+            fetch_function: The endpoint method to call for fetching documents
+            start_date: Optional start date for filtering
+            end_date: Optional end date for filtering
+            prefetch: Number of pages to fetch ahead in the background (0 disables)
+            max_workers: Number of date shards to fetch concurrently; values
+                above 1 enable sharding when both start_date and end_date are given
+            shard_days: Days per shard, or None to size shards from page density
+            cursor: Position to resume from, as saved from a checkpoint
+            checkpoint: Called with the stream's cursor after each consumed page
+            where: Predicate on each raw document dict; pages are fetched
+                lazily and only matching documents are validated and yielded
+            **kwargs: Additional parameters to pass to the fetch function
+
+        Returns:
+            An iterator (async iterator for AsyncBaseRouter) of the
+            individual document items
+
+        Raises:
+            ValueError: If where is combined with columnar pages, or columnar
+                pages are sharded without an explicit shard_days
+        """
+        if where is not None:
+            if kwargs.get("columnar"):
+                raise ValueError("where cannot be combined with columnar=True")
+            if kwargs.get("return_model", True):
+                kwargs["lazy"] = True
+            fetch_function = self._filter_fetch(fetch_function, where)
+
+        if cursor is not None or checkpoint is not None:
+            if max_workers > 1:
+                raise ValueError("Checkpointed streams cannot be sharded; use max_workers=1")
+            return self._resumable(
+                fetch_function,
+                start_date=start_date,
+                end_date=end_date,
+                prefetch=prefetch,
+                cursor=cursor,
+                checkpoint=checkpoint,
+                **kwargs
+            )
+
+        if max_workers > 1 and start_date and end_date:
+            if kwargs.get("columnar") and shard_days is None:
+                # Columnar pages carry no per-item day to size shards from
+                raise ValueError("columnar pages need an explicit shard_days to be sharded")
+            return self._shard(
+                fetch_function,
+                start_date=start_date,
+                end_date=end_date,
+                max_workers=max_workers,
+                shard_days=shard_days,
+                **kwargs
+            )
+
+        return self._paginate(
+            fetch_function,
+            start_date=start_date,
+            end_date=end_date,
+            prefetch=prefetch,
+            **kwargs
+        )
@@ -0,0 +1,163 @@
+"""Concurrent snapshot of every date-ranged collection."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .utils.bulk import LOOKUP_ERRORS
+
+# Collections fetched by snapshot(), keyed by the client router attribute.
+# ring_configuration is left out as it is not filtered by date.
+SNAPSHOT_COLLECTIONS = (
+    "daily_activity",
+    "daily_readiness",
+    "daily_sleep",
+    "daily_spo2",
+    "daily_stress",
+    "daily_resilience",
+    "daily_cardiovascular_age",
+    "vo2_max",
+    "sleep",
+    "session",
+    "workout",
+    "tag",
+    "enhanced_tag",
+    "sleep_time",
+    "rest_mode_period",
+    "heartrate",
+)
+
+
+class Snapshot(NamedTuple):
+    """The documents of every collection over one date range.
+
+    Each collection field holds the collection's documents (models, or raw
+    dicts with ``return_model=False``), in the order the API returned
+    them. A collection that was not requested, or whose fetch failed, is
+    an empty list. ``timings`` holds the seconds each requested collection
+    took, failed ones included, and ``errors`` the exception of each
+    collection that failed.
+    """
+
+    daily_activity: List[Any]
+    daily_readiness: List[Any]
+    daily_sleep: List[Any]
+    daily_spo2: List[Any]
+    daily_stress: List[Any]
+    daily_resilience: List[Any]
+    daily_cardiovascular_age: List[Any]
+    vo2_max: List[Any]
+    sleep: List[Any]
+    session: List[Any]
+    workout: List[Any]
+    tag: List[Any]
+    enhanced_tag: List[Any]
+    sleep_time: List[Any]
+    rest_mode_period: List[Any]
+    heartrate: List[Any]
+    timings: Dict[str, float]
+    errors: Dict[str, Exception]
+
+    @property
+    def ok(self) -> bool:
+        """True when every requested collection was fetched."""
+        return not self.errors
+
+
+# Outcome of one collection: (documents, seconds, error)
+_Outcome = Tuple[List[Any], float, Optional[Exception]]
+
+
+def snapshot_collections(collections: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """Validate the collections of a snapshot.
+
+    Args:
+        collections: Router attribute names, or None for SNAPSHOT_COLLECTIONS
+
+    Returns:
+        The collection names, once each
+
+    Raises:
+        ValueError: If a collection is not in SNAPSHOT_COLLECTIONS
+    """
+    names = tuple(dict.fromkeys(SNAPSHOT_COLLECTIONS if collections is None else collections))
+    unknown = set(names) - set(SNAPSHOT_COLLECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown collections: {', '.join(sorted(unknown))}")
+    return names
+
+
+def _bundle(outcomes: Dict[str, _Outcome]) -> Snapshot:
+    fields: Dict[str, Any] = {collection: [] for collection in SNAPSHOT_COLLECTIONS}
+    timings: Dict[str, float] = {}
+    errors: Dict[str, Exception] = {}
+    for collection, (documents, seconds, error) in outcomes.items():
+        fields[collection] = documents
+        timings[collection] = seconds
+        if error is not None:
+            errors[collection] = error
+    return Snapshot(timings=timings, errors=errors, **fields)
+
+
+def take_snapshot(
+    client: Any,
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    collections: Optional[Iterable[str]] = None,
+    return_model: bool = True
+) -> Snapshot:
+    """Fetch collections concurrently, one worker thread per collection.
+
+    Args:
+        client: OuraClient whose routers are fetched
+        start_date: Start date for the period
+        end_date: End date for the period
+        collections: Collections to fetch (defaults to SNAPSHOT_COLLECTIONS)
+        return_model: Fetch validated models (True) or raw dicts (False)
+
+    Returns:
+        Snapshot: The documents, timings and errors of every collection
+    """
+    names = snapshot_collections(collections)
+
+    def fetch(collection: str) -> _Outcome:
+        started = time.perf_counter()
+        try:
+            documents = list(getattr(client, collection).stream(
+                start_date=start_date, end_date=end_date, return_model=return_model
+            ))
+        except LOOKUP_ERRORS as e:
+            return [], time.perf_counter() - started, e
+        return documents, time.perf_counter() - started, None
+
+    if not names:
+        return _bundle({})
+    with ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="oura-snapshot") as pool:
+        futures = {collection: pool.submit(fetch, collection) for collection in names}
+        return _bundle({collection: future.result() for collection, future in futures.items()})
+
+
+async def async_take_snapshot(
+    client: Any,
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    collections: Optional[Iterable[str]] = None,
+    return_model: bool = True
+) -> Snapshot:
+    """Async version of take_snapshot, for AsyncOuraClient; one task per collection."""
+    names = snapshot_collections(collections)
+
+    async def fetch(collection: str) -> _Outcome:
+        started = time.perf_counter()
+        try:
+            documents = [document async for document in getattr(client, collection).stream(
+                start_date=start_date, end_date=end_date, return_model=return_model
+            )]
+        except LOOKUP_ERRORS as e:
+            return [], time.perf_counter() - started, e
+        return documents, time.perf_counter() - started, None
+
+    outcomes = await asyncio.gather(*(fetch(collection) for collection in names))
+    return _bundle(dict(zip(names, outcomes)))
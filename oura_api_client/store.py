@@ -0,0 +1,462 @@
+"""Memory-mapped, day-partitioned local store for heart rate samples and their rollups."""
+
+import os
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .aggregation import RESAMPLE_FREQUENCIES
+from .models.heartrate import HEART_RATE_SOURCES, HeartRateColumns
+from .models.time_series import _to_seconds
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Layout of one stored sample: little-endian epoch seconds, bpm and source
+# code, packed into 11 bytes
+RECORD_FIELDS = [("timestamp", "<i8"), ("bpm", "<i2"), ("source", "u1")]
+
+# Layout of one rollup row: bucket start (epoch seconds) and the count,
+# sum, min, max and sum of squares of the bucket's bpm values
+ROLLUP_FIELDS = [
+    ("start", "<i8"),
+    ("count", "<i8"),
+    ("sum", "<i8"),
+    ("min", "<i2"),
+    ("max", "<i2"),
+    ("sumsq", "<i8"),
+]
+
+# Suffixes of the day partition files and of the rollup files
+PARTITION_SUFFIX = ".hr"
+ROLLUP_SUFFIX = ".rollup"
+
+# File listing the source names, one per line, in code order
+SOURCES_FILE = "sources.txt"
+
+# Ordinal of 1970-01-01, used to turn partition days into epoch days
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+StoreBound = Union[int, float, str, datetime, date]
+
+
+def _bound_seconds(bound: StoreBound) -> int:
+    """Return the epoch seconds of a query bound; days start at midnight UTC."""
+    if isinstance(bound, date) and not isinstance(bound, datetime):
+        bound = datetime(bound.year, bound.month, bound.day, tzinfo=timezone.utc)
+    return int(_to_seconds(bound))
+
+
+def rollup_mean_std(rows: Any) -> Tuple[Any, Any]:
+    """Return the mean and (population) standard deviation of rollup rows.
+
+    Args:
+        rows: Rollup rows as returned by HeartRateStore.rollup()
+
+    Returns:
+        Two float64 arrays, one value per row
+    """
+    count = rows["count"].astype("float64")
+    mean = rows["sum"] / count
+    return mean, np.sqrt(np.maximum(rows["sumsq"] / count - mean * mean, 0.0))
+
+
+def _combine_rollups(rows: Any) -> Any:
+    """Merge rollup rows, sorted by start, that share a bucket."""
+    first = np.flatnonzero(np.diff(rows["start"], prepend=rows["start"][0] - 1))
+    combined = rows[first]
+    for field, reduce in (("count", np.add), ("sum", np.add), ("sumsq", np.add),
+                          ("min", np.minimum), ("max", np.maximum)):
+        combined[field] = reduce.reduceat(rows[field], first)
+    return combined
+
+
+class HeartRateStore:
+    """Day-partitioned binary store of heart rate samples, read through mmap.
+
+    Samples are stored as fixed-width records (epoch seconds, bpm, source
+    code) in one file per UTC day, ordered by timestamp and source. Files
+    are memory-mapped for reading: range queries binary-search the mapped
+    records and return NumPy views of them, with nothing to parse.
+
+    Feed it from ``client.heartrate.stream()``; columnar chunks
+    (``columnar=True``) are appended without building a model per sample.
+    Samples already stored (same timestamp and source) are skipped, so
+    overlapping ranges can be re-synced safely. Samples newer than a day's
+    last record are appended to its file; late samples that fall before it
+    (e.g. readings the ring uploaded late) are merged in by rewriting the
+    day's file.
+
+    The store also keeps a rollup pyramid: per-minute, per-hour and per-day
+    count, sum, min, max and sum of squares of bpm (over all sources, in
+    UTC buckets). Rollups are updated incrementally with every append, so
+    long-range charts read a few thousand rollup rows instead of scanning
+    the raw samples.
+
+    Requires NumPy.
+
+    Example:
+        >>> with HeartRateStore("heartrate") as store:
+        ...     store.extend(client.heartrate.stream(start_date="2024-01-01", columnar=True))
+        ...     columns = store.read("2024-03-01", "2024-04-01")
+        ...     print(columns.bpm.mean())
+        ...     hours = store.rollup("hour", "2024-01-01", "2025-01-01")
+    """
+
+    def __init__(self, path: str, rollups: Iterable[str] = ("minute", "hour", "day")):
+        """Open or create a store.
+
+        Args:
+            path: Directory holding the partition files; created if missing
+            rollups: Rollup levels to maintain: any of "minute", "hour" and
+                "day". Missing levels are built from the stored samples.
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If a rollup level is unknown
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required for HeartRateStore; install it with: pip install oura-api-client[numpy]"
+            )
+        self.path = os.path.expanduser(str(path))
+        self.dtype = np.dtype(RECORD_FIELDS)
+        self.rollup_dtype = np.dtype(ROLLUP_FIELDS)
+        self.rollups = tuple(rollups)
+        for level in self.rollups:
+            if level not in RESAMPLE_FREQUENCIES:
+                raise ValueError(
+                    f"Unknown rollup level {level!r}; expected any of {', '.join(RESAMPLE_FREQUENCIES)}"
+                )
+        os.makedirs(self.path, exist_ok=True)
+        self.sources: List[str] = self._load_sources()
+        # file path -> (file size, mapped records); remapped when the file changes
+        self._maps: Dict[str, Tuple[int, Any]] = {}
+
+        missing = [level for level in self.rollups if not os.path.exists(self._rollup_path(level))]
+        if missing:
+            self.rebuild_rollups(missing)
+
+    def __enter__(self) -> "HeartRateStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Drop the store's memory maps.
+
+        Each map is unmapped once no view returned by the store uses it.
+        """
+        self._maps.clear()
+
+    def _load_sources(self) -> List[str]:
+        try:
+            with open(os.path.join(self.path, SOURCES_FILE)) as sources_file:
+                return sources_file.read().split()
+        except FileNotFoundError:
+            self._save_sources(HEART_RATE_SOURCES)
+            return list(HEART_RATE_SOURCES)
+
+    def _save_sources(self, sources: Iterable[str]) -> None:
+        with open(os.path.join(self.path, SOURCES_FILE), "w") as sources_file:
+            sources_file.write("".join(f"{source}\n" for source in sources))
+
+    def _partition_path(self, day: int) -> str:
+        name = date.fromordinal(day + _EPOCH_ORDINAL).isoformat()
+        return os.path.join(self.path, name + PARTITION_SUFFIX)
+
+    def days(self) -> List[date]:
+        """Return the UTC days that have stored samples, in order."""
+        return [date.fromordinal(day + _EPOCH_ORDINAL) for day in self._partition_days()]
+
+    def _partition_days(self) -> List[int]:
+        days = []
+        for name in os.listdir(self.path):
+            if name.endswith(PARTITION_SUFFIX):
+                days.append(date.fromisoformat(name[:-len(PARTITION_SUFFIX)]).toordinal() - _EPOCH_ORDINAL)
+        return sorted(days)
+
+    def _rollup_path(self, level: str) -> str:
+        return os.path.join(self.path, level + ROLLUP_SUFFIX)
+
+    def _map(self, path: str, dtype: Any) -> Any:
+        """Return the mapped records of a file (an empty array if it has none)."""
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            size = 0
+        count = size // dtype.itemsize
+        if not count:
+            return np.empty(0, dtype=dtype)
+        cached = self._maps.get(path)
+        if cached is None or cached[0] != size:
+            # A torn trailing record (e.g. after a crash) is ignored
+            records = np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+            cached = self._maps[path] = (size, records)
+        return cached[1]
+
+    def _records(self, day: int) -> Any:
+        """Return the mapped records of a day."""
+        return self._map(self._partition_path(day), self.dtype)
+
+    @staticmethod
+    def _append_records(path: str, records: Any) -> None:
+        """Append records to a file, first dropping a torn trailing record."""
+        with open(path, "ab") as records_file:
+            torn = records_file.seek(0, os.SEEK_END) % records.dtype.itemsize
+            if torn:
+                records_file.truncate(records_file.tell() - torn)
+            records_file.write(records.tobytes())
+
+    @staticmethod
+    def _record_keys(records: Any) -> Any:
+        """Return the (timestamp, source) identity of records as sortable int64 keys."""
+        return records["timestamp"].astype("int64") * 256 + records["source"]
+
+    def _merge_day(self, day: int, part: Any) -> Any:
+        """Write the records of one day that are not stored yet.
+
+        Args:
+            day: Epoch day of the partition
+            part: Records of that day, sorted by timestamp and source
+
+        Returns:
+            The records that were written
+        """
+        keys = self._record_keys(part)
+        part = part[np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))]
+        path = self._partition_path(day)
+        stored = self._records(day)
+        if not len(stored):
+            self._append_records(path, part)
+            return part
+
+        stored_keys = self._record_keys(stored)
+        part = part[~np.isin(self._record_keys(part), stored_keys)]
+        if not len(part):
+            return part
+        if self._record_keys(part[:1])[0] > stored_keys[-1]:
+            self._append_records(path, part)
+            return part
+
+        # Late samples: rewrite the partition in (timestamp, source) order
+        merged = np.concatenate([stored, part])
+        merged = merged[np.argsort(self._record_keys(merged), kind="stable")]
+        merged.tofile(path + ".tmp")
+        os.replace(path + ".tmp", path)
+        self._maps.pop(path, None)
+        return part
+
+    def _source_codes(self, sources: Iterable[str]) -> List[int]:
+        """Return the store codes of source names, registering new sources."""
+        codes = []
+        added = False
+        for source in sources:
+            if source not in self.sources:
+                self.sources.append(source)
+                added = True
+            codes.append(self.sources.index(source))
+        if added:
+            self._save_sources(self.sources)
+        return codes
+
+    def append(self, item: Any) -> int:
+        """Append a HeartRateColumns chunk, a HeartRateSample or a raw sample dict.
+
+        Args:
+            item: Samples as yielded by ``client.heartrate.stream()``
+
+        Returns:
+            Number of samples written
+        """
+        if not isinstance(item, HeartRateColumns):
+            item = HeartRateColumns.from_dict({"data": [
+                item if isinstance(item, dict) else item.model_dump(mode="json")
+            ]})
+        if not len(item):
+            return 0
+
+        records = np.empty(len(item), dtype=self.dtype)
+        records["timestamp"] = item.timestamps
+        records["bpm"] = item.bpm
+        remap = np.asarray(self._source_codes(item.sources), dtype="uint8")
+        records["source"] = remap[np.asarray(item.source_codes, dtype="intp")]
+        records = records[np.argsort(self._record_keys(records), kind="stable")]
+
+        days = records["timestamp"] // 86400
+        bounds = np.flatnonzero(np.diff(days)) + 1
+        written = []
+        for part in np.split(records, bounds):
+            part = self._merge_day(int(part["timestamp"][0] // 86400), part)
+            if len(part):
+                written.append(part)
+        if written:
+            self._update_rollups(np.concatenate(written), self.rollups)
+        return sum(len(part) for part in written)
+
+    def _rollup_rows(self, records: Any, width: int) -> Any:
+        """Aggregate time-ordered records into rollup rows of ``width`` seconds."""
+        starts = records["timestamp"] // width * width
+        first = np.flatnonzero(np.diff(starts, prepend=starts[0] - 1))
+        bpm = records["bpm"].astype("int64")
+        rows = np.empty(len(first), dtype=self.rollup_dtype)
+        rows["start"] = starts[first]
+        rows["count"] = np.diff(np.append(first, len(records)))
+        rows["sum"] = np.add.reduceat(bpm, first)
+        rows["min"] = np.minimum.reduceat(bpm, first)
+        rows["max"] = np.maximum.reduceat(bpm, first)
+        rows["sumsq"] = np.add.reduceat(bpm * bpm, first)
+        return rows
+
+    def _update_rollups(self, records: Any, levels: Iterable[str]) -> None:
+        """Fold newly written, time-ordered records into the rollup levels.
+
+        Only samples that were not stored before are passed in, so adding
+        their counts and sums to the buckets they fall in keeps every level
+        exact, late samples included.
+
+        Buckets that already exist are updated in place and new buckets
+        after the last one are appended. New buckets that fall before it
+        (e.g. when older history is synced later) rewrite the level.
+        """
+        for level in levels:
+            path = self._rollup_path(level)
+            rows = self._rollup_rows(records, RESAMPLE_FREQUENCIES[level])
+            table = self._map(path, self.rollup_dtype)
+            if not len(table) or rows["start"][0] > table["start"][-1]:
+                self._append_records(path, rows)
+                continue
+
+            positions = np.searchsorted(table["start"], rows["start"])
+            found = positions < len(table)
+            found[found] = table["start"][positions[found]] == rows["start"][found]
+            new = rows[~found]
+            if len(new) and new["start"][0] < table["start"][-1]:
+                merged = np.concatenate([table, rows])
+                merged = _combine_rollups(merged[np.argsort(merged["start"], kind="stable")])
+                merged.tofile(path + ".tmp")
+                os.replace(path + ".tmp", path)
+                self._maps.pop(path, None)
+                continue
+
+            if found.any():
+                writable = np.memmap(path, dtype=self.rollup_dtype, mode="r+", shape=(len(table),))
+                index, update = positions[found], rows[found]
+                for field in ("count", "sum", "sumsq"):
+                    writable[field][index] += update[field]
+                writable["min"][index] = np.minimum(writable["min"][index], update["min"])
+                writable["max"][index] = np.maximum(writable["max"][index], update["max"])
+                writable.flush()
+                del writable
+            if len(new):
+                self._append_records(path, new)
+
+    def rebuild_rollups(self, levels: Optional[Iterable[str]] = None) -> None:
+        """Recompute rollup levels from the stored samples.
+
+        Args:
+            levels: Levels to rebuild; all of the store's levels when None
+        """
+        levels = self.rollups if levels is None else tuple(levels)
+        for level in levels:
+            path = self._rollup_path(level)
+            self._maps.pop(path, None)
+            open(path, "wb").close()
+        for day in self._partition_days():
+            records = self._records(day)
+            if len(records):
+                self._update_rollups(records, levels)
+
+    def extend(self, items: Iterable[Any]) -> int:
+        """Append every item of a heart rate stream.
+
+        Args:
+            items: Output of ``client.heartrate.stream()``, preferably with
+                ``columnar=True``
+
+        Returns:
+            Number of samples written
+        """
+        return sum(self.append(item) for item in items)
+
+    def views(self, start: Optional[StoreBound] = None, end: Optional[StoreBound] = None) -> Iterator[Any]:
+        """Yield the stored records in [start, end) as zero-copy NumPy views.
+
+        Each view is a structured array with ``timestamp``, ``bpm`` and
+        ``source`` fields covering (part of) one day partition, backed
+        directly by the mapped file.
+
+        Args:
+            start: First instant included: epoch seconds, ISO string,
+                datetime or date (midnight UTC); None for the first sample
+            end: First instant excluded; None for the last sample
+
+        Yields:
+            numpy structured arrays, in time order
+        """
+        first = None if start is None else _bound_seconds(start)
+        stop = None if end is None else _bound_seconds(end)
+        for day in self._partition_days():
+            if first is not None and (day + 1) * 86400 <= first:
+                continue
+            if stop is not None and day * 86400 >= stop:
+                break
+            records = self._records(day)
+            timestamps = records["timestamp"]
+            low = 0 if first is None else int(np.searchsorted(timestamps, first))
+            high = len(records) if stop is None else int(np.searchsorted(timestamps, stop))
+            if high > low:
+                yield records[low:high]
+
+    def read(self, start: Optional[StoreBound] = None, end: Optional[StoreBound] = None) -> HeartRateColumns:
+        """Return the samples in [start, end) as HeartRateColumns.
+
+        Ranges within one day are returned as views of the mapped file;
+        longer ranges are copied once into contiguous arrays.
+
+        Args:
+            start: First instant included (see :meth:`views`)
+            end: First instant excluded
+
+        Returns:
+            HeartRateColumns: timestamps (int64), bpm (int16) and source codes
+        """
+        parts = list(self.views(start, end))
+        records = parts[0] if len(parts) == 1 else np.concatenate(parts or [np.empty(0, dtype=self.dtype)])
+        return HeartRateColumns(records["timestamp"], records["bpm"], records["source"], self.sources)
+
+    def rollup(
+        self,
+        level: str = "hour",
+        start: Optional[StoreBound] = None,
+        end: Optional[StoreBound] = None
+    ) -> Any:
+        """Return the rollup rows of the buckets starting in [start, end).
+
+        Rows are a zero-copy view of the mapped rollup file, with fields
+        ``start`` (bucket start, epoch seconds), ``count``, ``sum``,
+        ``min``, ``max`` and ``sumsq`` of bpm. Buckets without samples have
+        no row. Use rollup_mean_std() for per-bucket means and deviations.
+
+        Args:
+            level: "minute", "hour" or "day"
+            start: First instant included (see :meth:`views`)
+            end: First instant excluded
+
+        Returns:
+            numpy structured array of rollup rows, in time order
+
+        Raises:
+            ValueError: If the store does not maintain the level
+        """
+        if level not in self.rollups:
+            raise ValueError(f"The store has no {level!r} rollups; it maintains {', '.join(self.rollups)}")
+        rows = self._map(self._rollup_path(level), self.rollup_dtype)
+        low = 0 if start is None else int(np.searchsorted(rows["start"], _bound_seconds(start)))
+        high = len(rows) if end is None else int(np.searchsorted(rows["start"], _bound_seconds(end)))
+        return rows[low:max(high, low)]
+
+    def __len__(self) -> int:
+        return sum(len(self._records(day)) for day in self._partition_days())
@@ -0,0 +1,137 @@
+"""Day-aligned join of the daily collections."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Iterator, NamedTuple, Optional, Tuple
+
+# Daily collections joined by daily_summary(), keyed by router attribute,
+# with the DailySummary field each one fills
+DAILY_SUMMARY_COLLECTIONS = {
+    "daily_sleep": "sleep",
+    "daily_readiness": "readiness",
+    "daily_activity": "activity",
+    "daily_stress": "stress",
+    "daily_spo2": "spo2",
+    "daily_resilience": "resilience",
+    "daily_cardiovascular_age": "cardiovascular_age",
+}
+
+# Marks an exhausted stream
+_END = object()
+
+
+class DailySummary(NamedTuple):
+    """The daily documents of one day, side by side.
+
+    Each field holds that collection's document for the day (a model, or a
+    raw dict with ``return_model=False``), or None when the collection has
+    no document for it.
+    """
+
+    day: date
+    sleep: Optional[Any] = None
+    readiness: Optional[Any] = None
+    activity: Optional[Any] = None
+    stress: Optional[Any] = None
+    spo2: Optional[Any] = None
+    resilience: Optional[Any] = None
+    cardiovascular_age: Optional[Any] = None
+
+
+def _document_day(document: Any) -> date:
+    """Return the day of a daily document, given as a model or a raw dict."""
+    day = document["day"] if isinstance(document, dict) else document.day
+    return date.fromisoformat(day) if isinstance(day, str) else day
+
+
+def _head(document: Any) -> Tuple[Any, Any]:
+    """Return the (day, document) head of a stream, or (_END, None) when exhausted."""
+    if document is _END:
+        return _END, None
+    return _document_day(document), document
+
+
+class _DayJoin:
+    """Merge-join state over streams sorted by day."""
+
+    def __init__(self):
+        self.heads: Dict[str, Tuple[Any, Any]] = {}
+
+    def next_day(self) -> Optional[date]:
+        days = [day for day, _ in self.heads.values() if day is not _END]
+        return min(days) if days else None
+
+    def take(self, day: date) -> Dict[str, Any]:
+        """Return the head documents of ``day``, keyed by field; their streams must advance."""
+        return {field: head[1] for field, head in self.heads.items() if head[0] == day}
+
+
+def merge_daily_documents(streams: Dict[str, Iterator[Any]]) -> Iterator[DailySummary]:
+    """Merge-join daily document streams on their day.
+
+    Every stream must yield documents in day order, as the routers'
+    ``stream()`` methods do. The first document of each stream is fetched
+    concurrently; after that only one document per stream is held, so
+    memory stays bounded by the streams' own page buffers. If a stream
+    yields several documents for one day, the last one is kept.
+
+    Args:
+        streams: Document iterators keyed by DailySummary field name
+
+    Yields:
+        DailySummary: One row per day present in any stream, in day order
+    """
+    join = _DayJoin()
+    iterators = {field: iter(stream) for field, stream in streams.items()}
+
+    if iterators:
+        with ThreadPoolExecutor(max_workers=len(iterators), thread_name_prefix="oura-daily-summary") as pool:
+            firsts = {field: pool.submit(next, iterator, _END) for field, iterator in iterators.items()}
+            join.heads = {field: _head(future.result()) for field, future in firsts.items()}
+
+    day = join.next_day()
+    while day is not None:
+        row = join.take(day)
+        for field in list(row):
+            head = _head(next(iterators[field], _END))
+            while head[0] == day:
+                row[field] = head[1]
+                head = _head(next(iterators[field], _END))
+            join.heads[field] = head
+        yield DailySummary(day, **row)
+        day = join.next_day()
+
+
+async def async_merge_daily_documents(streams: Dict[str, AsyncIterator[Any]]) -> AsyncIterator[DailySummary]:
+    """Async version of merge_daily_documents, for AsyncOuraClient streams.
+
+    Args:
+        streams: Async document iterators keyed by DailySummary field name
+
+    Yields:
+        DailySummary: One row per day present in any stream, in day order
+    """
+    join = _DayJoin()
+    iterators = {field: stream.__aiter__() for field, stream in streams.items()}
+
+    async def advance(field: str) -> Tuple[Any, Any]:
+        try:
+            return _head(await iterators[field].__anext__())
+        except StopAsyncIteration:
+            return _END, None
+
+    fields = list(iterators)
+    join.heads = dict(zip(fields, await asyncio.gather(*(advance(field) for field in fields))))
+
+    day = join.next_day()
+    while day is not None:
+        row = join.take(day)
+        for field in list(row):
+            head = await advance(field)
+            while head[0] == day:
+                row[field] = head[1]
+                head = await advance(field)
+            join.heads[field] = head
+        yield DailySummary(day, **row)
+        day = join.next_day()
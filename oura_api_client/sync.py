@@ -0,0 +1,298 @@
+"""Incremental synchronization of Oura collections into a local SQLite store."""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+from typing import Optional, Dict, Any, List, Iterable, Callable, Union
+
+from .utils import convert_date_to_string
+
+# Collections mirrored by OuraSync, keyed by the client router attribute
+SYNC_COLLECTIONS = (
+    "daily_activity",
+    "daily_readiness",
+    "daily_sleep",
+    "daily_spo2",
+    "daily_stress",
+    "daily_resilience",
+    "daily_cardiovascular_age",
+    "vo2_max",
+    "sleep",
+    "session",
+    "workout",
+    "tag",
+    "enhanced_tag",
+    "sleep_time",
+    "rest_mode_period",
+    "ring_configuration",
+    "heartrate",
+)
+
+# Collections that are not filtered by date and are re-fetched in full
+UNDATED_COLLECTIONS = ("ring_configuration",)
+
+
+def _document_day(document: Dict[str, Any]) -> Optional[str]:
+    """Return the ISO day a serialized document belongs to, if any."""
+    for field in ("day", "start_day"):
+        if document.get(field):
+            return str(document[field])[:10]
+    timestamp = document.get("timestamp")
+    return str(timestamp)[:10] if timestamp else None
+
+
+def _document_key(document: Dict[str, Any]) -> str:
+    """Return the unique key of a serialized document.
+
+    Heart rate samples have no ID; they are keyed on their timestamp and
+    source, as samples from different sources can share a timestamp.
+    """
+    if document.get("id"):
+        return str(document["id"])
+    return f"{document['timestamp']}|{document.get('source', '')}"
+
+
+class OuraSync:
+    """Mirror Oura usercollection endpoints into a local SQLite database.
+
+    Each collection keeps a high-water mark: the last day that was fully
+    synced. A sync only fetches the days after it, plus a trailing
+    ``recheck_days`` window because Oura may rescore recent days. The
+    stored documents of the fetched days are replaced as a whole, so
+    documents Oura deleted or re-created under a new ID (sleep periods
+    merged after rescoring, deleted tags) disappear from the store too.
+    The first sync of a collection starts at ``history_start``.
+
+    Documents are fetched through the routers' ``stream()`` methods, so
+    retries, rate limiting and response caching of the client apply. They
+    are requested as raw dicts and stored as returned by the API, without
+    a validation round trip through the models.
+
+    Example:
+        >>> with OuraSync(client, "oura.sqlite") as sync:
+        ...     sync.sync()                       # only new days after the first run
+        ...     nights = sync.documents("daily_sleep", start_date="2024-01-01")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str = ":memory:",
+        collections: Optional[Iterable[str]] = None,
+        recheck_days: int = 3,
+        history_start: Union[str, date] = date(2015, 1, 1),
+        max_workers: int = 1,
+        batch_size: int = 500,
+        today: Callable[[], date] = date.today
+    ):
+        """Initialize the sync engine.
+
+        Args:
+            client: OuraClient used to fetch documents
+            path: SQLite database file (":memory:" keeps the store in memory)
+            collections: Collections to sync (defaults to SYNC_COLLECTIONS)
+            recheck_days: Number of days before the high-water mark that are
+                fetched again on every sync
+            history_start: First day fetched when a collection was never synced
+            max_workers: Date shards fetched concurrently per collection
+            batch_size: Number of documents written per transaction
+            today: Callable returning the current date
+        """
+        if path != ":memory:":
+            path = os.path.expanduser(str(path))
+
+        self.client = client
+        self.collections = tuple(collections or SYNC_COLLECTIONS)
+        unknown = set(self.collections) - set(SYNC_COLLECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown collections: {', '.join(sorted(unknown))}")
+
+        self.recheck_days = recheck_days
+        self.history_start = date.fromisoformat(convert_date_to_string(history_start))
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._today = today
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            " collection TEXT NOT NULL,"
+            " id TEXT NOT NULL,"
+            " day TEXT,"
+            " data TEXT NOT NULL,"
+            " synced_at REAL NOT NULL,"
+            " PRIMARY KEY (collection, id));"
+            "CREATE INDEX IF NOT EXISTS documents_day ON documents (collection, day);"
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            " collection TEXT PRIMARY KEY,"
+            " high_water_mark TEXT NOT NULL,"
+            " last_synced_at REAL NOT NULL);"
+        )
+        self._connection.commit()
+
+    def high_water_mark(self, collection: str) -> Optional[date]:
+        """Return the last fully synced day of a collection, or None if never synced."""
+        row = self._connection.execute(
+            "SELECT high_water_mark FROM sync_state WHERE collection = ?", (collection,)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+
+    def sync_window(self, collection: str) -> Dict[str, date]:
+        """Return the date range the next sync of a collection will fetch.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            dict: ``start_date`` and ``end_date`` of the next sync
+        """
+        today = self._today()
+        mark = self.high_water_mark(collection)
+        if mark is None:
+            start = self.history_start
+        else:
+            start = max(self.history_start, min(mark, today) - timedelta(days=self.recheck_days))
+        return {"start_date": start, "end_date": today}
+
+    def sync(self, collections: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Sync collections incrementally.
+
+        Args:
+            collections: Collections to sync (defaults to those given at init)
+
+        Returns:
+            dict: Number of documents written per collection
+        """
+        return {
+            collection: self.sync_collection(collection)
+            for collection in (collections or self.collections)
+        }
+
+    def sync_collection(self, collection: str) -> int:
+        """Fetch new and recently changed documents of one collection.
+
+        The stored documents of the window's days are deleted and the
+        fetched ones written in a single transaction, together with the new
+        high-water mark. An interrupted sync is rolled back and simply
+        resumed by the next one.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            int: Number of documents written
+        """
+        if collection not in SYNC_COLLECTIONS:
+            raise ValueError(f"Unknown collection: {collection}")
+
+        router = getattr(self.client, collection)
+        window = self.sync_window(collection)
+        if collection in UNDATED_COLLECTIONS:
+            documents = router.stream(return_model=False)
+        else:
+            documents = router.stream(
+                start_date=window["start_date"],
+                end_date=window["end_date"],
+                max_workers=self.max_workers,
+                return_model=False
+            )
+
+        written = 0
+        try:
+            if collection in UNDATED_COLLECTIONS:
+                self._connection.execute("DELETE FROM documents WHERE collection = ?", (collection,))
+            else:
+                self._connection.execute(
+                    "DELETE FROM documents WHERE collection = ? AND day >= ? AND day <= ?",
+                    (collection, window["start_date"].isoformat(), window["end_date"].isoformat())
+                )
+            batch: List[Dict[str, Any]] = []
+            for document in documents:
+                if not isinstance(document, dict):
+                    document = document.model_dump(mode="json", by_alias=True)
+                batch.append(document)
+                if len(batch) >= self.batch_size:
+                    written += self._write(collection, batch)
+                    batch = []
+            written += self._write(collection, batch)
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state (collection, high_water_mark, last_synced_at)"
+                " VALUES (?, ?, ?)",
+                (collection, window["end_date"].isoformat(), time.time())
+            )
+            self._connection.commit()
+        except BaseException:
+            self._connection.rollback()
+            raise
+        return written
+
+    def _write(self, collection: str, documents: List[Dict[str, Any]]) -> int:
+        """Upsert serialized documents in the current transaction."""
+        if not documents:
+            return 0
+        now = time.time()
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO documents (collection, id, day, data, synced_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [
+                (collection, _document_key(document), _document_day(document),
+                 json.dumps(document, separators=(",", ":")), now)
+                for document in documents
+            ]
+        )
+        return len(documents)
+
+    def documents(
+        self,
+        collection: str,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None
+    ) -> List[Dict[str, Any]]:
+        """Read synced documents from the local store.
+
+        Args:
+            collection: Collection name
+            start_date: Optional first day to include
+            end_date: Optional last day to include
+
+        Returns:
+            list: Documents as returned by the API, ordered by day
+        """
+        query = "SELECT data FROM documents WHERE collection = ?"
+        args: List[Any] = [collection]
+        if start_date:
+            query += " AND day >= ?"
+            args.append(convert_date_to_string(start_date))
+        if end_date:
+            query += " AND day <= ?"
+            args.append(convert_date_to_string(end_date))
+        query += " ORDER BY day, id"
+        return [json.loads(row[0]) for row in self._connection.execute(query, args)]
+
+    def count(self, collection: str) -> int:
+        """Return the number of synced documents in a collection."""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM documents WHERE collection = ?", (collection,)
+        ).fetchone()[0]
+
+    def reset(self, collection: Optional[str] = None) -> None:
+        """Forget synced documents and high-water marks (of one or all collections)."""
+        if collection is None:
+            self._connection.execute("DELETE FROM documents")
+            self._connection.execute("DELETE FROM sync_state")
+        else:
+            self._connection.execute("DELETE FROM documents WHERE collection = ?", (collection,))
+            self._connection.execute("DELETE FROM sync_state WHERE collection = ?", (collection,))
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "OuraSync":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
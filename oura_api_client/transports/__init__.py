@@ -0,0 +1,30 @@
+"""Pluggable HTTP transports for the Oura API clients."""
+
+from .base import (
+    Transport,
+    AsyncTransport,
+    TransportResponse,
+    TransportError,
+    TransportTimeoutError,
+    TransportConnectionError
+)
+from .requests_transport import RequestsTransport
+from .urllib3_transport import Urllib3Transport
+from .httpx_transport import HttpxTransport, AsyncHttpxTransport
+from .replay import ReplayTransport, AsyncReplayTransport, RecordingTransport
+
+__all__ = [
+    "Transport",
+    "AsyncTransport",
+    "TransportResponse",
+    "TransportError",
+    "TransportTimeoutError",
+    "TransportConnectionError",
+    "RequestsTransport",
+    "Urllib3Transport",
+    "HttpxTransport",
+    "AsyncHttpxTransport",
+    "ReplayTransport",
+    "AsyncReplayTransport",
+    "RecordingTransport"
+]
@@ -0,0 +1,142 @@
+"""Transport interfaces shared by the sync and async Oura clients."""
+
+import json
+from typing import Optional, Dict, Any, Mapping
+
+from requests.structures import CaseInsensitiveDict
+
+
+class TransportError(Exception):
+    """Raised by a transport when a request could not be completed.
+
+    Attributes:
+        response: HTTP response attached to the failure, if any
+    """
+
+    def __init__(self, message: str, response: Optional[Any] = None):
+        super().__init__(message)
+        self.response = response
+
+
+class TransportTimeoutError(TransportError):
+    """Raised by a transport when a request times out."""
+    pass
+
+
+class TransportConnectionError(TransportError):
+    """Raised by a transport when the connection to the server fails."""
+    pass
+
+
+class TransportResponse:
+    """Library-neutral HTTP response returned by transports.
+
+    Exposes the subset of the ``requests.Response`` interface that the
+    clients and ``create_api_error`` rely on (``ok``, ``status_code``,
+    ``reason``, ``headers``, ``content`` and ``json()``), so error mapping
+    behaves identically whichever HTTP library produced the response.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+        reason: str = ""
+    ):
+        """Initialize a TransportResponse.
+
+        Args:
+            status_code: HTTP status code
+            content: Raw response body
+            headers: Response headers (looked up case-insensitively)
+            reason: HTTP reason phrase
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.reason = reason
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code indicates success (< 400)."""
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return json.loads(self.content)
+
+
+class Transport:
+    """Interface for synchronous HTTP transports used by OuraClient.
+
+    A transport sends one HTTP request and returns a response object that
+    offers ``ok``, ``status_code``, ``reason``, ``headers``, ``content`` and
+    ``json()`` (for example a TransportResponse). Timeouts must be raised as
+    TransportTimeoutError and network failures as TransportConnectionError;
+    HTTP error statuses are returned, not raised, so that the client maps
+    them onto the OuraAPIError hierarchy.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send an HTTP request.
+
+        Args:
+            method: Upper-case HTTP method
+            url: Full URL to request
+            headers: Request headers
+            params: Query parameters
+            json_data: JSON data for the request body
+            timeout: Request timeout in seconds
+
+        Returns:
+            The HTTP response
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources (such as pooled connections) held by the transport."""
+        pass
+
+
+class AsyncTransport:
+    """Interface for asynchronous HTTP transports used by AsyncOuraClient.
+
+    Same contract as Transport, with coroutine ``request`` and ``aclose``.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send an HTTP request.
+
+        Args:
+            method: Upper-case HTTP method
+            url: Full URL to request
+            headers: Request headers
+            params: Query parameters
+            json_data: JSON data for the request body
+            timeout: Request timeout in seconds
+
+        Returns:
+            The HTTP response
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release any resources (such as pooled connections) held by the transport."""
+        pass
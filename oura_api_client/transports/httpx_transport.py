@@ -0,0 +1,160 @@
+"""Transports backed by ``httpx`` (optionally over HTTP/2)."""
+
+from typing import Optional, Dict, Any
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .base import (
+    Transport,
+    AsyncTransport,
+    TransportResponse,
+    TransportTimeoutError,
+    TransportConnectionError
+)
+
+
+def _require_httpx() -> None:
+    """Raise a helpful ImportError if httpx is not installed."""
+    if httpx is None:
+        raise ImportError(
+            "httpx transports require the 'httpx' package. "
+            "Install it with: pip install oura-api-client[async]"
+        )
+
+
+def _limits(pool_maxsize: int, keep_alive: bool) -> "httpx.Limits":
+    """Build httpx connection limits from the client's pool settings."""
+    return httpx.Limits(
+        max_connections=pool_maxsize,
+        max_keepalive_connections=pool_maxsize if keep_alive else 0
+    )
+
+
+def _to_transport_response(response: "httpx.Response") -> TransportResponse:
+    """Convert an httpx response into a TransportResponse."""
+    return TransportResponse(
+        response.status_code,
+        response.content,
+        response.headers,
+        response.reason_phrase
+    )
+
+
+def _request_kwargs(
+    headers: Dict[str, str],
+    params: Optional[Dict[str, Any]],
+    json_data: Optional[Dict[str, Any]],
+    timeout: Optional[float]
+) -> Dict[str, Any]:
+    """Build keyword arguments for ``httpx.Client.request``."""
+    return {
+        "headers": headers,
+        "params": params,
+        "json": json_data,
+        "timeout": timeout,
+    }
+
+
+class HttpxTransport(Transport):
+    """Send requests through a synchronous ``httpx.Client``."""
+
+    def __init__(
+        self,
+        client: Optional["httpx.Client"] = None,
+        http2: bool = False,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True
+    ):
+        """Initialize the transport.
+
+        Args:
+            client: Pre-configured httpx client to use; it stays owned
+                by the caller and is not closed by close()
+            http2: Whether to negotiate HTTP/2 (requires the 'h2' package)
+            pool_maxsize: Maximum number of pooled connections
+            keep_alive: Whether to reuse connections between requests
+        """
+        _require_httpx()
+        self._owns_client = client is None
+        self.client = client or httpx.Client(
+            http2=http2, limits=_limits(pool_maxsize, keep_alive)
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> TransportResponse:
+        """Send an HTTP request through the httpx client."""
+        try:
+            response = self.client.request(
+                method, url, **_request_kwargs(headers, params, json_data, timeout)
+            )
+        except httpx.TimeoutException as e:
+            raise TransportTimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise TransportConnectionError(str(e)) from e
+        return _to_transport_response(response)
+
+    def close(self) -> None:
+        """Close the httpx client, unless the caller passed it in."""
+        if self._owns_client:
+            self.client.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """Send requests through an ``httpx.AsyncClient`` (AsyncOuraClient default)."""
+
+    def __init__(
+        self,
+        client: Optional["httpx.AsyncClient"] = None,
+        http2: bool = False,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True
+    ):
+        """Initialize the transport.
+
+        Args:
+            client: Pre-configured httpx async client to use; it stays owned
+                by the caller and is not closed by aclose()
+            http2: Whether to negotiate HTTP/2 (requires the 'h2' package)
+            pool_maxsize: Maximum number of pooled connections
+            keep_alive: Whether to reuse connections between requests
+        """
+        _require_httpx()
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            http2=http2, limits=_limits(pool_maxsize, keep_alive)
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> TransportResponse:
+        """Send an HTTP request through the httpx async client."""
+        try:
+            response = await self.client.request(
+                method, url, **_request_kwargs(headers, params, json_data, timeout)
+            )
+        except httpx.TimeoutException as e:
+            raise TransportTimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise TransportConnectionError(str(e)) from e
+        return _to_transport_response(response)
+
+    async def aclose(self) -> None:
+        """Close the httpx async client, unless the caller passed it in."""
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,194 @@
+"""In-process transports that record and replay HTTP traffic."""
+
+import json
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+from .base import Transport, AsyncTransport, TransportResponse, TransportError
+
+RecordKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def _record_key(method: str, url: str, params: Optional[Dict[str, Any]]) -> RecordKey:
+    """Build the lookup key for a request (method, URL and sorted params)."""
+    normalized_params = tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), url, normalized_params)
+
+
+class _ReplayStore:
+    """Recorded responses shared by the sync and async replay transports."""
+
+    def __init__(self, recordings: Optional[Iterable[Dict[str, Any]]] = None):
+        """Initialize the store.
+
+        Args:
+            recordings: Recorded exchanges as produced by ``save`` or
+                RecordingTransport.recordings
+        """
+        self._responses: Dict[RecordKey, List[Dict[str, Any]]] = {}
+        self.recordings: List[Dict[str, Any]] = []
+        self.calls: List[Dict[str, Any]] = []
+        for recording in recordings or []:
+            self._add_recording(dict(recording))
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        status_code: int = 200,
+        json_body: Any = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        reason: str = "",
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Register a canned response.
+
+        Responses registered for the same request are served in order; the
+        last one keeps being served once the others are used up.
+
+        Args:
+            method: HTTP method
+            url: Full URL, without query string
+            status_code: HTTP status code to return
+            json_body: Body to serialize as JSON
+            content: Raw body (used when json_body is not given)
+            headers: Response headers
+            reason: HTTP reason phrase
+            params: Query parameters the request must carry
+        """
+        if json_body is not None:
+            content = json.dumps(json_body).encode("utf-8")
+        self._add_recording({
+            "method": method.upper(),
+            "url": url,
+            "params": {k: str(v) for k, v in (params or {}).items()},
+            "status_code": status_code,
+            "headers": dict(headers or {}),
+            "reason": reason,
+            "body": (content or b"").decode("utf-8"),
+        })
+
+    def _add_recording(self, recording: Dict[str, Any]) -> None:
+        self.recordings.append(recording)
+        key = _record_key(recording["method"], recording["url"], recording.get("params"))
+        self._responses.setdefault(key, []).append(recording)
+
+    def _respond(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]]
+    ) -> TransportResponse:
+        self.calls.append({"method": method, "url": url, "params": params, "json": json_data})
+        queue = self._responses.get(_record_key(method, url, params))
+        if not queue:
+            raise TransportError(f"No recorded response for {method} {url} {params or {}}")
+        recording = queue.pop(0) if len(queue) > 1 else queue[0]
+        return TransportResponse(
+            recording["status_code"],
+            recording.get("body", "").encode("utf-8"),
+            recording.get("headers"),
+            recording.get("reason", "")
+        )
+
+    def save(self, path: str) -> None:
+        """Write all recordings to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.recordings, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str):
+        """Create a replay transport from a JSON file written by ``save``."""
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+
+class ReplayTransport(_ReplayStore, Transport):
+    """Serve recorded responses without touching the network.
+
+    Useful for deterministic tests and for benchmarking parsing and client
+    overhead independently of network latency.
+
+    Example:
+        >>> transport = ReplayTransport()
+        >>> transport.add("GET", "https://api.ouraring.com/v2/usercollection/tag",
+        ...               json_body={"data": [], "next_token": None})
+        >>> client = OuraClient("token", transport=transport)
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> TransportResponse:
+        """Return the recorded response for the request."""
+        return self._respond(method, url, params, json_data)
+
+
+class AsyncReplayTransport(_ReplayStore, AsyncTransport):
+    """Asynchronous counterpart of ReplayTransport for AsyncOuraClient."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> TransportResponse:
+        """Return the recorded response for the request."""
+        return self._respond(method, url, params, json_data)
+
+
+class RecordingTransport(Transport):
+    """Wrap another transport and record every exchange for later replay."""
+
+    def __init__(self, transport: Transport):
+        """Initialize the recorder.
+
+        Args:
+            transport: Transport that performs the real requests
+        """
+        self.transport = transport
+        self.store = _ReplayStore()
+
+    @property
+    def recordings(self) -> List[Dict[str, Any]]:
+        """Exchanges recorded so far."""
+        return self.store.recordings
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Forward the request and record its response."""
+        response = self.transport.request(method, url, headers, params, json_data, timeout)
+        self.store.add(
+            method,
+            url,
+            status_code=response.status_code,
+            content=response.content,
+            headers=dict(response.headers),
+            reason=response.reason,
+            params=params,
+        )
+        return response
+
+    def save(self, path: str) -> None:
+        """Write all recordings to a JSON file loadable by ReplayTransport.load."""
+        self.store.save(path)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
@@ -0,0 +1,58 @@
+"""Transport backed by a pooled ``requests`` session (the default)."""
+
+from typing import Optional, Dict, Any
+
+import requests
+
+from .base import Transport, TransportError, TransportTimeoutError, TransportConnectionError
+from ..utils.session import create_session
+
+
+class RequestsTransport(Transport):
+    """Send requests through a persistent ``requests.Session``."""
+
+    def __init__(self, session: Optional[requests.Session] = None, **pool_options: Any):
+        """Initialize the transport.
+
+        Args:
+            session: Pre-configured session to use; it stays owned by the
+                caller and is not closed by close()
+            **pool_options: Options for create_session when no session is given
+                (pool_connections, pool_maxsize, keep_alive, pool_block)
+        """
+        self._owns_session = session is None
+        self.session = session or create_session(**pool_options)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        """Send an HTTP request through the session.
+
+        requests.Response already satisfies the transport response contract,
+        so it is returned unchanged.
+        """
+        kwargs: Dict[str, Any] = {"headers": headers, "params": params}
+        if json_data is not None:
+            kwargs["json"] = json_data
+        kwargs["timeout"] = timeout
+
+        send = getattr(self.session, method.lower())
+        try:
+            return send(url, **kwargs)
+        except requests.exceptions.Timeout as e:
+            raise TransportTimeoutError(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise TransportConnectionError(str(e)) from e
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e), response=getattr(e, 'response', None)) from e
+
+    def close(self) -> None:
+        """Close the session and its pooled connections, unless the caller passed it in."""
+        if self._owns_session:
+            self.session.close()
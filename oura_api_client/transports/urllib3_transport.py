@@ -0,0 +1,80 @@
+"""Transport backed by a bare ``urllib3`` connection pool."""
+
+import json
+from typing import Optional, Dict, Any
+from urllib.parse import urlencode
+
+import urllib3
+
+from .base import Transport, TransportResponse, TransportTimeoutError, TransportConnectionError
+
+
+class Urllib3Transport(Transport):
+    """Send requests through a ``urllib3.PoolManager``.
+
+    Skips the session, hook and adapter layers of ``requests`` while keeping
+    persistent, pooled connections.
+    """
+
+    def __init__(
+        self,
+        pool_manager: Optional[urllib3.PoolManager] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False
+    ):
+        """Initialize the transport.
+
+        Args:
+            pool_manager: Pre-configured pool manager to use; it stays owned
+                by the caller and is not cleared by close()
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Whether to wait for a free connection when the pool is exhausted
+        """
+        self._owns_pool_manager = pool_manager is None
+        self.pool_manager = pool_manager or urllib3.PoolManager(
+            num_pools=pool_connections,
+            maxsize=pool_maxsize,
+            block=pool_block
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> TransportResponse:
+        """Send an HTTP request through the pool manager."""
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+        body = json.dumps(json_data).encode("utf-8") if json_data is not None else None
+
+        try:
+            response = self.pool_manager.request(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=urllib3.Timeout(total=timeout),
+                retries=False,
+            )
+        except urllib3.exceptions.TimeoutError as e:
+            raise TransportTimeoutError(str(e)) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise TransportConnectionError(str(e)) from e
+
+        return TransportResponse(
+            response.status,
+            response.data,
+            dict(response.headers),
+            response.reason or ""
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections, unless the caller passed the pool manager in."""
+        if self._owns_pool_manager:
+            self.pool_manager.clear()
@@ -1,15 +1,74 @@
 """Utility functions for the Oura API client."""
 
 from .query_params import build_query_params, convert_date_to_string
-from .retry import RetryConfig, retry_with_backoff, should_retry, exponential_backoff
-from .pagination import stream_paginated_data
+from .retry import (
+    RetryConfig,
+    retry_with_backoff,
+    async_retry_with_backoff,
+    should_retry,
+    exponential_backoff
+)
+from .pagination import (
+    stream_paginated_data,
+    async_stream_paginated_data,
+    iter_pages,
+    prefetch_pages,
+    async_iter_pages,
+    async_prefetch_pages,
+    StreamCursor,
+    ResumableStream,
+    AsyncResumableStream
+)
+from .sharding import split_date_range, stream_sharded_data, async_stream_sharded_data
+from .bulk import BulkResult, fetch_many, async_fetch_many
+from .arrays import (
+    has_numpy,
+    make_array,
+    concat_arrays,
+    epoch_seconds,
+    float_array,
+    digit_codes,
+    sample_times
+)
+from .rate_limit import RateLimiter
+from .cache import ResponseCache
+from .json_decoding import JSONDecoder, JSON_DECODERS, get_json_decoder
+from .session import create_session
 
 __all__ = [
     "build_query_params",
     "convert_date_to_string",
     "RetryConfig",
     "retry_with_backoff",
+    "async_retry_with_backoff",
     "should_retry",
     "exponential_backoff",
-    "stream_paginated_data"
+    "RateLimiter",
+    "ResponseCache",
+    "JSONDecoder",
+    "JSON_DECODERS",
+    "get_json_decoder",
+    "stream_paginated_data",
+    "async_stream_paginated_data",
+    "iter_pages",
+    "prefetch_pages",
+    "async_iter_pages",
+    "async_prefetch_pages",
+    "StreamCursor",
+    "ResumableStream",
+    "AsyncResumableStream",
+    "split_date_range",
+    "stream_sharded_data",
+    "async_stream_sharded_data",
+    "BulkResult",
+    "fetch_many",
+    "async_fetch_many",
+    "has_numpy",
+    "make_array",
+    "concat_arrays",
+    "epoch_seconds",
+    "float_array",
+    "digit_codes",
+    "sample_times",
+    "create_session"
 ]
@@ -0,0 +1,174 @@
+"""Compact typed arrays, backed by NumPy when it is installed.
+
+NumPy is optional: without it, arrays fall back to the standard library
+``array`` module, which stores the same fixed-width values without
+per-element Python objects.
+"""
+
+import math
+import re
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Optional fractional seconds followed by an optional "Z" or +HH:MM offset
+_TIMESTAMP_SUFFIX = re.compile(r"^(?:\.\d+)?(?:(Z)|([+-])(\d{2}):?(\d{2}))?$")
+
+# Ordinal of 1970-01-01, used to turn dates into epoch days
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Maps the ASCII digits "0"-"9" to the byte values 0-9
+_DIGIT_CODES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# array module typecodes and their NumPy equivalents
+NUMPY_DTYPES = {
+    "B": "uint8",
+    "h": "int16",
+    "q": "int64",
+    "d": "float64",
+}
+
+
+def has_numpy() -> bool:
+    """Return True if NumPy is available for array-backed data."""
+    return np is not None
+
+
+def make_array(typecode: str, values: Iterable[Any]) -> Any:
+    """Build a typed array from values.
+
+    Args:
+        typecode: ``array`` module typecode ("B", "h", "q" or "d")
+        values: Values to store
+
+    Returns:
+        A NumPy array when NumPy is installed, otherwise an ``array.array``
+    """
+    if np is not None:
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        return np.array(values, dtype=NUMPY_DTYPES[typecode])
+    return array(typecode, values)
+
+
+def array_typecode(values: Any) -> str:
+    """Return the ``array`` module typecode of an array built by make_array."""
+    if np is not None and isinstance(values, np.ndarray):
+        return {dtype: code for code, dtype in NUMPY_DTYPES.items()}[values.dtype.name]
+    return values.typecode
+
+
+def concat_arrays(typecode: str, parts: Sequence[Any]) -> Any:
+    """Concatenate arrays built by make_array into one array of ``typecode``."""
+    if np is not None:
+        if not parts:
+            return np.array([], dtype=NUMPY_DTYPES[typecode])
+        return np.concatenate([np.asarray(part) for part in parts]).astype(
+            NUMPY_DTYPES[typecode], copy=False
+        )
+
+    result = array(typecode)
+    for part in parts:
+        result.extend(part if part.typecode == typecode else array(typecode, part))
+    return result
+
+
+def float_array(values: Sequence[Optional[float]]) -> Any:
+    """Build a float64 array from values, storing missing (None) values as NaN.
+
+    Args:
+        values: Numbers, with None for missing samples
+
+    Returns:
+        A float64 array as built by make_array("d", ...)
+    """
+    if np is not None:
+        return np.array(values, dtype="float64")
+    return array("d", (math.nan if value is None else value for value in values))
+
+
+def digit_codes(text: str) -> Any:
+    """Decode a string of digits (e.g. "1122334") into a uint8 array of their values.
+
+    The conversion is a single ``bytes.translate`` call, without a Python
+    loop over the characters.
+
+    Args:
+        text: String made of the characters "0" to "9"
+
+    Returns:
+        A uint8 array as built by make_array("B", ...)
+    """
+    codes = text.encode("ascii").translate(_DIGIT_CODES)
+    if np is not None:
+        return np.frombuffer(codes, dtype="uint8").copy()
+    return array("B", codes)
+
+
+def sample_times(start: float, interval: float, count: int) -> Any:
+    """Compute the times of evenly spaced samples.
+
+    Args:
+        start: Time of the first sample, in epoch seconds
+        interval: Seconds between samples
+        count: Number of samples
+
+    Returns:
+        A float64 array of ``start + i * interval`` for each sample
+    """
+    if np is not None:
+        return start + np.arange(count, dtype="float64") * interval
+    return array("d", (start + index * interval for index in range(count)))
+
+
+def _utc_correction(suffix: str) -> int:
+    """Return the seconds to add to a local time to get UTC for a timestamp suffix."""
+    match = _TIMESTAMP_SUFFIX.match(suffix)
+    if match is None:
+        raise ValueError(f"Unsupported timestamp suffix: {suffix!r}")
+    if not match.group(2):
+        return 0
+    offset = int(match.group(3)) * 3600 + int(match.group(4)) * 60
+    return -offset if match.group(2) == "+" else offset
+
+
+def epoch_seconds(timestamps: List[str]) -> Any:
+    """Convert ISO 8601 timestamps into an int64 array of epoch seconds.
+
+    Timestamps must start with "YYYY-MM-DDTHH:MM:SS"; fractional seconds are
+    truncated and timestamps without an offset are read as UTC. The UTC
+    offset is parsed once per distinct suffix, and with NumPy the date and
+    time parts are converted in a single vectorized step.
+
+    Args:
+        timestamps: ISO 8601 timestamp strings
+
+    Returns:
+        Epoch seconds as built by make_array("q", ...)
+    """
+    suffixes = [timestamp[19:] for timestamp in timestamps]
+    corrections: Dict[str, int] = {suffix: _utc_correction(suffix) for suffix in set(suffixes)}
+
+    if np is not None:
+        local = np.array(
+            [timestamp[:19] for timestamp in timestamps], dtype="datetime64[s]"
+        ).astype("int64")
+        if len(corrections) == 1:
+            return local + next(iter(corrections.values()))
+        return local + np.array([corrections[suffix] for suffix in suffixes], dtype="int64")
+
+    day_seconds: Dict[str, int] = {}
+    result = array("q")
+    for timestamp, suffix in zip(timestamps, suffixes):
+        day = timestamp[:10]
+        seconds = day_seconds.get(day)
+        if seconds is None:
+            seconds = day_seconds[day] = (date.fromisoformat(day).toordinal() - _EPOCH_ORDINAL) * 86400
+        clock = int(timestamp[11:13]) * 3600 + int(timestamp[14:16]) * 60 + int(timestamp[17:19])
+        result.append(seconds + clock + corrections[suffix])
+    return result
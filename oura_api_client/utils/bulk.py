@@ -0,0 +1,133 @@
+"""Concurrent lookup of many documents by ID.
+
+Single-document endpoints take one ID per request, so fetching a batch of
+them (for example the documents named by a burst of webhook notifications)
+is one round trip per ID. These helpers run the lookups concurrently, at
+most ``max_concurrency`` at a time, over the client's pooled connections.
+A failed lookup does not abort the batch; its error is collected instead.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from ..exceptions import OuraAPIError
+
+# Errors collected per ID; anything else is a bug and propagates. Model
+# validation errors (pydantic and msgspec) are ValueErrors.
+LOOKUP_ERRORS = (OuraAPIError, ValueError)
+
+
+class BulkResult(NamedTuple):
+    """Documents fetched by ID, in the order the IDs were given.
+
+    ``documents`` holds one entry per requested ID, None where the lookup
+    failed; ``errors`` maps each failed ID to its exception.
+    """
+
+    documents: List[Optional[Any]]
+    errors: Dict[str, Exception]
+
+    @property
+    def ok(self) -> bool:
+        """True when every lookup succeeded."""
+        return not self.errors
+
+
+def _unique(ids: Iterable[str]) -> List[str]:
+    """Return the IDs in order, once each."""
+    return list(dict.fromkeys(ids))
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
+
+
+def fetch_many(
+    fetch_function: Callable[..., Any],
+    ids: Iterable[str],
+    max_concurrency: int = 8,
+    **kwargs: Any
+) -> BulkResult:
+    """
+    Fetch documents by ID using a bounded pool of worker threads.
+
+    Each distinct ID is requested once, even if it is given several times.
+
+    Args:
+        fetch_function: Single-document endpoint method, called with the ID
+        ids: Document IDs
+        max_concurrency: Maximum number of lookups in flight
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Returns:
+        BulkResult: Documents in input order and the errors of failed IDs
+    """
+    _check_concurrency(max_concurrency)
+    ids = list(ids)
+    results: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+
+    def fetch(document_id: str) -> None:
+        try:
+            results[document_id] = fetch_function(document_id, **kwargs)
+        except LOOKUP_ERRORS as e:
+            errors[document_id] = e
+
+    unique_ids = _unique(ids)
+    if len(unique_ids) == 1:
+        fetch(unique_ids[0])
+    elif unique_ids:
+        workers = min(max_concurrency, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="oura-bulk") as executor:
+            for future in [executor.submit(fetch, document_id) for document_id in unique_ids]:
+                future.result()
+
+    return BulkResult(
+        [results.get(document_id) for document_id in ids],
+        {document_id: errors[document_id] for document_id in unique_ids if document_id in errors}
+    )
+
+
+async def async_fetch_many(
+    fetch_function: Callable[..., Awaitable[Any]],
+    ids: Iterable[str],
+    max_concurrency: int = 8,
+    **kwargs: Any
+) -> BulkResult:
+    """
+    Asynchronously fetch documents by ID.
+
+    Async counterpart of fetch_many; lookups run as tasks, at most
+    ``max_concurrency`` at a time.
+
+    Args:
+        fetch_function: Async single-document endpoint method
+        ids: Document IDs
+        max_concurrency: Maximum number of lookups in flight
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Returns:
+        BulkResult: Documents in input order and the errors of failed IDs
+    """
+    _check_concurrency(max_concurrency)
+    ids = list(ids)
+    results: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(document_id: str) -> None:
+        async with semaphore:
+            try:
+                results[document_id] = await fetch_function(document_id, **kwargs)
+            except LOOKUP_ERRORS as e:
+                errors[document_id] = e
+
+    unique_ids = _unique(ids)
+    await asyncio.gather(*(fetch(document_id) for document_id in unique_ids))
+
+    return BulkResult(
+        [results.get(document_id) for document_id in ids],
+        {document_id: errors[document_id] for document_id in unique_ids if document_id in errors}
+    )
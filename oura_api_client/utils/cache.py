@@ -0,0 +1,316 @@
+"""Persistent SQLite-backed cache for Oura API responses."""
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from typing import Optional, Dict, Any, Callable, Union
+from urllib.parse import urlencode
+
+# TTL policy: seconds, or a callable computing seconds from (endpoint, params)
+TTLPolicy = Union[float, Callable[[str, Dict[str, Any]], float]]
+
+
+class ResponseCache:
+    """Cache GET response bodies in a SQLite database.
+
+    Entries are keyed on a namespace, the normalized endpoint and the
+    sorted query parameters. Clients use a hash of their ``Authorization``
+    header as the namespace, so clients with different access tokens can
+    share one cache without seeing each other's data.
+
+    How long an entry stays fresh depends on the data it holds:
+
+    - Collection queries whose ``end_date`` is older than ``recent_days``
+      days cover closed days that no longer change and are kept for
+      ``historical_ttl`` seconds.
+    - Everything else (ranges reaching today or yesterday, open-ended
+      ranges, single documents, personal info) is kept for ``recent_ttl``.
+    - ``endpoint_ttls`` overrides the TTL for endpoints starting with a
+      given prefix; a TTL of 0 disables caching for them.
+
+    The total size of the stored bodies is capped at ``max_size`` bytes by
+    evicting the least recently used entries. Only endpoints under
+    ``/usercollection/`` are cached by default.
+
+    Example:
+        >>> cache = ResponseCache("~/.cache/oura.sqlite")
+        >>> client = OuraClient("token", cache=cache)
+    """
+
+    DEFAULT_PREFIXES = ("/usercollection/",)
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_size: int = 100 * 1024 * 1024,
+        historical_ttl: float = 30 * 24 * 3600,
+        recent_ttl: float = 300,
+        recent_days: int = 2,
+        endpoint_ttls: Optional[Dict[str, TTLPolicy]] = None,
+        clock: Callable[[], float] = time.time,
+        today: Callable[[], date] = date.today
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (":memory:" keeps the cache in memory)
+            max_size: Maximum total size of cached bodies in bytes
+            historical_ttl: Seconds to keep responses that only cover closed days
+            recent_ttl: Seconds to keep all other responses
+            recent_days: Number of most recent days (today included) that are
+                still considered open
+            endpoint_ttls: TTL overrides by endpoint prefix, in seconds or as a
+                callable taking (endpoint, params)
+            clock: Wall clock returning epoch seconds
+            today: Callable returning the current date
+        """
+        if path != ":memory:":
+            path = os.path.expanduser(str(path))
+
+        self.max_size = max_size
+        self.historical_ttl = historical_ttl
+        self.recent_ttl = recent_ttl
+        self.recent_days = recent_days
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._today = today
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " endpoint TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._connection.commit()
+        self._size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def namespace_for(authorization: str) -> str:
+        """Return the cache namespace of an Authorization header value.
+
+        Only a hash is stored, never the token itself.
+        """
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None, namespace: str = "") -> str:
+        """Build the cache key for an endpoint and its query parameters."""
+        key = endpoint
+        if params:
+            key = f"{endpoint}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+        return f"{namespace}:{key}" if namespace else key
+
+    def ttl_for(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> float:
+        """Return how many seconds a response for this request stays fresh.
+
+        Args:
+            endpoint: Normalized endpoint path
+            params: Query parameters of the request
+
+        Returns:
+            TTL in seconds (0 means the response is not cached)
+        """
+        params = params or {}
+        matches = [prefix for prefix in self.endpoint_ttls if endpoint.startswith(prefix)]
+        if matches:
+            policy = self.endpoint_ttls[max(matches, key=len)]
+            return policy(endpoint, params) if callable(policy) else policy
+
+        if not endpoint.startswith(self.DEFAULT_PREFIXES):
+            return 0
+
+        end_date = params.get("end_date")
+        if end_date:
+            try:
+                last_day = date.fromisoformat(str(end_date)[:10])
+            except ValueError:
+                return self.recent_ttl
+            if last_day <= self._today() - timedelta(days=self.recent_days):
+                return self.historical_ttl
+        return self.recent_ttl
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        namespace: str = ""
+    ) -> Optional[bytes]:
+        """Return the cached JSON body of a request, or None if absent or expired.
+
+        The body is returned as stored, so the client decodes hits with the
+        same JSON decoder as responses fetched from the API.
+
+        Args:
+            endpoint: Normalized endpoint path
+            params: Query parameters of the request
+            namespace: Namespace of the caller, see namespace_for
+        """
+        key = self.make_key(endpoint, params, namespace)
+        now = self._clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, size, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            body, size, expires_at = row
+            if expires_at <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+                self._size -= size
+                self.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._connection.commit()
+            self.hits += 1
+        return bytes(body)
+
+    def set(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: Union[Dict[str, Any], bytes],
+        namespace: str = ""
+    ) -> bool:
+        """Store a response according to the TTL policy.
+
+        Args:
+            endpoint: Normalized endpoint path
+            params: Query parameters of the request
+            response: Decoded JSON response, or its raw JSON body
+            namespace: Namespace of the caller, see namespace_for
+
+        Returns:
+            True if the response was stored
+        """
+        ttl = self.ttl_for(endpoint, params)
+        if ttl <= 0:
+            return False
+
+        if isinstance(response, (bytes, bytearray)):
+            body = bytes(response)
+        else:
+            body = json.dumps(response, separators=(",", ":")).encode("utf-8")
+        if len(body) > self.max_size:
+            return False
+
+        key = self.make_key(endpoint, params, namespace)
+        now = self._clock()
+        with self._lock:
+            previous = self._connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, endpoint, body, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now + ttl, now)
+            )
+            self._size += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._connection.commit()
+        return True
+
+    async def async_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        namespace: str = ""
+    ) -> Optional[bytes]:
+        """Async version of get, run in the default executor.
+
+        SQLite reads, writes and commits block, so they are kept off the
+        event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.get, endpoint, params, namespace)
+        )
+
+    async def async_set(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: Union[Dict[str, Any], bytes],
+        namespace: str = ""
+    ) -> bool:
+        """Async version of set, run in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.set, endpoint, params, response, namespace)
+        )
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the size cap is met (lock held)."""
+        while self._size > self.max_size:
+            rows = self._connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                return
+            for key, size in rows:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                if self._size <= self.max_size:
+                    return
+
+    def invalidate(self, endpoint_prefix: str = "") -> int:
+        """Remove cached responses for endpoints starting with a prefix.
+
+        Args:
+            endpoint_prefix: Endpoint prefix to remove (empty removes everything)
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE substr(endpoint, 1, ?) = ?",
+                (len(endpoint_prefix), endpoint_prefix)
+            )
+            self._connection.commit()
+            self._size = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self.invalidate()
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached bodies in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
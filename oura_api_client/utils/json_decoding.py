@@ -0,0 +1,65 @@
+"""Pluggable JSON decoders that work on raw response bytes.
+
+orjson and msgspec are optional: when neither is installed, decoding falls
+back to the standard library ``json`` module.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Decodes a JSON document from bytes
+JSONDecoder = Callable[[bytes], Any]
+
+JSON_DECODERS = ("auto", "orjson", "msgspec", "json")
+
+
+def _require(module: Any, name: str) -> None:
+    """Raise a helpful ImportError if an optional decoder is not installed."""
+    if module is None:
+        raise ImportError(
+            f"The '{name}' JSON decoder requires the '{name}' package. "
+            f"Install it with: pip install oura-api-client[{name}]"
+        )
+
+
+def get_json_decoder(decoder: Union[str, JSONDecoder] = "auto") -> JSONDecoder:
+    """Return a function decoding JSON response bodies.
+
+    Args:
+        decoder: "orjson", "msgspec" or "json" (stdlib), "auto" to use the
+            fastest installed one, or a callable taking the body bytes
+
+    Returns:
+        A callable turning JSON bytes into Python objects
+
+    Raises:
+        ImportError: If the requested decoder is not installed
+        ValueError: If the decoder name is unknown
+    """
+    if callable(decoder):
+        return decoder
+    if decoder not in JSON_DECODERS:
+        raise ValueError(
+            f"Unknown JSON decoder {decoder!r}; expected one of {', '.join(JSON_DECODERS)}"
+        )
+
+    if decoder == "auto":
+        decoder = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+    if decoder == "orjson":
+        _require(orjson, "orjson")
+        return orjson.loads
+    if decoder == "msgspec":
+        _require(msgspec, "msgspec")
+        return msgspec.json.Decoder().decode
+    return json.loads
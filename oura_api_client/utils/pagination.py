@@ -1,17 +1,134 @@
 """Pagination utilities for streaming data from Oura API endpoints."""
 
-from typing import Iterator, Callable, TypeVar, Any, Optional, Union
+import asyncio
+import queue
+import threading
+from typing import Iterator, AsyncIterator, Callable, Awaitable, TypeVar, Any, Dict, NamedTuple, Optional, Union
 from datetime import date
 
 # Type variables for generic pagination
 T = TypeVar('T')  # For individual data items
 ResponseType = TypeVar('ResponseType')  # For response objects
 
+# Marks the end of the page sequence in prefetch queues
+_END_OF_PAGES = object()
+
+
+class _PageFetchError:
+    """Carries an exception raised while prefetching to the consuming side."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def page_items(page: Any) -> Any:
+    """Return the items of a page, given as a response model or a raw dict."""
+    return page["data"] if isinstance(page, dict) else page.data
+
+
+def page_next_token(page: Any) -> Optional[str]:
+    """Return the next_token of a page, given as a response model or a raw dict."""
+    return page.get("next_token") if isinstance(page, dict) else page.next_token
+
+
+def iter_pages(
+    fetch_function: Callable[..., ResponseType],
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    next_token: Optional[str] = None,
+    **kwargs: Any
+) -> Iterator[ResponseType]:
+    """
+    Iterate over the pages of a paginated endpoint, following next_token.
+
+    Args:
+        fetch_function: The endpoint method to call (e.g., get_daily_sleep_documents)
+        start_date: Optional start date for filtering
+        end_date: Optional end date for filtering
+        next_token: Token of the first page to fetch, to continue an
+            interrupted chain (None starts from the first page)
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Yields:
+        Response objects, one per page
+    """
+    while True:
+        # Call the fetch function with current pagination token
+        response = fetch_function(
+            start_date=start_date,
+            end_date=end_date,
+            next_token=next_token,
+            **kwargs
+        )
+
+        yield response
+
+        # Check if there are more pages
+        next_token = page_next_token(response)
+        if not next_token:
+            break
+
+
+def prefetch_pages(pages: Iterator[ResponseType], prefetch: int) -> Iterator[ResponseType]:
+    """
+    Fetch pages ahead of the consumer on a background thread.
+
+    While the caller processes one page, the worker thread already requests
+    the following ones, so network latency overlaps with consumer work. At
+    most ``prefetch`` fetched pages are buffered; the worker stops as soon as
+    the consumer stops iterating, and fetch errors are re-raised in the
+    consumer at the position where they occurred.
+
+    Args:
+        pages: Page iterator to drain in the background (e.g. from iter_pages)
+        prefetch: Maximum number of pages to buffer ahead of the consumer
+
+    Yields:
+        The pages of ``pages``, in order
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Poll so that an abandoned consumer never leaves the worker blocked
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker() -> None:
+        try:
+            for page in pages:
+                if not put(page):
+                    return
+        except Exception as e:
+            put(_PageFetchError(e))
+            return
+        put(_END_OF_PAGES)
+
+    thread = threading.Thread(target=worker, name="oura-page-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END_OF_PAGES:
+                return
+            if isinstance(item, _PageFetchError):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+
 
 def stream_paginated_data(
     fetch_function: Callable[..., ResponseType],
     start_date: Optional[Union[str, date]] = None,
     end_date: Optional[Union[str, date]] = None,
+    prefetch: int = 0,
     **kwargs: Any
 ) -> Iterator[T]:
     """
@@ -24,6 +141,8 @@ def stream_paginated_data(
         fetch_function: The endpoint method to call (e.g., get_daily_sleep_documents)
         start_date: Optional start date for filtering
         end_date: Optional end date for filtering
+        prefetch: Number of pages to fetch ahead on a background thread
+            while the caller consumes the current one (0 disables prefetching)
         **kwargs: Additional parameters to pass to the fetch function
 
     Yields:
@@ -36,23 +155,351 @@ def stream_paginated_data(
         ... ):
         ...     print(sleep_record.score)
     """
-    next_token = None
+    pages = iter_pages(fetch_function, start_date=start_date, end_date=end_date, **kwargs)
+    if prefetch > 0:
+        pages = prefetch_pages(pages, prefetch)
+
+    for response in pages:
+        # Yield each individual item from the current page
+        for item in page_items(response):
+            yield item
+
+
+async def async_iter_pages(
+    fetch_function: Callable[..., Awaitable[ResponseType]],
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    next_token: Optional[str] = None,
+    **kwargs: Any
+) -> AsyncIterator[ResponseType]:
+    """
+    Asynchronously iterate over the pages of a paginated endpoint.
 
+    Args:
+        fetch_function: The async endpoint method to call
+        start_date: Optional start date for filtering
+        end_date: Optional end date for filtering
+        next_token: Token of the first page to fetch, to continue an
+            interrupted chain (None starts from the first page)
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Yields:
+        Response objects, one per page
+    """
     while True:
-        # Call the fetch function with current pagination token
-        response = fetch_function(
+        response = await fetch_function(
             start_date=start_date,
             end_date=end_date,
             next_token=next_token,
             **kwargs
         )
 
-        # Yield each individual item from the current page
-        for item in response.data:
-            yield item
+        yield response
 
-        # Check if there are more pages
-        if not response.next_token:
+        next_token = page_next_token(response)
+        if not next_token:
             break
 
-        next_token = response.next_token
+
+async def async_prefetch_pages(
+    pages: AsyncIterator[ResponseType], prefetch: int
+) -> AsyncIterator[ResponseType]:
+    """
+    Fetch pages ahead of the consumer in a background task.
+
+    Async counterpart of prefetch_pages; the task is cancelled as soon as
+    the consumer stops iterating.
+
+    Args:
+        pages: Async page iterator to drain in the background
+        prefetch: Maximum number of pages to buffer ahead of the consumer
+
+    Yields:
+        The pages of ``pages``, in order
+    """
+    buffer: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=prefetch)
+
+    async def worker() -> None:
+        try:
+            async for page in pages:
+                await buffer.put(page)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await buffer.put(_PageFetchError(e))
+            return
+        await buffer.put(_END_OF_PAGES)
+
+    task = asyncio.ensure_future(worker())
+
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _END_OF_PAGES:
+                return
+            if isinstance(item, _PageFetchError):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+
+
+async def async_stream_paginated_data(
+    fetch_function: Callable[..., Awaitable[ResponseType]],
+    start_date: Optional[Union[str, date]] = None,
+    end_date: Optional[Union[str, date]] = None,
+    prefetch: int = 0,
+    **kwargs: Any
+) -> AsyncIterator[T]:
+    """
+    Asynchronously stream all paginated data from an API endpoint.
+
+    Async counterpart of stream_paginated_data for coroutine fetch functions.
+
+    Args:
+        fetch_function: The async endpoint method to call
+        start_date: Optional start date for filtering
+        end_date: Optional end date for filtering
+        prefetch: Number of pages to fetch ahead in a background task
+            while the caller consumes the current one (0 disables prefetching)
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Yields:
+        Individual data items from the API response
+
+    Example:
+        >>> async for sleep_record in async_stream_paginated_data(
+        ...     client.daily_sleep.get_daily_sleep_documents,
+        ...     start_date="2024-01-01"
+        ... ):
+        ...     print(sleep_record.score)
+    """
+    pages = async_iter_pages(fetch_function, start_date=start_date, end_date=end_date, **kwargs)
+    if prefetch > 0:
+        pages = async_prefetch_pages(pages, prefetch)
+
+    async for response in pages:
+        for item in page_items(response):
+            yield item
+
+
+class StreamCursor(NamedTuple):
+    """Position of a stream, for resuming it after an interruption.
+
+    Cursors are plain values: ``cursor._asdict()`` is JSON-serializable and
+    ``StreamCursor(**data)`` restores it. Pass a cursor back to the same
+    ``stream()`` to continue where it left off.
+    """
+
+    endpoint: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    # Token of the page being consumed (None for the first page)
+    next_token: Optional[str] = None
+    # Items of that page already yielded
+    page_offset: int = 0
+    items_yielded: int = 0
+    completed: bool = False
+
+
+# Called with the stream's cursor each time a page has been fully consumed
+CheckpointCallback = Callable[[StreamCursor], None]
+
+
+def _date_string(value: Optional[Union[str, date]]) -> Optional[str]:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _fetch_name(fetch_function: Callable[..., Any]) -> str:
+    """Return the endpoint name a cursor is bound to (e.g. "get_daily_sleep_documents")."""
+    return getattr(fetch_function, "__name__", "")
+
+
+def _start_cursor(
+    fetch_function: Callable[..., Any],
+    start_date: Optional[Union[str, date]],
+    end_date: Optional[Union[str, date]],
+    cursor: Optional[StreamCursor]
+) -> StreamCursor:
+    """Return the cursor a stream starts from, checking that a resumed cursor matches the stream."""
+    start_date, end_date = _date_string(start_date), _date_string(end_date)
+    if cursor is None:
+        return StreamCursor(_fetch_name(fetch_function), start_date, end_date)
+    if isinstance(cursor, dict):
+        cursor = StreamCursor(**cursor)
+    if cursor.endpoint != _fetch_name(fetch_function):
+        raise ValueError(
+            f"The cursor belongs to {cursor.endpoint!r}, not {_fetch_name(fetch_function)!r}"
+        )
+    for name, value in (("start_date", start_date), ("end_date", end_date)):
+        if value is not None and value != getattr(cursor, name):
+            raise ValueError(f"The cursor's {name} is {getattr(cursor, name)!r}, not {value!r}")
+    return cursor
+
+
+class _ResumableState:
+    """Cursor bookkeeping shared by the sync and async resumable streams."""
+
+    def __init__(self, cursor: StreamCursor, checkpoint: Optional[CheckpointCallback]):
+        self.start = cursor
+        self.checkpoint = checkpoint
+        self.token = cursor.next_token
+        self.offset = cursor.page_offset
+        self.yielded = cursor.items_yielded
+        self.completed = cursor.completed
+
+    @property
+    def cursor(self) -> StreamCursor:
+        return self.start._replace(
+            next_token=self.token,
+            page_offset=self.offset,
+            items_yielded=self.yielded,
+            completed=self.completed
+        )
+
+    def page_done(self, next_token: Optional[str]) -> None:
+        """Move to the next page once the consumer has finished the current one."""
+        self.token = next_token
+        self.offset = 0
+        self.completed = not next_token
+        if self.checkpoint is not None:
+            self.checkpoint(self.cursor)
+
+
+class ResumableStream(Iterator[T]):
+    """An item stream that tracks its position as a StreamCursor.
+
+    Returned by the routers' ``stream()`` when a cursor or checkpoint
+    callback is given. ``cursor`` is the position just after the last
+    item yielded; the checkpoint callback receives the position after each
+    fully consumed page, so a stream resumed from a checkpoint repeats at
+    most the items of one page and skips none.
+
+    Example:
+        >>> stream = client.heartrate.stream(start_date="2020-01-01", checkpoint=save)
+        >>> for sample in stream:
+        ...     store(sample)
+        >>> # after a crash, continue from the last saved cursor
+        >>> stream = client.heartrate.stream(cursor=load(), checkpoint=save)
+    """
+
+    def __init__(
+        self,
+        fetch_function: Callable[..., ResponseType],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        **kwargs: Any
+    ):
+        """Initialize the stream; no request is made until iteration starts.
+
+        Args:
+            fetch_function: The endpoint method to call
+            start_date: Optional start date; defaults to the cursor's
+            end_date: Optional end date; defaults to the cursor's
+            prefetch: Number of pages to fetch ahead in the background
+            cursor: Position to resume from (a StreamCursor or its dict)
+            checkpoint: Called with the cursor after each consumed page
+            **kwargs: Additional parameters to pass to the fetch function
+
+        Raises:
+            ValueError: If the cursor belongs to another endpoint or range
+        """
+        self._state = _ResumableState(_start_cursor(fetch_function, start_date, end_date, cursor), checkpoint)
+        self._items = self._generate(fetch_function, prefetch, kwargs)
+
+    @property
+    def cursor(self) -> StreamCursor:
+        """The position just after the last item yielded."""
+        return self._state.cursor
+
+    def __iter__(self) -> "ResumableStream[T]":
+        return self
+
+    def __next__(self) -> T:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop the stream and any background prefetching."""
+        self._items.close()
+
+    def _generate(self, fetch_function: Callable[..., Any], prefetch: int, kwargs: Dict[str, Any]) -> Iterator[T]:
+        state = self._state
+        if state.completed:
+            return
+        pages = iter_pages(
+            fetch_function,
+            start_date=state.start.start_date,
+            end_date=state.start.end_date,
+            next_token=state.token,
+            **kwargs
+        )
+        if prefetch > 0:
+            pages = prefetch_pages(pages, prefetch)
+
+        for response in pages:
+            items = page_items(response)
+            for index in range(state.offset, len(items)):
+                state.offset += 1
+                state.yielded += 1
+                yield items[index]
+            state.page_done(page_next_token(response))
+
+
+class AsyncResumableStream(AsyncIterator[T]):
+    """Async counterpart of ResumableStream, for AsyncOuraClient streams."""
+
+    def __init__(
+        self,
+        fetch_function: Callable[..., Awaitable[ResponseType]],
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        prefetch: int = 0,
+        cursor: Optional[StreamCursor] = None,
+        checkpoint: Optional[CheckpointCallback] = None,
+        **kwargs: Any
+    ):
+        """Initialize the stream; see ResumableStream."""
+        self._state = _ResumableState(_start_cursor(fetch_function, start_date, end_date, cursor), checkpoint)
+        self._items = self._generate(fetch_function, prefetch, kwargs)
+
+    @property
+    def cursor(self) -> StreamCursor:
+        """The position just after the last item yielded."""
+        return self._state.cursor
+
+    def __aiter__(self) -> "AsyncResumableStream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop the stream and any background prefetching."""
+        await self._items.aclose()
+
+    async def _generate(
+        self, fetch_function: Callable[..., Awaitable[Any]], prefetch: int, kwargs: Dict[str, Any]
+    ) -> AsyncIterator[T]:
+        state = self._state
+        if state.completed:
+            return
+        pages = async_iter_pages(
+            fetch_function,
+            start_date=state.start.start_date,
+            end_date=state.start.end_date,
+            next_token=state.token,
+            **kwargs
+        )
+        if prefetch > 0:
+            pages = async_prefetch_pages(pages, prefetch)
+
+        async for response in pages:
+            items = page_items(response)
+            for index in range(state.offset, len(items)):
+                state.offset += 1
+                state.yielded += 1
+                yield items[index]
+            state.page_done(page_next_token(response))
@@ -0,0 +1,127 @@
+"""Client-side rate limiting for Oura API requests."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+# Requests sent back to back by default before pacing starts
+DEFAULT_BURST = 100
+
+
+class RateLimiter:
+    """Thread-safe token bucket that paces requests before they are sent.
+
+    The bucket holds up to ``burst`` tokens and refills continuously at
+    ``max_requests / period`` tokens per second; every request takes one
+    token. When the bucket is empty, callers reserve the next token and
+    sleep until it becomes available, so concurrent callers are served in
+    arrival order without busy waiting. The same limiter can be shared by
+    several clients (sync and async) that use one access token.
+
+    On top of the bucket, the send times of the last ``max_requests``
+    reservations are kept, so that no window of ``period`` seconds ever
+    holds more than ``max_requests`` requests, whatever the burst size.
+
+    The default budget is Oura's documented limit of 5000 requests per
+    5 minutes.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 5000,
+        period: float = 300.0,
+        burst: Optional[int] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            max_requests: Number of requests allowed per period
+            period: Length of the period in seconds
+            burst: Maximum number of requests sent back to back
+                (defaults to DEFAULT_BURST, or max_requests if smaller)
+            enabled: Whether requests are rate limited
+            clock: Monotonic clock returning seconds
+        """
+        if max_requests <= 0 or period <= 0:
+            raise ValueError("max_requests and period must be positive")
+
+        self.max_requests = max_requests
+        self.period = period
+        self.burst = burst or min(max_requests, DEFAULT_BURST)
+        self.enabled = enabled
+        self.rate = max_requests / period
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        # Send times of the most recent reservations, in order
+        self._sent: Deque[float] = deque(maxlen=max_requests)
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take tokens from the bucket without waiting.
+
+        The bucket may go into debt: the caller is then responsible for
+        waiting the returned delay before sending its request.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds to wait before the reserved tokens are available
+        """
+        if not self.enabled:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            send_at = now if self._tokens >= 0 else now - self._tokens / self.rate
+            for _ in range(tokens):
+                if self._sent:
+                    send_at = max(send_at, self._sent[-1])
+                if len(self._sent) == self.max_requests:
+                    send_at = max(send_at, self._sent[0] + self.period)
+                self._sent.append(send_at)
+            return send_at - now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block until tokens are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def async_acquire(self, tokens: int = 1) -> float:
+        """Wait without blocking the event loop until tokens are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    @property
+    def available(self) -> float:
+        """Number of tokens currently in the bucket (negative when in debt)."""
+        with self._lock:
+            elapsed = max(0.0, self._clock() - self._updated)
+            return min(float(self.burst), self._tokens + elapsed * self.rate)
@@ -2,6 +2,8 @@
 
 import time
 import random
+import asyncio
+import functools
 from typing import Callable
 from ..exceptions import OuraRateLimitError, OuraServerError, OuraConnectionError, OuraTimeoutError
 
@@ -96,10 +98,7 @@ def retry_with_backoff(
                         raise
                     
                     # Calculate delay
-                    if isinstance(e, OuraRateLimitError) and e.retry_after:
-                        delay = e.retry_after
-                    else:
-                        delay = exponential_backoff(attempt, base_delay, max_delay, jitter)
+                    delay = _retry_delay(e, attempt, base_delay, max_delay, jitter)
                     
                     # Wait before retry
                     if delay > 0:
@@ -112,6 +111,62 @@ def retry_with_backoff(
     return decorator
 
 
+def _retry_delay(exception: Exception, attempt: int, base_delay: float, max_delay: float, jitter: bool) -> float:
+    """Calculate how long to wait before retrying after an exception.
+    
+    Args:
+        exception: The exception that occurred
+        attempt: Current attempt number (0-based)
+        base_delay: Base delay for exponential backoff
+        max_delay: Maximum delay between retries
+        jitter: Whether to add random jitter
+        
+    Returns:
+        Delay in seconds
+    """
+    if isinstance(exception, OuraRateLimitError) and exception.retry_after:
+        return exception.retry_after
+    return exponential_backoff(attempt, base_delay, max_delay, jitter)
+
+
+def async_retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    jitter: bool = True
+):
+    """Decorator factory to add retry logic with exponential backoff to coroutines.
+    
+    Behaves like retry_with_backoff but waits with asyncio.sleep so the
+    event loop keeps running other tasks while a request is backing off.
+    
+    Args:
+        max_retries: Maximum number of retries
+        base_delay: Base delay for exponential backoff
+        max_delay: Maximum delay between retries
+        jitter: Whether to add random jitter
+        
+    Returns:
+        Decorator function
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):  # +1 for initial attempt
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if not should_retry(e, attempt, max_retries):
+                        raise
+                    
+                    delay = _retry_delay(e, attempt, base_delay, max_delay, jitter)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+        
+        return wrapper
+    return decorator
+
+
 class RetryConfig:
     """Configuration for retry behavior."""
     
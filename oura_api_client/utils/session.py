@@ -0,0 +1,41 @@
+"""HTTP session utilities for connection pooling."""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    keep_alive: bool = True,
+    pool_block: bool = False
+) -> requests.Session:
+    """Create a requests session backed by a persistent connection pool.
+
+    Connections are kept alive between requests so that consecutive calls
+    (for example every page of a ``stream()``) reuse the same TCP/TLS
+    connection instead of performing a new handshake each time.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        keep_alive: Whether to reuse connections between requests
+        pool_block: Whether to wait for a free connection when the pool
+            is exhausted instead of opening a temporary one
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
@@ -0,0 +1,283 @@
+"""Parallel date-range sharding for streaming paginated Oura API endpoints.
+
+The Oura API paginates with an opaque ``next_token``, so the pages of a
+single request chain can only be fetched one after another. Splitting a
+long date range into shards gives independent pagination chains that can
+be fetched concurrently; results are still yielded in chronological order.
+
+Shards are built on the assumption that the API treats ``end_date`` as
+inclusive, so consecutive shards never overlap.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import (
+    Iterator, AsyncIterator, Callable, Awaitable, Deque, List, Tuple, Any, Optional, Union
+)
+
+from .pagination import (
+    T,
+    ResponseType,
+    page_items,
+    page_next_token,
+    stream_paginated_data,
+    async_stream_paginated_data
+)
+
+DateRange = Tuple[date, date]
+
+
+def _to_date(value: Union[str, date]) -> date:
+    """Convert a date, datetime or ISO 8601 string into a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+def _item_day(item: Any) -> Optional[date]:
+    """Return the calendar day of a document (``day``, ``start_day`` or ``timestamp``)."""
+    for field in ("day", "start_day", "timestamp"):
+        value = item.get(field) if isinstance(item, dict) else getattr(item, field, None)
+        if value:
+            try:
+                return _to_date(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def split_date_range(
+    start_date: Union[str, date],
+    end_date: Union[str, date],
+    shard_days: int
+) -> List[DateRange]:
+    """
+    Split an inclusive date range into consecutive, non-overlapping shards.
+
+    Args:
+        start_date: First day of the range
+        end_date: Last day of the range (inclusive)
+        shard_days: Number of days per shard (the last shard may be shorter)
+
+    Returns:
+        List of (start, end) date pairs in chronological order
+
+    Example:
+        >>> split_date_range("2024-01-01", "2024-01-04", 2)
+        [(datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)),
+         (datetime.date(2024, 1, 3), datetime.date(2024, 1, 4))]
+    """
+    if shard_days < 1:
+        raise ValueError("shard_days must be at least 1")
+
+    start, end = _to_date(start_date), _to_date(end_date)
+    shards = []
+    while start <= end:
+        shard_end = min(start + timedelta(days=shard_days - 1), end)
+        shards.append((start, shard_end))
+        start = shard_end + timedelta(days=1)
+    return shards
+
+
+def _split_probe(page: Any, start: date, end: date) -> Tuple[List[Any], Optional[date], int]:
+    """Split a probe page into complete items and the day to resume from.
+
+    The last day seen on a page with a ``next_token`` may continue on the
+    next page, so only items before that day are kept. The number of days
+    the page covered is the estimated page density used to size shards.
+
+    Returns:
+        Tuple of (items to keep, day to resume from, days per shard); the
+        resume day is None when items carry no recognizable date
+    """
+    days = [_item_day(item) for item in page_items(page)]
+    if not days or days[-1] is None:
+        return [], None, 0
+
+    resume_day = min(max(days[-1], start), end)
+    kept = [item for item, day in zip(page_items(page), days) if day is not None and day < resume_day]
+    return kept, resume_day, max(1, (resume_day - start).days)
+
+
+def _resume_from(fetch_function: Callable[..., Any], next_token: str) -> Callable[..., Any]:
+    """Wrap a fetch function so that its first call continues from ``next_token``."""
+    state = {"first": True}
+
+    def fetch(**kwargs: Any) -> Any:
+        if state["first"]:
+            state["first"] = False
+            kwargs["next_token"] = next_token
+        return fetch_function(**kwargs)
+
+    return fetch
+
+
+def _async_resume_from(
+    fetch_function: Callable[..., Awaitable[Any]], next_token: str
+) -> Callable[..., Awaitable[Any]]:
+    """Async counterpart of _resume_from."""
+    state = {"first": True}
+
+    async def fetch(**kwargs: Any) -> Any:
+        if state["first"]:
+            state["first"] = False
+            kwargs["next_token"] = next_token
+        return await fetch_function(**kwargs)
+
+    return fetch
+
+
+def stream_sharded_data(
+    fetch_function: Callable[..., ResponseType],
+    start_date: Union[str, date],
+    end_date: Union[str, date],
+    max_workers: int = 4,
+    shard_days: Optional[int] = None,
+    **kwargs: Any
+) -> Iterator[T]:
+    """
+    Stream a date range by fetching date shards concurrently.
+
+    Each shard's pagination chain is fetched by a bounded thread pool; at
+    most ``max_workers`` shards are in flight or buffered at a time, and
+    items are yielded in chronological order.
+
+    When ``shard_days`` is None the shard size is derived from page density:
+    the first page of the whole range is fetched and, if more pages follow,
+    the number of days it covered becomes the shard size (roughly one page
+    per shard). A range that fits in a single page costs a single request.
+
+    Args:
+        fetch_function: The endpoint method to call (e.g., get_heartrate)
+        start_date: Start date of the range
+        end_date: End date of the range (inclusive)
+        max_workers: Maximum number of shards fetched concurrently
+        shard_days: Days per shard, or None to size shards automatically
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Yields:
+        Individual data items from the API response
+    """
+    start, end = _to_date(start_date), _to_date(end_date)
+
+    if shard_days is None:
+        probe = fetch_function(start_date=start, end_date=end, next_token=None, **kwargs)
+        if not page_next_token(probe):
+            yield from page_items(probe)
+            return
+
+        kept, resume_day, shard_days = _split_probe(probe, start, end)
+        if resume_day is None:
+            # Undated items: fall back to following the probe's token chain
+            yield from page_items(probe)
+            yield from stream_paginated_data(
+                _resume_from(fetch_function, page_next_token(probe)),
+                start_date=start, end_date=end, **kwargs
+            )
+            return
+
+        yield from kept
+        start = resume_day
+
+    def fetch_shard(shard: DateRange) -> List[Any]:
+        return list(stream_paginated_data(
+            fetch_function, start_date=shard[0], end_date=shard[1], **kwargs
+        ))
+
+    shards = iter(split_date_range(start, end, shard_days))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="oura-shard")
+    pending: Deque[Any] = deque()
+    try:
+        for shard in shards:
+            pending.append(executor.submit(fetch_shard, shard))
+            if len(pending) >= max_workers:
+                break
+
+        while pending:
+            items = pending.popleft().result()
+            next_shard = next(shards, None)
+            if next_shard is not None:
+                pending.append(executor.submit(fetch_shard, next_shard))
+            yield from items
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def async_stream_sharded_data(
+    fetch_function: Callable[..., Awaitable[ResponseType]],
+    start_date: Union[str, date],
+    end_date: Union[str, date],
+    max_workers: int = 4,
+    shard_days: Optional[int] = None,
+    **kwargs: Any
+) -> AsyncIterator[T]:
+    """
+    Asynchronously stream a date range by fetching date shards concurrently.
+
+    Async counterpart of stream_sharded_data; shards are fetched by at most
+    ``max_workers`` concurrent tasks instead of threads.
+
+    Args:
+        fetch_function: The async endpoint method to call
+        start_date: Start date of the range
+        end_date: End date of the range (inclusive)
+        max_workers: Maximum number of shards fetched concurrently
+        shard_days: Days per shard, or None to size shards automatically
+        **kwargs: Additional parameters to pass to the fetch function
+
+    Yields:
+        Individual data items from the API response
+    """
+    start, end = _to_date(start_date), _to_date(end_date)
+
+    if shard_days is None:
+        probe = await fetch_function(start_date=start, end_date=end, next_token=None, **kwargs)
+        if not page_next_token(probe):
+            for item in page_items(probe):
+                yield item
+            return
+
+        kept, resume_day, shard_days = _split_probe(probe, start, end)
+        if resume_day is None:
+            for item in page_items(probe):
+                yield item
+            async for item in async_stream_paginated_data(
+                _async_resume_from(fetch_function, page_next_token(probe)),
+                start_date=start, end_date=end, **kwargs
+            ):
+                yield item
+            return
+
+        for item in kept:
+            yield item
+        start = resume_day
+
+    async def fetch_shard(shard: DateRange) -> List[Any]:
+        return [item async for item in async_stream_paginated_data(
+            fetch_function, start_date=shard[0], end_date=shard[1], **kwargs
+        )]
+
+    shards = iter(split_date_range(start, end, shard_days))
+    pending: Deque["asyncio.Task[List[Any]]"] = deque()
+    try:
+        for shard in shards:
+            pending.append(asyncio.ensure_future(fetch_shard(shard)))
+            if len(pending) >= max_workers:
+                break
+
+        while pending:
+            items = await pending.popleft()
+            next_shard = next(shards, None)
+            if next_shard is not None:
+                pending.append(asyncio.ensure_future(fetch_shard(next_shard)))
+            for item in items:
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
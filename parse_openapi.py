@@ -1,5 +1,6 @@
 import json
 import logging
+import sys
 
 
 def _parse_method_details(method_details):
@@ -89,6 +90,129 @@ def parse_openapi_spec(spec_content):
     return paths_data, components_schemas_data
 
 
+# Spec schema names that differ from the package's model names
+STRUCT_RENAMES = {
+    "HeartRateModel": "HeartRateSample",
+    "TimeSeriesResponse_HeartRateModel_": "HeartRateResponse",
+    "PersonalInfoResponse": "PersonalInfo",
+    "VO2MaxModel": "Vo2MaxModel",
+    "MultiDocumentResponse_VO2MaxModel_": "Vo2MaxResponse",
+}
+
+# Default output path of the generated msgspec Struct models
+STRUCTS_PATH = "oura_api_client/models/structs.py"
+
+# String schemas holding timestamps
+DATETIME_SCHEMAS = ("LocalDateTime", "LocalDateTimeWithMilliseconds", "LocalizedDateTime")
+
+# Error and request body schemas have no place in the response backend
+STRUCT_SKIPPED = ("HTTPValidationError", "ValidationError")
+
+STRUCTS_HEADER = '''"""msgspec Struct model backend for Oura API responses.
+
+Generated by ``python parse_openapi.py --structs`` from openapi_spec.json;
+do not edit by hand. Requires the optional ``msgspec`` package.
+
+Every field defaults to None, so documents that omit fields still decode.
+Enumerations are kept as plain strings.
+"""
+
+import datetime
+from typing import {typing_names}
+
+import msgspec
+'''
+
+
+def _struct_name(schema_name):
+    """Return the Python class name generated for a component schema."""
+    if schema_name in STRUCT_RENAMES:
+        return STRUCT_RENAMES[schema_name]
+    if schema_name.startswith("MultiDocumentResponse_") and schema_name.endswith("Model_"):
+        return schema_name[len("MultiDocumentResponse_"):-len("Model_")] + "Response"
+    return schema_name
+
+
+def _struct_type(schema, schemas, dependencies):
+    """Return the type annotation for a property schema."""
+    if "$ref" in schema:
+        ref = schema["$ref"].rsplit("/", 1)[-1]
+        target = schemas.get(ref, {})
+        if "properties" in target:
+            dependencies.add(ref)
+            return _struct_name(ref)
+        if ref in DATETIME_SCHEMAS:
+            return "datetime.datetime"
+        return _struct_type(target, schemas, dependencies)
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        if len(options) != 1:
+            return "Any"
+        option_type = _struct_type(options[0], schemas, dependencies)
+        return f"Optional[{option_type}]" if len(options) < len(schema["anyOf"]) else option_type
+
+    schema_type = schema.get("type")
+    if schema_type == "array":
+        return f"List[{_struct_type(schema.get('items', {}), schemas, dependencies)}]"
+    if schema_type == "string":
+        return {"date": "datetime.date", "date-time": "datetime.datetime"}.get(schema.get("format"), "str")
+    if schema_type == "object":
+        return "Dict[str, Any]"
+    return {"integer": "int", "number": "float", "boolean": "bool"}.get(schema_type, "Any")
+
+
+def generate_struct_models(schemas):
+    """
+    Generate the source of a module with one msgspec Struct per object schema.
+
+    Args:
+        schemas (dict): Component schemas, as returned by parse_openapi_spec.
+
+    Returns:
+        str: Python source code of the generated module.
+    """
+    classes = {}
+    dependencies = {}
+    for schema_name, schema in schemas.items():
+        skipped = schema_name in STRUCT_SKIPPED or schema_name.endswith("Request")
+        if skipped or "properties" not in schema:
+            continue
+        needed = set()
+        lines = [f"class {_struct_name(schema_name)}(msgspec.Struct, kw_only=True, gc=False):"]
+        if schema.get("description"):
+            summary = schema["description"].splitlines()[0].strip().rstrip(".") + "."
+        else:
+            summary = f"Generated from the {schema_name} schema."
+        lines.append(f'    """{summary}"""')
+        lines.append("")
+        for field, field_schema in schema["properties"].items():
+            field_type = _struct_type(field_schema, schemas, needed)
+            if not field_type.startswith("Optional["):
+                field_type = f"Optional[{field_type}]"
+            lines.append(f"    {field}: {field_type} = None")
+        classes[schema_name] = "\n".join(lines)
+        dependencies[schema_name] = needed - {schema_name}
+
+    # Emit classes after the classes they reference
+    ordered = []
+    emitted = set()
+
+    def emit(name):
+        if name in emitted:
+            return
+        emitted.add(name)
+        for dependency in sorted(dependencies[name]):
+            emit(dependency)
+        ordered.append(classes[name])
+
+    for name in sorted(classes):
+        emit(name)
+
+    body = "\n\n\n".join(ordered)
+    typing_names = [name for name in ("Any", "Dict", "List", "Optional") if f"{name}[" in body or f"{name}]" in body]
+    return STRUCTS_HEADER.format(typing_names=", ".join(typing_names)) + "\n\n" + body + "\n"
+
+
 if __name__ == "__main__":
     try:
         with open("openapi_spec.json", "r") as f:
@@ -106,6 +230,14 @@ if __name__ == "__main__":
         # You can optionally print or process the extracted data here
         # For now, just acknowledge completion as per the task requirement.
         print("OpenAPI specification parsed successfully.")
+
+        # python parse_openapi.py --structs [PATH] regenerates the Struct backend
+        if "--structs" in sys.argv:
+            index = sys.argv.index("--structs")
+            structs_path = sys.argv[index + 1] if len(sys.argv) > index + 1 else STRUCTS_PATH
+            with open(structs_path, "w") as f:
+                f.write(generate_struct_models(parsed_schemas))
+            print(f"msgspec Struct models written to {structs_path}.")
         # Example: Print all paths
         # print("\nPaths:")
         # for path, methods in parsed_paths.items():
@@ -41,6 +41,12 @@ setup(
     ],
     extras_require={
         "dev": dev_requires,
+        "async": ["httpx>=0.24.0"],
+        "numpy": ["numpy>=1.20.0"],
+        "orjson": ["orjson>=3.6.0"],
+        "msgspec": ["msgspec>=0.16.0"],
+        "arrow": ["pyarrow>=10.0.0"],
+        "pandas": ["pandas>=1.5.0", "pyarrow>=10.0.0"],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -0,0 +1,96 @@
+"""Tests for the TypeAdapter registry used to parse responses."""
+
+import json
+import unittest
+from datetime import date
+from typing import List
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models.adapters import get_adapter, parse_model
+from oura_api_client.models.tag import TagModel, TagResponse
+from oura_api_client.transports import ReplayTransport
+from oura_api_client.utils import ResponseCache
+
+TAG_URL = "https://api.ouraring.com/v2/usercollection/tag"
+PAGE = {
+    "data": [{
+        "id": "tag-1",
+        "day": "2024-03-01",
+        "text": "coffee",
+        "timestamp": "2024-03-01T08:00:00+00:00",
+        "tags": ["coffee"],
+    }],
+    "next_token": None,
+}
+
+
+class TestAdapterRegistry(unittest.TestCase):
+    """Test building and using the shared TypeAdapters."""
+
+    def test_adapters_are_built_once(self):
+        """Test that each response type gets a single shared adapter."""
+        self.assertIs(get_adapter(TagResponse), get_adapter(TagResponse))
+        self.assertIs(get_adapter(List[TagModel]), get_adapter(List[TagModel]))
+        self.assertIsNot(get_adapter(TagResponse), get_adapter(TagModel))
+
+    def test_bytes_and_dicts_parse_alike(self):
+        """Test that validate_json on bytes matches validation of the decoded dict."""
+        from_bytes = parse_model(TagResponse, json.dumps(PAGE).encode())
+        from_dict = parse_model(TagResponse, PAGE)
+
+        self.assertEqual(from_bytes, from_dict)
+        self.assertEqual(from_bytes, TagResponse(**PAGE))
+        self.assertEqual(from_bytes.data[0].day, date(2024, 3, 1))
+
+    def test_invalid_body(self):
+        """Test that invalid bodies raise a ValidationError."""
+        with self.assertRaises(ValidationError):
+            parse_model(TagResponse, b'{"data": [{"id": "tag-1"}]}')
+
+
+class TestRawBodyParsing(unittest.TestCase):
+    """Test that routers validate straight from the response bytes."""
+
+    def setUp(self):
+        self.transport = ReplayTransport()
+        self.transport.add("GET", TAG_URL, json_body=PAGE)
+
+    def test_make_request_returns_body_bytes(self):
+        """Test that decode=False returns the undecoded body."""
+        client = OuraClient("test_token", transport=self.transport)
+
+        body = client._make_request("/usercollection/tag", decode=False)
+
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), PAGE)
+
+    def test_router_skips_intermediate_dict(self):
+        """Test that routers never decode the page into a dict first."""
+        client = OuraClient("test_token", transport=self.transport)
+
+        with patch("oura_api_client.transports.base.TransportResponse.json") as mock_json:
+            response = client.tag.get_tag_documents()
+
+        mock_json.assert_not_called()
+        self.assertIsInstance(response, TagResponse)
+        self.assertEqual(client.tag.get_tag_documents(return_model=False), PAGE)
+
+    def test_cache_hits_are_validated_from_bytes(self):
+        """Test that cached bodies are handed to the adapter as stored bytes."""
+        cache = ResponseCache()
+        client = OuraClient("test_token", transport=self.transport, cache=cache)
+
+        first = client.tag.get_tag_documents()
+        namespace = OuraClient._cache_namespace(client.headers)
+        self.assertIsInstance(cache.get("/usercollection/tag", namespace=namespace), bytes)
+        second = client.tag.get_tag_documents()
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.transport.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
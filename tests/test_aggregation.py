@@ -0,0 +1,121 @@
+"""Tests for the streaming heart rate resampler."""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from oura_api_client.aggregation import (
+    HeartRateAggregate,
+    HeartRateResampler,
+    async_resample_heartrate,
+    resample_heartrate
+)
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models.heartrate import HeartRateColumns, HeartRateSample
+from oura_api_client.transports import ReplayTransport
+
+HEARTRATE_URL = "https://api.ouraring.com/v2/usercollection/heartrate"
+SAMPLES = [
+    {"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 60, "source": "awake"},
+    {"timestamp": "2024-03-01T10:20:00+00:00", "bpm": 70, "source": "awake"},
+    {"timestamp": "2024-03-01T10:40:00+00:00", "bpm": 100, "source": "workout"},
+    {"timestamp": "2024-03-01T11:05:00+00:00", "bpm": 50, "source": "awake"},
+    {"timestamp": "2024-03-01T23:30:00+00:00", "bpm": 45, "source": "sleep"},
+]
+
+
+def at(hour, day=1, minute=0):
+    return datetime(2024, 3, day, hour, minute, tzinfo=timezone.utc)
+
+
+class TestHeartRateResampler(unittest.TestCase):
+    """Test single-pass bucket aggregation."""
+
+    def test_hourly_by_source(self):
+        """Test hourly buckets grouped by source."""
+        aggregates = list(resample_heartrate(SAMPLES, "hour"))
+
+        self.assertEqual(aggregates, [
+            HeartRateAggregate(at(10), "awake", 2, 60, 70, 65.0),
+            HeartRateAggregate(at(10), "workout", 1, 100, 100, 100.0),
+            HeartRateAggregate(at(11), "awake", 1, 50, 50, 50.0),
+            HeartRateAggregate(at(23), "sleep", 1, 45, 45, 45.0),
+        ])
+
+    def test_daily_without_sources(self):
+        """Test merging all sources into daily buckets, aligned to a time zone."""
+        aggregates = list(resample_heartrate(SAMPLES, "day", by_source=False, utc_offset=timedelta(hours=2)))
+
+        self.assertEqual([(a.start.isoformat(), a.count, a.min, a.max) for a in aggregates], [
+            ("2024-03-01T00:00:00+02:00", 4, 50, 100),
+            ("2024-03-02T00:00:00+02:00", 1, 45, 45),
+        ])
+        self.assertIsNone(aggregates[0].source)
+
+    def test_buckets_are_emitted_as_they_complete(self):
+        """Test that only the current buckets are held open."""
+        resampler = HeartRateResampler("minute")
+
+        self.assertEqual(resampler.add(HeartRateSample(**SAMPLES[0])), [])
+        completed = resampler.add(HeartRateSample(**SAMPLES[1]))
+
+        self.assertEqual([(a.start, a.mean) for a in completed], [(at(10), 60.0)])
+        self.assertEqual(len(resampler._open), 1)
+        self.assertEqual(resampler.flush()[0].start, at(10, minute=20))
+        self.assertEqual(resampler.flush(), [])
+
+    def test_columnar_chunks_match_samples(self):
+        """Test that columnar chunks aggregate like individual samples, with and without NumPy."""
+        expected = list(resample_heartrate(SAMPLES, "hour"))
+        chunks = [
+            HeartRateColumns.from_dict({"data": SAMPLES[:2]}),
+            HeartRateColumns.from_dict({"data": SAMPLES[2:]}),
+        ]
+
+        self.assertEqual(list(resample_heartrate(chunks, "hour")), expected)
+        with patch("oura_api_client.aggregation.np", None):
+            self.assertEqual(list(resample_heartrate(chunks, "hour")), expected)
+
+    def test_frequencies(self):
+        """Test custom and invalid bucket sizes."""
+        self.assertEqual(HeartRateResampler(900).width, 900)
+        self.assertEqual(HeartRateResampler(timedelta(minutes=5)).width, 300)
+        with self.assertRaises(ValueError):
+            HeartRateResampler("week")
+        with self.assertRaises(ValueError):
+            HeartRateResampler(0)
+
+    def test_async_resample(self):
+        """Test resampling an async stream."""
+        async def samples():
+            for sample in SAMPLES:
+                yield sample
+
+        async def collect():
+            return [aggregate async for aggregate in async_resample_heartrate(samples(), "day")]
+
+        aggregates = asyncio.run(collect())
+
+        self.assertEqual([(a.source, a.count) for a in aggregates], [("awake", 3), ("sleep", 1), ("workout", 1)])
+
+
+class TestRouterResample(unittest.TestCase):
+    """Test HeartRateEndpoints.resample()."""
+
+    def test_resample_streams_columnar_pages(self):
+        """Test that resample() folds every page into the buckets."""
+        transport = ReplayTransport()
+        params = {"start_date": "2024-03-01", "end_date": "2024-03-02"}
+        transport.add("GET", HEARTRATE_URL, params=params, json_body={"data": SAMPLES[:3], "next_token": "t2"})
+        transport.add("GET", HEARTRATE_URL, params=dict(params, next_token="t2"), json_body={"data": SAMPLES[3:]})
+        client = OuraClient("test_token", transport=transport)
+
+        aggregates = list(client.heartrate.resample("2024-03-01", "2024-03-02", freq="hour"))
+
+        self.assertEqual(aggregates, list(resample_heartrate(SAMPLES, "hour")))
+        self.assertEqual(len(transport.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,338 @@
+"""Tests for the asynchronous Oura API client."""
+
+import unittest
+from unittest.mock import patch, AsyncMock
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from oura_api_client.aio import AsyncOuraClient
+from oura_api_client.aio.base import AsyncBaseRouter
+from oura_api_client.api.base import BaseRouter
+from oura_api_client.aio.daily_sleep import AsyncDailySleep
+from oura_api_client.models.daily_sleep import DailySleepResponse, DailySleepModel
+from oura_api_client.models.heartrate import HeartRateSample
+from oura_api_client.models.webhook import WebhookSubscriptionModel
+from oura_api_client.exceptions import (
+    OuraNotFoundError, OuraServerError, OuraTimeoutError
+)
+from oura_api_client.utils import RetryConfig, ResponseCache
+
+
+def _daily_sleep(day):
+    return {
+        "id": f"sleep-{day}",
+        "contributors": {},
+        "day": day,
+        "score": 80,
+        "timestamp": f"{day}T00:00:00+00:00",
+    }
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncOuraClient(unittest.IsolatedAsyncioTestCase):
+    """Test the AsyncOuraClient class."""
+
+    def make_client(self, handler, **kwargs):
+        """Create a client whose HTTP traffic is served by ``handler``."""
+        self.requests = []
+
+        def recording_handler(request):
+            self.requests.append(request)
+            return handler(request)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(recording_handler))
+        return AsyncOuraClient("test_token", http_client=http_client, **kwargs)
+
+    async def asyncTearDown(self):
+        if getattr(self, "client", None) is not None:
+            await self.client.aclose()
+
+    def test_initialization(self):
+        """Test that the async client mirrors every OuraClient router."""
+        client = AsyncOuraClient("test_token")
+        self.assertEqual(client.headers["Authorization"], "Bearer test_token")
+        self.assertIsInstance(client.daily_sleep, AsyncDailySleep)
+        for name in (
+            "heartrate", "personal", "daily_activity", "daily_readiness",
+            "sleep", "session", "tag", "workout", "enhanced_tag",
+            "daily_spo2", "sleep_time", "rest_mode_period",
+            "ring_configuration", "daily_stress", "daily_resilience",
+            "daily_cardiovascular_age", "vo2_max", "webhook",
+        ):
+            self.assertIsNotNone(getattr(client, name))
+
+    def test_routers_share_the_sync_logic(self):
+        """Test that async routers reuse the sync routers' parsing and stream dispatch."""
+        for name in ("_parse", "_parse_kwargs", "_stream_documents", "get_many", "stream_batches"):
+            self.assertIs(getattr(AsyncBaseRouter, name), getattr(BaseRouter, name))
+        self.assertIsNot(AsyncBaseRouter._paginate, BaseRouter._paginate)
+
+    def test_requires_httpx(self):
+        """Test that a helpful error is raised when httpx is missing."""
+        with patch("oura_api_client.transports.httpx_transport.httpx", None):
+            with self.assertRaises(ImportError):
+                AsyncOuraClient("test_token")
+
+    async def test_get_daily_sleep_documents(self):
+        """Test fetching a page of documents."""
+        self.client = self.make_client(lambda request: httpx.Response(
+            200, json={"data": [_daily_sleep("2024-03-10")], "next_token": None}
+        ))
+
+        response = await self.client.daily_sleep.get_daily_sleep_documents(
+            start_date="2024-03-10", end_date="2024-03-11"
+        )
+
+        self.assertIsInstance(response, DailySleepResponse)
+        self.assertEqual(response.data[0].score, 80)
+        request = self.requests[0]
+        self.assertEqual(request.url.path, "/v2/usercollection/daily_sleep")
+        self.assertEqual(request.url.params["start_date"], "2024-03-10")
+        self.assertEqual(request.headers["Authorization"], "Bearer test_token")
+
+    async def test_get_daily_sleep_document(self):
+        """Test fetching a single document by ID."""
+        self.client = self.make_client(
+            lambda request: httpx.Response(200, json=_daily_sleep("2024-03-10"))
+        )
+
+        document = await self.client.daily_sleep.get_daily_sleep_document("sleep-2024-03-10")
+
+        self.assertIsInstance(document, DailySleepModel)
+        self.assertEqual(self.requests[0].url.path, "/v2/usercollection/daily_sleep/sleep-2024-03-10")
+
+    async def test_stream_follows_next_token(self):
+        """Test that stream() is an async iterator across pages."""
+        pages = {
+            None: {"data": [_daily_sleep("2024-03-10")], "next_token": "page2"},
+            "page2": {"data": [_daily_sleep("2024-03-11")], "next_token": None},
+        }
+        self.client = self.make_client(lambda request: httpx.Response(
+            200, json=pages[request.url.params.get("next_token")]
+        ))
+
+        days = [item.day.isoformat() async for item in self.client.daily_sleep.stream(start_date="2024-03-10")]
+
+        self.assertEqual(days, ["2024-03-10", "2024-03-11"])
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_stream_with_prefetch(self):
+        """Test that prefetching keeps the page order and propagates errors."""
+        pages = {
+            None: {"data": [_daily_sleep("2024-03-10")], "next_token": "page2"},
+            "page2": {"data": [_daily_sleep("2024-03-11")], "next_token": "page3"},
+            "page3": {"data": [_daily_sleep("2024-03-12")], "next_token": None},
+        }
+        self.client = self.make_client(lambda request: httpx.Response(
+            200, json=pages[request.url.params.get("next_token")]
+        ))
+
+        days = [
+            item.day.isoformat()
+            async for item in self.client.daily_sleep.stream(start_date="2024-03-10", prefetch=2)
+        ]
+
+        self.assertEqual(days, ["2024-03-10", "2024-03-11", "2024-03-12"])
+
+        await self.client.aclose()
+        self.client = self.make_client(lambda request: (
+            httpx.Response(200, json=pages[None])
+            if request.url.params.get("next_token") is None
+            else httpx.Response(500, json={"detail": "Server error"})
+        ))
+        with self.assertRaises(OuraServerError):
+            async for _ in self.client.daily_sleep.stream(start_date="2024-03-10", prefetch=1):
+                pass
+
+    async def test_stream_with_shards(self):
+        """Test that sharded streaming fetches shards concurrently and in order."""
+        days = [f"2024-03-{d:02d}" for d in range(1, 11)]
+
+        def handler(request):
+            start = request.url.params["start_date"]
+            end = request.url.params["end_date"]
+            return httpx.Response(200, json={
+                "data": [_daily_sleep(day) for day in days if start <= day <= end],
+                "next_token": None,
+            })
+
+        self.client = self.make_client(handler)
+
+        streamed = [
+            item.day.isoformat()
+            async for item in self.client.daily_sleep.stream(
+                start_date="2024-03-01", end_date="2024-03-10", max_workers=3, shard_days=3
+            )
+        ]
+
+        self.assertEqual(streamed, days)
+        self.assertEqual(
+            sorted(request.url.params["start_date"] for request in self.requests),
+            ["2024-03-01", "2024-03-04", "2024-03-07", "2024-03-10"]
+        )
+
+    async def test_stream_raw_documents(self):
+        """Test that return_model=False streams the raw documents."""
+        pages = {
+            None: {"data": [_daily_sleep("2024-03-10")], "next_token": "next"},
+            "next": {"data": [_daily_sleep("2024-03-11")], "next_token": None},
+        }
+        self.client = self.make_client(
+            lambda request: httpx.Response(200, json=pages[request.url.params.get("next_token")])
+        )
+
+        documents = [
+            document async for document in self.client.daily_sleep.stream(return_model=False)
+        ]
+
+        self.assertEqual(documents, [_daily_sleep("2024-03-10"), _daily_sleep("2024-03-11")])
+
+    async def test_cached_responses_skip_network(self):
+        """Test that GET responses are served from the response cache."""
+        self.client = self.make_client(
+            lambda request: httpx.Response(200, json={"data": [], "next_token": None}),
+            cache=ResponseCache()
+        )
+
+        for _ in range(2):
+            await self.client.daily_sleep.get_daily_sleep_documents(
+                start_date="2020-01-01", end_date="2020-01-31"
+            )
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.client.cache.hits, 1)
+
+    async def test_heartrate_stream(self):
+        """Test streaming heart rate samples."""
+        self.client = self.make_client(lambda request: httpx.Response(200, json={
+            "data": [{"timestamp": "2024-03-01T12:00:00+00:00", "bpm": 60, "source": "awake"}],
+            "next_token": None,
+        }))
+
+        samples = [sample async for sample in self.client.heartrate.stream(start_date="2024-03-01")]
+
+        self.assertEqual(len(samples), 1)
+        self.assertIsInstance(samples[0], HeartRateSample)
+
+    async def test_not_found_error(self):
+        """Test that HTTP errors map onto the exception hierarchy."""
+        self.client = self.make_client(
+            lambda request: httpx.Response(404, json={"error": "Document not found"})
+        )
+
+        with self.assertRaises(OuraNotFoundError) as cm:
+            await self.client.daily_sleep.get_daily_sleep_document("missing")
+
+        self.assertEqual(cm.exception.message, "Document not found")
+        self.assertEqual(cm.exception.endpoint, "/usercollection/daily_sleep/missing")
+
+    async def test_timeout_error(self):
+        """Test that transport timeouts raise OuraTimeoutError."""
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        self.client = self.make_client(handler, retry_config=RetryConfig(enabled=False))
+
+        with self.assertRaises(OuraTimeoutError):
+            await self.client._make_request("/test")
+
+    async def test_retry_uses_non_blocking_sleep(self):
+        """Test that retry backoff awaits asyncio.sleep instead of time.sleep."""
+        responses = iter([
+            httpx.Response(500, json={}),
+            httpx.Response(200, json={"data": "success"}),
+        ])
+        self.client = self.make_client(
+            lambda request: next(responses),
+            retry_config=RetryConfig(max_retries=2, base_delay=0.5, jitter=False)
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep, \
+                patch("time.sleep") as mock_time_sleep:
+            result = await self.client._make_request("/test")
+
+        self.assertEqual(result, {"data": "success"})
+        mock_sleep.assert_awaited_once_with(0.5)
+        mock_time_sleep.assert_not_called()
+
+    async def test_retry_exhausted(self):
+        """Test that the last error is raised once retries are exhausted."""
+        self.client = self.make_client(
+            lambda request: httpx.Response(500, json={"error": "Server error"}),
+            retry_config=RetryConfig(max_retries=2, base_delay=0.01, jitter=False)
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with self.assertRaises(OuraServerError):
+                await self.client._make_request("/test")
+
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_delete_empty_response(self):
+        """Test that empty bodies decode to an empty dict."""
+        self.client = self.make_client(lambda request: httpx.Response(204))
+
+        result = await self.client._make_request("/test", method="DELETE")
+
+        self.assertEqual(result, {})
+        self.assertEqual(self.requests[0].method, "DELETE")
+
+    async def test_webhook_create_subscription(self):
+        """Test that webhook calls send credentials and a JSON body."""
+        subscription = {
+            "id": "sub-1",
+            "callback_url": "https://example.com/hook",
+            "event_type": "create",
+            "data_type": "sleep",
+            "expiration_time": "2025-01-01T00:00:00+00:00",
+        }
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(201, json=subscription)
+        ))
+        self.client = AsyncOuraClient(
+            "test_token", client_id="id", client_secret="secret", http_client=http_client
+        )
+
+        with patch.object(http_client, "request", wraps=http_client.request) as mock_request:
+            result = await self.client.webhook.create_webhook_subscription(
+                callback_url="https://example.com/hook",
+                event_type="create",
+                data_type="sleep",
+                verification_token="token",
+            )
+
+        self.assertIsInstance(result, WebhookSubscriptionModel)
+        kwargs = mock_request.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["x-client-id"], "id")
+        self.assertEqual(kwargs["json"]["verification_token"], "token")
+
+    async def test_unsupported_method(self):
+        """Test that unsupported HTTP methods raise ValueError."""
+        self.client = self.make_client(lambda request: httpx.Response(200, json={}))
+
+        with self.assertRaises(ValueError):
+            await self.client._make_request("/test", method="TRACE")
+
+    async def test_context_manager_closes_client(self):
+        """Test that leaving the async context manager closes the client's own httpx client."""
+        async with AsyncOuraClient("test_token") as client:
+            http_client = client.http_client
+            self.assertFalse(http_client.is_closed)
+        self.assertTrue(http_client.is_closed)
+
+    async def test_caller_http_client_stays_open(self):
+        """Test that an httpx client passed in by the caller is not closed."""
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={})
+        ))
+        async with AsyncOuraClient("test_token", http_client=http_client):
+            pass
+        self.assertFalse(http_client.is_closed)
+        await http_client.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
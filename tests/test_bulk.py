@@ -0,0 +1,122 @@
+"""Tests for concurrent lookups of documents by ID."""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.exceptions import OuraNotFoundError
+from oura_api_client.models.tag import TagModel
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+from oura_api_client.utils.bulk import async_fetch_many, fetch_many
+
+TAG_URL = "https://api.ouraring.com/v2/usercollection/tag"
+
+
+def tag(document_id):
+    return {
+        "id": document_id,
+        "day": "2024-03-01",
+        "text": f"tag {document_id}",
+        "timestamp": "2024-03-01T08:00:00+00:00",
+        "tags": ["tag_generic_nocaffeine"],
+    }
+
+
+def add_tags(transport):
+    for document_id in ("a", "b", "c"):
+        transport.add("GET", f"{TAG_URL}/{document_id}", json_body=tag(document_id))
+    transport.add("GET", f"{TAG_URL}/missing", status_code=404, reason="Not Found",
+                  json_body={"error": "Document not found"})
+
+
+class TestGetMany(unittest.TestCase):
+    """Test the routers' get_many()."""
+
+    def setUp(self):
+        self.transport = ReplayTransport()
+        add_tags(self.transport)
+        self.client = OuraClient("test_token", transport=self.transport)
+
+    def test_input_order_and_errors(self):
+        """Test that documents keep the order of the IDs and failures are collected."""
+        result = self.client.tag.get_many(["c", "missing", "a", "b"], max_concurrency=3)
+
+        self.assertEqual([getattr(document, "id", None) for document in result.documents], ["c", None, "a", "b"])
+        self.assertIsInstance(result.documents[0], TagModel)
+        self.assertEqual(list(result.errors), ["missing"])
+        self.assertIsInstance(result.errors["missing"], OuraNotFoundError)
+        self.assertFalse(result.ok)
+
+    def test_duplicates_are_fetched_once(self):
+        """Test that a repeated ID costs one request."""
+        result = self.client.tag.get_many(["a", "b", "a"], return_model=False)
+
+        self.assertEqual([document["id"] for document in result.documents], ["a", "b", "a"])
+        self.assertEqual(len(self.transport.calls), 2)
+        self.assertTrue(result.ok)
+
+    def test_invalid_arguments(self):
+        """Test routers without a single-document endpoint and bad concurrency."""
+        with self.assertRaises(TypeError):
+            self.client.heartrate.get_many(["a"])
+        with self.assertRaises(ValueError):
+            self.client.tag.get_many(["a"], max_concurrency=0)
+        self.assertEqual(self.client.tag.get_many([]).documents, [])
+        self.assertEqual(self.transport.calls, [])
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency lookups are in flight."""
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def fetch(document_id):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return document_id
+
+        result = fetch_many(fetch, [str(i) for i in range(12)], max_concurrency=3)
+
+        self.assertEqual(result.documents, [str(i) for i in range(12)])
+        self.assertEqual(in_flight[1], 3)
+
+
+class TestAsyncGetMany(unittest.TestCase):
+    """Test get_many() on the async client."""
+
+    def test_async_router(self):
+        """Test input order and error collection over the async client."""
+        transport = AsyncReplayTransport()
+        add_tags(transport)
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        result = asyncio.run(client.tag.get_many(["b", "missing", "a"]))
+
+        self.assertEqual([getattr(document, "id", None) for document in result.documents], ["b", None, "a"])
+        self.assertIsInstance(result.errors["missing"], OuraNotFoundError)
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency lookups run at once."""
+        in_flight = [0, 0]
+
+        async def fetch(document_id):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await asyncio.sleep(0.001)
+            in_flight[0] -= 1
+            return document_id
+
+        result = asyncio.run(async_fetch_many(fetch, ["a", "b", "c", "d", "e"], max_concurrency=2))
+
+        self.assertEqual(result.documents, ["a", "b", "c", "d", "e"])
+        self.assertEqual(in_flight[1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
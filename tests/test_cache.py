@@ -0,0 +1,265 @@
+"""Tests for the persistent response cache."""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+from oura_api_client.utils import ResponseCache
+
+TODAY = date(2024, 6, 15)
+HISTORICAL = {"start_date": "2024-01-01", "end_date": "2024-01-31"}
+RECENT = {"start_date": "2024-06-01", "end_date": "2024-06-14"}
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the SQLite response cache."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(
+            historical_ttl=3600, recent_ttl=60, clock=self.clock, today=lambda: TODAY
+        )
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_key_is_independent_of_param_order(self):
+        """Test that keys are built from sorted parameters."""
+        self.assertEqual(
+            ResponseCache.make_key("/usercollection/tag", {"b": "2", "a": "1"}),
+            ResponseCache.make_key("/usercollection/tag", {"a": "1", "b": "2"})
+        )
+        self.assertEqual(ResponseCache.make_key("/usercollection/tag"), "/usercollection/tag")
+
+    def test_namespaces_are_separate(self):
+        """Test that entries stored under one namespace are not served to another."""
+        self.cache.set("/usercollection/tag", HISTORICAL, {"data": ["alice"]}, namespace="alice")
+
+        self.assertIsNone(self.cache.get("/usercollection/tag", HISTORICAL, namespace="bob"))
+        self.assertIsNone(self.cache.get("/usercollection/tag", HISTORICAL))
+        self.assertEqual(self.cache.get("/usercollection/tag", HISTORICAL, namespace="alice"), b'{"data":["alice"]}')
+        self.assertNotIn("token", ResponseCache.namespace_for("Bearer token"))
+
+    def test_ttl_policy(self):
+        """Test TTLs for closed days, recent days and other endpoints."""
+        self.assertEqual(self.cache.ttl_for("/usercollection/daily_sleep", HISTORICAL), 3600)
+        self.assertEqual(
+            self.cache.ttl_for("/usercollection/daily_sleep", {"end_date": "2024-06-13"}), 3600
+        )
+        self.assertEqual(self.cache.ttl_for("/usercollection/daily_sleep", RECENT), 60)
+        self.assertEqual(self.cache.ttl_for("/usercollection/daily_sleep", {"start_date": "2024-01-01"}), 60)
+        self.assertEqual(self.cache.ttl_for("/webhook/subscription"), 0)
+
+    def test_endpoint_ttl_overrides(self):
+        """Test that the longest matching prefix override wins."""
+        cache = ResponseCache(endpoint_ttls={
+            "/usercollection/": 10,
+            "/usercollection/heartrate": lambda endpoint, params: 0,
+        })
+
+        self.assertEqual(cache.ttl_for("/usercollection/tag", HISTORICAL), 10)
+        self.assertEqual(cache.ttl_for("/usercollection/heartrate", HISTORICAL), 0)
+        self.assertFalse(cache.set("/usercollection/heartrate", HISTORICAL, {"data": []}))
+
+    def test_get_and_expiry(self):
+        """Test that entries are served until their TTL runs out."""
+        self.assertIsNone(self.cache.get("/usercollection/tag", RECENT))
+        self.assertTrue(self.cache.set("/usercollection/tag", RECENT, {"data": [1]}))
+        self.assertEqual(self.cache.get("/usercollection/tag", RECENT), b'{"data":[1]}')
+
+        self.clock.now += 61
+        self.assertIsNone(self.cache.get("/usercollection/tag", RECENT))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entries are evicted over the size cap."""
+        body = {"data": "x" * 100}
+        size = len('{"data":"' + "x" * 100 + '"}')
+        cache = ResponseCache(max_size=size * 2, clock=self.clock, today=lambda: TODAY)
+
+        for day in ("01", "02"):
+            cache.set("/usercollection/tag", {"end_date": f"2024-01-{day}"}, body)
+            self.clock.now += 1
+        cache.get("/usercollection/tag", {"end_date": "2024-01-01"})
+        self.clock.now += 1
+        cache.set("/usercollection/tag", {"end_date": "2024-01-03"}, body)
+
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.size, cache.max_size)
+        self.assertIsNotNone(cache.get("/usercollection/tag", {"end_date": "2024-01-01"}))
+        self.assertIsNone(cache.get("/usercollection/tag", {"end_date": "2024-01-02"}))
+
+    def test_persistent_file(self):
+        """Test that cached responses survive reopening the database."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = ResponseCache(path, today=lambda: TODAY)
+            cache.set("/usercollection/tag", HISTORICAL, {"data": [1]})
+            cache.close()
+
+            reopened = ResponseCache(path, today=lambda: TODAY)
+            self.assertEqual(reopened.get("/usercollection/tag", HISTORICAL), b'{"data":[1]}')
+            self.assertGreater(reopened.size, 0)
+            reopened.close()
+
+    def test_invalidate(self):
+        """Test removing entries by endpoint prefix."""
+        self.cache.set("/usercollection/tag", HISTORICAL, {"data": []})
+        self.cache.set("/usercollection/workout", HISTORICAL, {"data": []})
+
+        self.assertEqual(self.cache.invalidate("/usercollection/tag"), 1)
+        self.assertEqual(len(self.cache), 1)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestClientCaching(unittest.TestCase):
+    """Test that the client serves GET requests from the cache."""
+
+    def setUp(self):
+        self.cache = ResponseCache(today=lambda: TODAY)
+        self.client = OuraClient("test_token", cache=self.cache)
+        self.response = MagicMock()
+        self.response.ok = True
+        self.response.status_code = 200
+        self.response.json.return_value = {"data": [], "next_token": None}
+
+    @patch("requests.Session.get")
+    def test_repeated_get_skips_network(self, mock_get):
+        """Test that a repeated request is answered from the cache."""
+        mock_get.return_value = self.response
+
+        first = self.client.daily_sleep.get_daily_sleep_documents(
+            start_date="2024-01-01", end_date="2024-01-31"
+        )
+        second = self.client.daily_sleep.get_daily_sleep_documents(
+            start_date=date(2024, 1, 1), end_date=date(2024, 1, 31)
+        )
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+        self.assertEqual(self.cache.hits, 1)
+
+    @patch("requests.Session.get")
+    def test_different_params_miss(self, mock_get):
+        """Test that other query parameters are fetched separately."""
+        mock_get.return_value = self.response
+
+        self.client.tag.get_tag_documents(start_date="2024-01-01", end_date="2024-01-31")
+        self.client.tag.get_tag_documents(start_date="2024-02-01", end_date="2024-02-28")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.Session.post")
+    def test_non_get_requests_are_not_cached(self, mock_post):
+        """Test that only GET responses are cached."""
+        mock_post.return_value = self.response
+
+        self.client._make_request("/usercollection/tag", method="POST", json_data={})
+        self.client._make_request("/usercollection/tag", method="POST", json_data={})
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_tokens_do_not_share_entries(self):
+        """Test that clients with different tokens sharing a cache each fetch their own data."""
+        url = "https://api.ouraring.com/v2/usercollection/tag"
+        bodies = {}
+        for name in ("alice", "bob"):
+            transport = ReplayTransport()
+            transport.add("GET", url, json_body={"data": [], "next_token": name})
+            client = OuraClient(f"{name}-token", cache=self.cache, transport=transport)
+            bodies[name] = client.tag.get_tag_documents(return_model=False)
+            self.assertEqual(len(transport.calls), 1)
+
+        self.assertEqual(bodies, {"alice": {"data": [], "next_token": "alice"}, "bob": {"data": [], "next_token": "bob"}})
+        self.assertEqual(len(self.cache), 2)
+
+    def test_hits_use_the_client_json_decoder(self):
+        """Test that cached bodies are decoded with the client's decoder, like fetched ones."""
+        url = "https://api.ouraring.com/v2/usercollection/tag"
+        transport = ReplayTransport()
+        transport.add("GET", url, json_body={"data": [], "next_token": None})
+        decoder = MagicMock(side_effect=json.loads)
+        client = OuraClient("test_token", cache=self.cache, transport=transport, json_decoder=decoder)
+
+        first = client._make_request("/usercollection/tag")
+        second = client._make_request("/usercollection/tag")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(decoder.call_count, 2)
+        self.assertIsInstance(client._make_request("/usercollection/tag", decode=False), bytes)
+
+
+class TestAsyncClientCaching(unittest.TestCase):
+    """Test the cache on AsyncOuraClient."""
+
+    def test_cache_runs_off_the_event_loop(self):
+        """Test that cache reads and writes run in executor threads, not on the loop."""
+        cache = ResponseCache(today=lambda: TODAY)
+        transport = AsyncReplayTransport()
+        transport.add("GET", "https://api.ouraring.com/v2/usercollection/tag", json_body={"data": [], "next_token": None})
+        client = AsyncOuraClient("test_token", cache=cache, transport=transport)
+        threads = []
+        for name in ("get", "set"):
+            original = getattr(cache, name)
+
+            def record(*args, _original=original, **kwargs):
+                threads.append(threading.current_thread())
+                return _original(*args, **kwargs)
+            setattr(cache, name, record)
+
+        async def fetch_twice():
+            await client.tag.get_tag_documents()
+            await client.tag.get_tag_documents()
+
+        asyncio.run(fetch_twice())
+
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.main_thread(), threads)
+        cache.close()
+
+    def test_hits_use_the_client_json_decoder(self):
+        """Test that the async client decodes cached bodies with its own decoder."""
+        cache = ResponseCache(today=lambda: TODAY)
+        transport = AsyncReplayTransport()
+        transport.add("GET", "https://api.ouraring.com/v2/usercollection/tag", json_body={"data": [], "next_token": None})
+        decoder = MagicMock(side_effect=json.loads)
+        client = AsyncOuraClient("test_token", cache=cache, transport=transport, json_decoder=decoder)
+
+        async def fetch_twice():
+            return [await client._make_request("/usercollection/tag") for _ in range(2)]
+
+        first, second = asyncio.run(fetch_twice())
+
+        self.assertEqual(first, second)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(decoder.call_count, 2)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
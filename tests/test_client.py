@@ -1,11 +1,13 @@
 """Tests for the Oura API client."""
 
 import unittest
+from array import array
 from unittest.mock import patch, MagicMock
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 
 from oura_api_client.api.client import OuraClient
-from oura_api_client.models.heartrate import HeartRateResponse
+from oura_api_client.models.heartrate import HeartRateResponse, HeartRateSample, HeartRateColumns
+from oura_api_client.utils.arrays import array_typecode
 from oura_api_client.models.daily_activity import (
     DailyActivityResponse, DailyActivityModel, ActivityContributors
 )
@@ -87,7 +89,7 @@ class TestOuraClient(unittest.TestCase):
         # Added vo2_max
         self.assertIsNotNone(self.client.vo2_max)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_heart_rate(self, mock_get):
         """Test getting heart rate data."""
         # Mock the API response
@@ -135,7 +137,7 @@ class TestDailyActivity(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_activity_documents(self, mock_get):
         mock_data = [
             {
@@ -197,7 +199,7 @@ class TestDailyActivity(unittest.TestCase):
         }
         self.assertEqual(called_params, expected_params)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_activity_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -227,7 +229,7 @@ class TestDailyActivity(unittest.TestCase):
         expected_params = {"start_date": start_date_str, "end_date": end_date_str}
         self.assertEqual(called_params, expected_params)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_activity_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -235,7 +237,7 @@ class TestDailyActivity(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_activity_document(self, mock_get):
         mock_response_json = {
             "id": "test_document_id",
@@ -298,7 +300,7 @@ class TestDailyActivity(unittest.TestCase):
         called_params = mock_get.call_args[1]['params']
         self.assertEqual(called_params, None)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_activity_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_document_id"
@@ -310,7 +312,7 @@ class TestDailySleep(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_sleep_documents(self, mock_get):
         mock_data = [
             {
@@ -381,7 +383,7 @@ class TestDailySleep(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_sleep_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -411,7 +413,7 @@ class TestDailySleep(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_sleep_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -419,7 +421,7 @@ class TestDailySleep(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_sleep_document(self, mock_get):
         mock_response_json = {
             "id": "test_sleep_document_id",
@@ -471,7 +473,7 @@ class TestDailySleep(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_sleep_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_sleep_document_id"
@@ -483,7 +485,7 @@ class TestDailyReadiness(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_readiness_documents(self, mock_get):
         mock_data = [
             {
@@ -544,7 +546,7 @@ class TestDailyReadiness(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_readiness_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -575,7 +577,7 @@ class TestDailyReadiness(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_readiness_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -583,7 +585,7 @@ class TestDailyReadiness(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_readiness_document(self, mock_get):
         mock_response_json = {
             "id": "test_readiness_document_id",
@@ -638,7 +640,7 @@ class TestDailyReadiness(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_readiness_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_readiness_document_id"
@@ -652,7 +654,7 @@ class TestSleep(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_documents(self, mock_get):
         # Reused from DailySleep for consistency
         mock_contributors_data = {
@@ -736,7 +738,7 @@ class TestSleep(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_documents_with_string_dates(self, mock_get):
         # Simplified mock data for this test
         mock_data = [{
@@ -765,7 +767,7 @@ class TestSleep(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -773,7 +775,7 @@ class TestSleep(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_document(self, mock_get):
         mock_contributors_data = {"deep_sleep": 70}
         mock_readiness_contributors_data = {"activity_balance": 60}
@@ -816,7 +818,7 @@ class TestSleep(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_sleep_doc_single_error"
@@ -828,7 +830,7 @@ class TestSession(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_session_documents(self, mock_get):
         mock_data = [
             {
@@ -882,7 +884,7 @@ class TestSession(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_session_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -913,7 +915,7 @@ class TestSession(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_session_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -921,7 +923,7 @@ class TestSession(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_session_document(self, mock_get):
         mock_response_json = {
             "id": "test_session_single",
@@ -961,7 +963,7 @@ class TestSession(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_session_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_session_single_error"
@@ -973,7 +975,7 @@ class TestTag(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tag_documents(self, mock_get):
         mock_data = [
             {
@@ -1022,7 +1024,7 @@ class TestTag(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tag_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -1052,7 +1054,7 @@ class TestTag(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tag_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -1060,7 +1062,7 @@ class TestTag(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tag_document(self, mock_get):
         mock_response_json = {
             "id": "test_tag_single",
@@ -1093,7 +1095,7 @@ class TestTag(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_tag_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_tag_single_error"
@@ -1105,7 +1107,7 @@ class TestWorkout(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_workout_documents(self, mock_get):
         mock_data = [
             {
@@ -1162,7 +1164,7 @@ class TestWorkout(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_workout_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -1195,7 +1197,7 @@ class TestWorkout(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_workout_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -1203,7 +1205,7 @@ class TestWorkout(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_workout_document(self, mock_get):
         mock_response_json = {
             "id": "test_workout_single",
@@ -1245,7 +1247,7 @@ class TestWorkout(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_workout_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_workout_single_error"
@@ -1257,7 +1259,7 @@ class TestEnhancedTag(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_enhanced_tag_documents(self, mock_get):
         mock_data = [
             {
@@ -1321,7 +1323,7 @@ class TestEnhancedTag(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_enhanced_tag_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -1351,7 +1353,7 @@ class TestEnhancedTag(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_enhanced_tag_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -1359,7 +1361,7 @@ class TestEnhancedTag(unittest.TestCase):
                 start_date="2024-03-01", end_date="2024-03-31"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_enhanced_tag_document(self, mock_get):
         mock_response_json = {
             "id": "test_enhanced_tag_single",
@@ -1399,7 +1401,7 @@ class TestEnhancedTag(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_enhanced_tag_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_enhanced_tag_single_error"
@@ -1411,7 +1413,7 @@ class TestDailySpo2(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_spo2_documents(self, mock_get):
         mock_data = [
             {
@@ -1471,7 +1473,7 @@ class TestDailySpo2(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_spo2_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -1501,7 +1503,7 @@ class TestDailySpo2(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_spo2_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -1509,7 +1511,7 @@ class TestDailySpo2(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_spo2_document(self, mock_get):
         mock_response_json = {
             "id": "test_spo2_single",
@@ -1545,7 +1547,7 @@ class TestDailySpo2(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_spo2_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_spo2_single_error"
@@ -1557,7 +1559,7 @@ class TestSleepTime(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_time_documents(self, mock_get):
         mock_data = [
             {
@@ -1639,7 +1641,7 @@ class TestSleepTime(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_time_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -1669,7 +1671,7 @@ class TestSleepTime(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_time_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -1677,7 +1679,7 @@ class TestSleepTime(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_time_document(self, mock_get):
         mock_response_json = {
             "id": "test_st_single",
@@ -1728,7 +1730,7 @@ class TestSleepTime(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_sleep_time_document_error(self, mock_get):
         # As per the implementation note, this endpoint might not exist.
         # If it doesn't, the API would return a 404, which _make_request would
@@ -1743,7 +1745,7 @@ class TestRestModePeriod(unittest.TestCase):
 
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_rest_mode_period_documents(self, mock_get):
         mock_data = [
             {
@@ -1802,7 +1804,7 @@ class TestRestModePeriod(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_rest_mode_period_documents_with_string_dates(self, mock_get):
         mock_data = [
             {
@@ -1832,7 +1834,7 @@ class TestRestModePeriod(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_rest_mode_period_documents_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         with self.assertRaises(OuraConnectionError):
@@ -1840,7 +1842,7 @@ class TestRestModePeriod(unittest.TestCase):
                 start_date="2024-03-10", end_date="2024-03-11"
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_rest_mode_period_document(self, mock_get):
         mock_response_json = {
             "id": "test_rmp_single",
@@ -1880,7 +1882,7 @@ class TestRestModePeriod(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_rest_mode_period_document_error(self, mock_get):
         mock_get.side_effect = OuraConnectionError("API error")
         document_id = "test_rmp_single_error"
@@ -1895,7 +1897,7 @@ class TestDailyStress(unittest.TestCase):
         self.client = OuraClient(access_token="test_token")
         self.base_url = self.client.BASE_URL
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_no_params(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -1912,7 +1914,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_start_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -1930,7 +1932,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -1946,7 +1948,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_start_and_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -1964,7 +1966,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_next_token(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -1982,7 +1984,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_success(self, mock_get):
         mock_data = [
             {
@@ -2021,7 +2023,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_api_error_400(self, mock_get):
         # Mock a 400 error response
         mock_response = MagicMock()
@@ -2034,7 +2036,7 @@ class TestDailyStress(unittest.TestCase):
         with self.assertRaises(OuraClientError):
             self.client.daily_stress.get_daily_stress_documents()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_documents_api_error_429(self, mock_get):
         # Mock a 429 error response
         mock_response = MagicMock()
@@ -2047,7 +2049,7 @@ class TestDailyStress(unittest.TestCase):
         with self.assertRaises(OuraRateLimitError):
             self.client.daily_stress.get_daily_stress_documents()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_document_success(self, mock_get):
         document_id = "sample_stress_id"
         mock_response_json = {
@@ -2078,7 +2080,7 @@ class TestDailyStress(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_stress_document_not_found_404(self, mock_get):
         document_id = "non_existent_id"
         # Mock a 404 error response
@@ -2098,7 +2100,7 @@ class TestDailyResilience(unittest.TestCase):
         self.client = OuraClient(access_token="test_token")
         self.base_url = self.client.BASE_URL
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_no_params(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2115,7 +2117,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_start_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2133,7 +2135,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2151,7 +2153,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_start_and_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2169,7 +2171,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_next_token(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2187,7 +2189,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_success(self, mock_get):
         mock_contributors_data = {
             "sleep_recovery": 75.0,
@@ -2232,7 +2234,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_documents_api_error_400(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = False
@@ -2243,7 +2245,7 @@ class TestDailyResilience(unittest.TestCase):
         with self.assertRaises(OuraClientError):
             self.client.daily_resilience.get_daily_resilience_documents()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_document_success(self, mock_get):
         document_id = "sample_res_id"
         mock_contributors_data = {
@@ -2281,7 +2283,7 @@ class TestDailyResilience(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_resilience_document_not_found_404(self, mock_get):
         document_id = "non_existent_res_id"
         mock_response = MagicMock()
@@ -2302,7 +2304,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
         self.client = OuraClient(access_token="test_token")
         self.base_url = self.client.BASE_URL
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_no_params(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2321,7 +2323,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_start_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2339,7 +2341,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2357,7 +2359,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_start_and_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2375,7 +2377,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_next_token(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2393,7 +2395,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_success(self, mock_get):
         mock_data = [
             {
@@ -2433,7 +2435,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_documents_api_error_400(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = False
@@ -2444,7 +2446,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
         with self.assertRaises(OuraClientError):
             self.client.daily_cardiovascular_age.get_daily_cardiovascular_age_documents()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_document_success(self, mock_get):
         document_id = "sample_cva_id"
         mock_response_json = {
@@ -2474,7 +2476,7 @@ class TestDailyCardiovascularAge(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_daily_cardiovascular_age_document_not_found_404(self, mock_get):
         document_id = "non_existent_cva_id"
         mock_response = MagicMock()
@@ -2496,7 +2498,7 @@ class TestVo2Max(unittest.TestCase):
         self.base_url = self.client.BASE_URL
         self.correct_path_segment = "/usercollection/vO2_max"  # Note the casing
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_no_params(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2513,7 +2515,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_start_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2529,7 +2531,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2545,7 +2547,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_start_and_end_date(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2563,7 +2565,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_next_token(self, mock_get):
         mock_response_data = {"data": [], "next_token": None}
         mock_response = MagicMock()
@@ -2579,7 +2581,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_success(self, mock_get):
         mock_data = [
             {
@@ -2616,7 +2618,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_documents_api_error_400(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = False
@@ -2627,7 +2629,7 @@ class TestVo2Max(unittest.TestCase):
         with self.assertRaises(OuraClientError):
             self.client.vo2_max.get_vo2_max_documents()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_document_success(self, mock_get):
         document_id = "sample_vo2_id"
         mock_response_json = {
@@ -2658,7 +2660,7 @@ class TestVo2Max(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_vo2_max_document_not_found_404(self, mock_get):
         document_id = "non_existent_vo2_id"
         mock_response = MagicMock()
@@ -2684,7 +2686,7 @@ class TestWebhook(unittest.TestCase):
         )
         self.base_url = "https://api.ouraring.com/v2"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_webhook_subscriptions(self, mock_get):
         """Test listing webhook subscriptions."""
         # Mock response
@@ -2719,7 +2721,7 @@ class TestWebhook(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_webhook_subscription(self, mock_post):
         """Test creating a webhook subscription."""
         from oura_api_client.models.webhook import WebhookOperation, ExtApiV2DataType
@@ -2751,7 +2753,7 @@ class TestWebhook(unittest.TestCase):
         self.assertIn("json", call_args[1])
         self.assertEqual(call_args[1]["json"]["callback_url"], "https://example.com/webhook")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_webhook_subscription(self, mock_get):
         """Test getting a specific webhook subscription."""
         # Mock response
@@ -2783,7 +2785,7 @@ class TestWebhook(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_update_webhook_subscription(self, mock_put):
         """Test updating a webhook subscription."""
         from oura_api_client.models.webhook import WebhookOperation, ExtApiV2DataType
@@ -2815,7 +2817,7 @@ class TestWebhook(unittest.TestCase):
         call_args = mock_put.call_args
         self.assertIn("json", call_args[1])
 
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_webhook_subscription(self, mock_delete):
         """Test deleting a webhook subscription."""
         # Mock response
@@ -2841,7 +2843,7 @@ class TestWebhook(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_renew_webhook_subscription(self, mock_put):
         """Test renewing a webhook subscription."""
         # Mock response
@@ -2873,7 +2875,7 @@ class TestWebhook(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_webhook_requires_credentials(self, mock_get):
         """Test that webhook operations require client_id and client_secret."""
         client_without_creds = OuraClient(access_token="test_token")
@@ -2894,7 +2896,7 @@ class TestHTTPMethods(unittest.TestCase):
         """Set up test client."""
         self.client = OuraClient(access_token="test_token")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_post_method_with_json_data(self, mock_post):
         """Test POST method with JSON data."""
         mock_response = MagicMock()
@@ -2917,7 +2919,7 @@ class TestHTTPMethods(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.put")
+    @patch("requests.Session.put")
     def test_put_method_without_json_data(self, mock_put):
         """Test PUT method without JSON data."""
         mock_response = MagicMock()
@@ -2935,7 +2937,7 @@ class TestHTTPMethods(unittest.TestCase):
             timeout=30.0,
         )
 
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_method_empty_response(self, mock_delete):
         """Test DELETE method with empty response."""
         mock_response = MagicMock()
@@ -2949,7 +2951,7 @@ class TestHTTPMethods(unittest.TestCase):
         self.assertEqual(result, {})
         mock_delete.assert_called_once()
 
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_patch_method_with_headers(self, mock_patch):
         """Test PATCH method with custom headers."""
         mock_response = MagicMock()
@@ -2985,3 +2987,210 @@ class TestHTTPMethods(unittest.TestCase):
             self.client._make_request("/test", method="TRACE")
         
         self.assertIn("HTTP method TRACE is not supported", str(context.exception))
+
+
+class TestConnectionPooling(unittest.TestCase):
+    """Test cases for the pooled HTTP session."""
+
+    def test_session_is_shared_across_requests(self):
+        """Test that consecutive requests reuse the client's session."""
+        client = OuraClient(access_token="test_token")
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"data": [], "next_token": None}
+
+        with patch.object(client.http_session, "get", return_value=mock_response) as mock_get:
+            client.daily_sleep.get_daily_sleep_documents()
+            client.heartrate.get_heartrate()
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_pool_configuration(self):
+        """Test that pool settings are applied to the mounted adapter."""
+        client = OuraClient(
+            access_token="test_token", pool_connections=4, pool_maxsize=32
+        )
+        adapter = client.http_session.get_adapter("https://api.ouraring.com/v2")
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(client.http_session.headers["Connection"], "keep-alive")
+
+    def test_keep_alive_disabled(self):
+        """Test that disabling keep-alive closes connections after each request."""
+        client = OuraClient(access_token="test_token", keep_alive=False)
+        self.assertEqual(client.http_session.headers["Connection"], "close")
+
+    def test_custom_session(self):
+        """Test that a user supplied session is used as-is."""
+        session = requests.Session()
+        client = OuraClient(access_token="test_token", http_session=session)
+        self.assertIs(client.http_session, session)
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the client's own session."""
+        client = OuraClient(access_token="test_token")
+        with patch.object(client.http_session, "close") as close:
+            with client:
+                close.assert_not_called()
+            close.assert_called_once()
+
+    def test_context_manager_keeps_custom_session_open(self):
+        """Test that a user supplied session stays open, as the caller owns it."""
+        session = MagicMock()
+        with OuraClient(access_token="test_token", http_session=session):
+            pass
+        session.close.assert_not_called()
+
+
+class TestHeartRateColumnar(unittest.TestCase):
+    """Test cases for columnar heart rate responses."""
+
+    RESPONSE = {
+        "data": [
+            {"timestamp": "2024-03-01T12:00:00+00:00", "bpm": 60, "source": "awake"},
+            {"timestamp": "2024-03-01T12:05:00Z", "bpm": 72, "source": "workout"},
+            {"timestamp": "2024-03-01T14:05:00+02:00", "bpm": 55, "source": "custom"},
+        ],
+        "next_token": "next",
+    }
+
+    def setUp(self):
+        self.client = OuraClient(access_token="test_token")
+
+    def _get_columns(self, response=None):
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.json.return_value = response or self.RESPONSE
+        with patch("requests.Session.get", return_value=mock_response):
+            return self.client.heartrate.get_heartrate(start_date="2024-03-01", columnar=True)
+
+    def test_get_heartrate_columnar(self):
+        """Test that columnar mode returns compact typed arrays."""
+        columns = self._get_columns()
+
+        self.assertIsInstance(columns, HeartRateColumns)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(list(columns.timestamps), [1709294400, 1709294700, 1709294700])
+        self.assertEqual(list(columns.bpm), [60, 72, 55])
+        self.assertEqual(columns.source_names(), ["awake", "workout", "custom"])
+        self.assertEqual(columns.next_token, "next")
+        self.assertEqual(array_typecode(columns.timestamps), "q")
+        self.assertEqual(array_typecode(columns.bpm), "B")
+        self.assertEqual(array_typecode(columns.source_codes), "B")
+
+        samples = columns.to_samples()
+        self.assertIsInstance(samples[0], HeartRateSample)
+        self.assertEqual(samples[2].timestamp, datetime(2024, 3, 1, 12, 5, tzinfo=timezone.utc))
+
+    def test_columnar_without_numpy(self):
+        """Test that the array module is used when NumPy is unavailable."""
+        with patch("oura_api_client.utils.arrays.np", None):
+            columns = self._get_columns()
+            merged = HeartRateColumns.concat([columns, columns])
+
+        self.assertIsInstance(columns.timestamps, array)
+        self.assertEqual(columns.timestamps.typecode, "q")
+        self.assertEqual(columns.bpm.typecode, "B")
+        self.assertEqual(len(merged), 6)
+        self.assertEqual(merged.source_names()[3:], ["awake", "workout", "custom"])
+
+    def test_concat_remaps_sources_and_widens_bpm(self):
+        """Test concatenating chunks with different sources and bpm ranges."""
+        first = self._get_columns()
+        second = self._get_columns({
+            "data": [
+                {"timestamp": "2024-03-02T00:00:00+00:00", "bpm": 300, "source": "other"},
+                {"timestamp": "2024-03-02T00:05:00+00:00", "bpm": 61, "source": "custom"},
+            ],
+            "next_token": None,
+        })
+
+        merged = HeartRateColumns.concat([second, first])
+
+        self.assertEqual(array_typecode(second.bpm), "h")
+        self.assertEqual(array_typecode(merged.bpm), "h")
+        self.assertEqual(list(merged.bpm), [300, 61, 60, 72, 55])
+        self.assertEqual(
+            merged.source_names(), ["other", "custom", "awake", "workout", "custom"]
+        )
+        self.assertEqual(merged.next_token, "next")
+
+    def test_stream_columnar_yields_page_chunks(self):
+        """Test that columnar streaming yields one chunk per page."""
+        pages = [
+            MagicMock(ok=True, **{"json.return_value": self.RESPONSE}),
+            MagicMock(ok=True, **{"json.return_value": {**self.RESPONSE, "next_token": None}}),
+        ]
+        with patch("requests.Session.get", side_effect=pages) as mock_get:
+            chunks = list(self.client.heartrate.stream(start_date="2024-03-01", columnar=True))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(all(isinstance(chunk, HeartRateColumns) for chunk in chunks))
+        self.assertEqual(len(HeartRateColumns.concat(chunks)), 6)
+        self.assertEqual(mock_get.call_args_list[1].kwargs["params"]["next_token"], "next")
+
+
+class TestRawResponses(unittest.TestCase):
+    """Test cases for the unvalidated raw dict fast path."""
+
+    ROUTERS = (
+        "daily_activity", "daily_cardiovascular_age", "daily_readiness",
+        "daily_resilience", "daily_sleep", "daily_spo2", "daily_stress",
+        "enhanced_tag", "rest_mode_period", "ring_configuration", "session",
+        "sleep", "sleep_time", "tag", "vo2_max", "workout",
+    )
+
+    def setUp(self):
+        self.client = OuraClient(access_token="test_token")
+
+    @patch("requests.Session.get")
+    def test_every_router_returns_raw_dicts(self, mock_get):
+        """Test that return_model=False skips validation on every router."""
+        # Missing required fields would fail validation
+        page = {"data": [{"id": "doc-1"}], "next_token": None}
+        document = {"id": "doc-1"}
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_get.return_value = mock_response
+
+        for name in self.ROUTERS:
+            with self.subTest(router=name):
+                router = getattr(self.client, name)
+                mock_response.json.return_value = page
+                self.assertIs(
+                    getattr(router, f"get_{name}_documents")(return_model=False), page
+                )
+                mock_response.json.return_value = document
+                self.assertIs(
+                    getattr(router, f"get_{name}_document")("doc-1", return_model=False), document
+                )
+
+    @patch("requests.Session.get")
+    def test_stream_raw_dicts(self, mock_get):
+        """Test that stream(return_model=False) yields the raw documents of every page."""
+        page1 = MagicMock(ok=True)
+        page1.json.return_value = {"data": [{"id": "1", "day": "2024-03-01"}], "next_token": "next"}
+        page2 = MagicMock(ok=True)
+        page2.json.return_value = {"data": [{"id": "2", "day": "2024-03-02"}], "next_token": None}
+        mock_get.side_effect = [page1, page2]
+
+        documents = list(self.client.daily_readiness.stream(start_date="2024-03-01", return_model=False))
+
+        self.assertEqual(documents, [{"id": "1", "day": "2024-03-01"}, {"id": "2", "day": "2024-03-02"}])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["params"]["next_token"], "next")
+
+    @patch("requests.Session.get")
+    def test_models_are_validated_by_default(self, mock_get):
+        """Test that the default path still validates and converts fields."""
+        mock_response = MagicMock(ok=True)
+        mock_response.json.return_value = {
+            "id": "1", "day": "2024-03-01", "timestamp": "2024-03-01T00:00:00+00:00",
+            "contributors": {}
+        }
+        mock_get.return_value = mock_response
+
+        document = self.client.daily_readiness.get_daily_readiness_document("1")
+
+        self.assertIsInstance(document, DailyReadinessModel)
+        self.assertEqual(document.day, date(2024, 3, 1))
@@ -167,7 +167,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         """Set up test client."""
         self.client = OuraClient("test_token")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_success(self, mock_get):
         """Test successful request."""
         mock_response = MagicMock()
@@ -179,7 +179,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         self.assertEqual(result, {"data": "test"})
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_http_error(self, mock_get):
         """Test request with HTTP error."""
         mock_response = MagicMock()
@@ -196,7 +196,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         self.assertEqual(cm.exception.status_code, 404)
         self.assertEqual(cm.exception.endpoint, "/test")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_timeout(self, mock_get):
         """Test request timeout."""
         mock_get.side_effect = requests.exceptions.Timeout("Timeout")
@@ -207,7 +207,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         self.assertIn("timed out", cm.exception.message)
         self.assertEqual(cm.exception.endpoint, "/test")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_connection_error(self, mock_get):
         """Test connection error."""
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -218,7 +218,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         self.assertIn("Failed to connect", cm.exception.message)
         self.assertEqual(cm.exception.endpoint, "/test")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_with_retry_success(self, mock_get):
         """Test successful retry after transient error."""
         # First call fails with server error, second succeeds
@@ -245,7 +245,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         self.assertEqual(result, {"data": "success"})
         self.assertEqual(mock_get.call_count, 2)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("time.sleep")
     def test_make_request_with_retry_exhausted(self, mock_sleep, mock_get):
         """Test retry exhaustion."""
@@ -269,7 +269,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         self.assertEqual(cm.exception.message, "Server error")
         self.assertEqual(mock_get.call_count, 3)  # Initial + 2 retries
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("time.sleep")
     def test_make_request_with_rate_limit_retry(self, mock_sleep, mock_get):
         """Test retry with rate limit and Retry-After header."""
@@ -294,7 +294,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         # Should have slept for the Retry-After duration
         mock_sleep.assert_called_once_with(2)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_make_request_no_retry_on_client_error(self, mock_get):
         """Test that client errors are not retried."""
         mock_response = MagicMock()
@@ -314,7 +314,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
 
     def test_make_request_endpoint_normalization(self):
         """Test endpoint normalization."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.ok = True
             mock_response.json.return_value = {}
@@ -338,7 +338,7 @@ class TestOuraClientErrorHandling(unittest.TestCase):
         """Test that retry can be disabled."""
         self.client.retry_config = RetryConfig(enabled=False)
         
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.ok = False
             mock_response.status_code = 500
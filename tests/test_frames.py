@@ -0,0 +1,191 @@
+"""Tests for Arrow and pandas export of documents."""
+
+import asyncio
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models import frames
+from oura_api_client.models.daily_activity import DailyActivityModel
+from oura_api_client.models.daily_sleep import DailySleepModel, DailySleepResponse
+from oura_api_client.models.heartrate import HeartRateResponse
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+BASE_URL = "https://api.ouraring.com/v2/usercollection"
+
+
+def daily_sleep(day, score=80, sleep_type="long_sleep"):
+    return {
+        "id": f"sleep-{day}",
+        "contributors": {"deep_sleep": 90, "efficiency": None, "total_sleep": 75},
+        "day": day,
+        "score": score,
+        "timestamp": f"{day}T07:30:00+02:00",
+        "type": sleep_type,
+        "low_battery_alert": False,
+    }
+
+
+SLEEP_PAGE = {
+    "data": [daily_sleep("2024-03-01"), daily_sleep("2024-03-02", None, "nap"), daily_sleep("2024-03-03", 91)],
+    "next_token": None,
+}
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestResponseExport(unittest.TestCase):
+    """Test to_arrow() and to_dataframe() on response models."""
+
+    def test_to_arrow_types(self):
+        """Test the tight column types of a page."""
+        table = DailySleepResponse(**SLEEP_PAGE).to_arrow()
+
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.schema.field("score").type, pa.int16())
+        self.assertEqual(table.schema.field("contributors_deep_sleep").type, pa.int16())
+        self.assertEqual(table.schema.field("type").type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(table.schema.field("day").type, pa.date32())
+        self.assertEqual(table.schema.field("timestamp").type, pa.timestamp("us", tz="UTC"))
+        self.assertNotIn("contributors", table.schema.names)
+        self.assertEqual(table.column("score").to_pylist(), [80, None, 91])
+        self.assertEqual(table.column("day").to_pylist()[0], date(2024, 3, 1))
+        self.assertEqual(
+            table.column("timestamp").to_pylist()[0],
+            datetime(2024, 3, 1, 5, 30, tzinfo=timezone.utc)
+        )
+
+    def test_raw_documents_match_models(self):
+        """Test that raw dicts convert to the same batch as validated models."""
+        models = DailySleepResponse(**SLEEP_PAGE).data
+
+        self.assertTrue(
+            frames.documents_to_arrow(SLEEP_PAGE["data"], DailySleepModel).equals(
+                frames.documents_to_arrow(models, DailySleepModel)
+            )
+        )
+
+    def test_raw_timestamps_without_offset_are_utc(self):
+        """Test that raw timestamps without a UTC offset are read as UTC, like models."""
+        documents = [
+            dict(daily_sleep("2024-03-01"), timestamp="2024-03-01T07:30:00"),
+            dict(daily_sleep("2024-03-02"), timestamp="2024-03-02T07:30:00.250Z"),
+            dict(daily_sleep("2024-03-03"), timestamp="2024-03-03T07:30:00-05:00"),
+        ]
+
+        table = frames.documents_to_arrow(documents, DailySleepModel)
+
+        self.assertEqual(table.column("timestamp").to_pylist(), [
+            datetime(2024, 3, 1, 7, 30, tzinfo=timezone.utc),
+            datetime(2024, 3, 2, 7, 30, 0, 250000, tzinfo=timezone.utc),
+            datetime(2024, 3, 3, 12, 30, tzinfo=timezone.utc),
+        ])
+        models = [DailySleepModel(**document) for document in documents]
+        self.assertTrue(table.equals(frames.documents_to_arrow(models, DailySleepModel)))
+
+    def test_time_series_fields_are_left_out(self):
+        """Test that sub-models holding sample lists are not flattened into columns."""
+        columns = [column.name for column in frames.document_columns(DailyActivityModel)]
+
+        self.assertIn("contributors_stay_active", columns)
+        self.assertIn("class_5_min", columns)
+        self.assertFalse([name for name in columns if name.startswith("met_")])
+
+    def test_empty_page(self):
+        """Test that empty pages still have the full schema."""
+        table = HeartRateResponse(data=[]).to_arrow()
+
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["timestamp", "bpm", "source"])
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_to_dataframe_dtypes(self):
+        """Test that DataFrames keep nullable ints, categoricals and datetimes."""
+        frame = DailySleepResponse(**SLEEP_PAGE).to_dataframe()
+
+        self.assertEqual(str(frame["score"].dtype), "Int16")
+        self.assertEqual(str(frame["type"].dtype), "category")
+        self.assertEqual(str(frame["low_battery_alert"].dtype), "boolean")
+        self.assertTrue(str(frame["day"].dtype).startswith("datetime64"))
+        self.assertTrue(pd.isna(frame["score"][1]))
+        self.assertEqual(list(frame["type"].cat.categories), ["long_sleep", "nap"])
+
+    def test_missing_pyarrow(self):
+        """Test the error raised when pyarrow is not installed."""
+        with patch.object(frames, "pa", None):
+            with self.assertRaisesRegex(ImportError, r"oura-api-client\[arrow\]"):
+                DailySleepResponse(**SLEEP_PAGE).to_arrow()
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestStreamBatches(unittest.TestCase):
+    """Test the routers' stream_batches()."""
+
+    def setUp(self):
+        self.transport = ReplayTransport()
+        self.transport.add("GET", f"{BASE_URL}/daily_sleep", params={"start_date": "2024-03-01"}, json_body={
+            "data": SLEEP_PAGE["data"][:2], "next_token": "t2",
+        })
+        self.transport.add(
+            "GET", f"{BASE_URL}/daily_sleep",
+            params={"start_date": "2024-03-01", "next_token": "t2"},
+            json_body={"data": SLEEP_PAGE["data"][2:]}
+        )
+        self.client = OuraClient("test_token", transport=self.transport)
+
+    def test_batches_span_pages(self):
+        """Test that batches are cut by size, not by page."""
+        batches = list(self.client.daily_sleep.stream_batches(batch_size=2, start_date="2024-03-01"))
+
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(batches[1].column(batches[1].schema.get_field_index("score")).to_pylist(), [91])
+        self.assertEqual(batches[0].schema, frames.arrow_schema(DailySleepModel))
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_pandas_output(self):
+        """Test yielding DataFrames."""
+        frame, = self.client.daily_sleep.stream_batches(output="pandas", start_date="2024-03-01")
+
+        self.assertEqual(list(frame["id"]), ["sleep-2024-03-01", "sleep-2024-03-02", "sleep-2024-03-03"])
+
+    def test_invalid_arguments(self):
+        """Test that bad options fail before any request is made."""
+        with self.assertRaises(ValueError):
+            self.client.daily_sleep.stream_batches(output="polars")
+        with self.assertRaises(ValueError):
+            self.client.daily_sleep.stream_batches(batch_size=0)
+        with self.assertRaises(TypeError):
+            self.client.webhook.stream_batches()
+        self.assertEqual(self.transport.calls, [])
+
+    def test_async_router(self):
+        """Test stream_batches() on the async client."""
+        transport = AsyncReplayTransport()
+        transport.add("GET", f"{BASE_URL}/heartrate", json_body={"data": [
+            {"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 60, "source": "awake"},
+            {"timestamp": "2024-03-01T10:05:00+00:00", "bpm": 72, "source": "rest"},
+        ]})
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        async def collect():
+            return [batch async for batch in client.heartrate.stream_batches(batch_size=10)]
+
+        batch, = asyncio.run(collect())
+
+        self.assertEqual(batch.column(1).type, pa.int16())
+        self.assertEqual(batch.column(2).to_pylist(), ["awake", "rest"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for the pluggable JSON decoders."""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from oura_api_client.api.client import OuraClient
+from oura_api_client.transports import ReplayTransport
+from oura_api_client.utils import get_json_decoder
+from oura_api_client.utils import json_decoding
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+TAG_URL = "https://api.ouraring.com/v2/usercollection/tag"
+BODY = {"data": [{"id": "tag-1", "text": "é"}], "next_token": None}
+
+
+class TestGetJsonDecoder(unittest.TestCase):
+    """Test decoder selection and fallback."""
+
+    def test_stdlib(self):
+        """Test that the stdlib decoder is always available."""
+        decoder = get_json_decoder("json")
+
+        self.assertIs(decoder, json.loads)
+        self.assertEqual(decoder(json.dumps(BODY).encode()), BODY)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        """Test decoding bytes with orjson."""
+        decoder = get_json_decoder("orjson")
+
+        self.assertIs(decoder, orjson.loads)
+        self.assertEqual(decoder(json.dumps(BODY).encode()), BODY)
+
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_msgspec(self):
+        """Test decoding bytes with msgspec."""
+        self.assertEqual(get_json_decoder("msgspec")(json.dumps(BODY).encode()), BODY)
+
+    def test_auto_prefers_fastest_installed(self):
+        """Test the auto order orjson, msgspec, stdlib."""
+        fake_orjson = MagicMock()
+        fake_msgspec = MagicMock()
+
+        with patch.object(json_decoding, "orjson", fake_orjson), \
+                patch.object(json_decoding, "msgspec", fake_msgspec):
+            self.assertIs(get_json_decoder("auto"), fake_orjson.loads)
+        with patch.object(json_decoding, "orjson", None), \
+                patch.object(json_decoding, "msgspec", fake_msgspec):
+            self.assertIs(get_json_decoder(), fake_msgspec.json.Decoder().decode)
+        with patch.object(json_decoding, "orjson", None), \
+                patch.object(json_decoding, "msgspec", None):
+            self.assertIs(get_json_decoder(), json.loads)
+
+    def test_missing_or_unknown_decoder(self):
+        """Test errors for uninstalled and unknown decoders."""
+        with patch.object(json_decoding, "orjson", None):
+            with self.assertRaises(ImportError):
+                get_json_decoder("orjson")
+        with self.assertRaises(ValueError):
+            get_json_decoder("simplejson")
+
+    def test_callable_decoder(self):
+        """Test that a custom callable is used as is."""
+        decoder = lambda body: {"custom": True}  # noqa: E731
+        self.assertIs(get_json_decoder(decoder), decoder)
+
+
+class TestClientJsonDecoder(unittest.TestCase):
+    """Test that the client decodes response bytes with its decoder."""
+
+    def setUp(self):
+        self.transport = ReplayTransport()
+        self.transport.add("GET", TAG_URL, json_body=BODY)
+        self.decoder = MagicMock(side_effect=json.loads)
+
+    def test_decoder_applies_to_decoded_requests(self):
+        """Test that _make_request decodes bodies with the configured decoder."""
+        client = OuraClient("test_token", transport=self.transport, json_decoder=self.decoder)
+
+        self.assertEqual(client._make_request("/usercollection/tag"), BODY)
+        self.assertIsInstance(self.decoder.call_args[0][0], bytes)
+
+    def test_decoder_applies_to_raw_router_results(self):
+        """Test that return_model=False pages are decoded with the configured decoder."""
+        client = OuraClient("test_token", transport=self.transport, json_decoder=self.decoder)
+
+        self.assertEqual(client.tag.get_tag_documents(return_model=False), BODY)
+        self.decoder.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_responses_without_bytes_use_their_json(self, mock_get):
+        """Test the fallback to response.json() when no body bytes are available."""
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.json.return_value = BODY
+        mock_get.return_value = mock_response
+        client = OuraClient("test_token", json_decoder=self.decoder)
+
+        self.assertEqual(client._make_request("/usercollection/tag"), BODY)
+        self.decoder.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
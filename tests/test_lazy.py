@@ -0,0 +1,195 @@
+"""Tests for lazily validated pages."""
+
+import asyncio
+import unittest
+from datetime import date
+from unittest.mock import Mock, patch
+
+from pydantic import ValidationError
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models.daily_readiness import DailyReadinessModel, DailyReadinessResponse
+from oura_api_client.models.heartrate import HeartRateResponse, HeartRateSample
+from oura_api_client.models.adapters import parse_model
+from oura_api_client.models.lazy import LazyPage, filter_page, page_item_type
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+
+READINESS_URL = "https://api.ouraring.com/v2/usercollection/daily_readiness"
+
+
+def readiness(day, score=80):
+    return {
+        "id": f"readiness-{day}",
+        "contributors": {},
+        "day": day,
+        "score": score,
+        "timestamp": f"{day}T00:00:00+00:00",
+    }
+
+
+PAGE = {
+    "data": [readiness("2024-03-01"), readiness("2024-03-03", 91), readiness("2024-03-02")],
+    "next_token": None,
+}
+
+
+class TestLazyItems(unittest.TestCase):
+    """Test per-item validation on first access."""
+
+    def setUp(self):
+        self.parse = Mock(side_effect=lambda document: DailyReadinessModel(**document))
+        self.page = LazyPage.from_dict(PAGE, self.parse)
+
+    def test_items_are_validated_on_first_access(self):
+        """Test that only accessed items are validated, each once."""
+        self.assertEqual(len(self.page.data), 3)
+        self.parse.assert_not_called()
+
+        first = self.page.data[0]
+
+        self.assertIsInstance(first, DailyReadinessModel)
+        self.assertIs(self.page.data[0], first)
+        self.assertEqual(self.parse.call_count, 1)
+        self.assertEqual(self.page.data.validated_count, 1)
+
+    def test_peek_reads_raw_fields(self):
+        """Test finding the latest day without validating every document."""
+        days = self.page.data.peek("day")
+
+        latest = self.page.data[days.index(max(days))]
+
+        self.assertEqual(days, ["2024-03-01", "2024-03-03", "2024-03-02"])
+        self.assertEqual(latest.score, 91)
+        self.assertEqual(self.page.data.peek("missing", "n/a"), ["n/a"] * 3)
+        self.assertEqual(self.page.data.raw(2), PAGE["data"][2])
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_iteration_and_slices(self):
+        """Test that iteration and slicing validate the items they reach."""
+        self.assertEqual([item.day for item in self.page.data[-2:]], [date(2024, 3, 3), date(2024, 3, 2)])
+
+        for item in self.page.data:
+            break
+
+        self.assertEqual(item.day, date(2024, 3, 1))
+        self.assertEqual(self.page.data.validated_count, 3)
+        self.assertIsNone(self.page.next_token)
+
+    def test_invalid_items_fail_on_access(self):
+        """Test that a bad document only fails when it is accessed."""
+        page = LazyPage.from_dict(
+            {"data": [readiness("2024-03-01"), {"id": "broken"}]},
+            lambda document: DailyReadinessModel(**document)
+        )
+
+        self.assertEqual(page.data[0].id, "readiness-2024-03-01")
+        with self.assertRaises(ValidationError):
+            page.data[1]
+
+    def test_filter_keeps_raw_documents(self):
+        """Test that filtering validates nothing and keeps validated items."""
+        first = self.page.data[0]
+
+        filtered = filter_page(self.page, lambda raw: raw["day"] != "2024-03-03")
+
+        self.assertIsInstance(filtered, LazyPage)
+        self.assertEqual(filtered.data.peek("score"), [80, 80])
+        self.assertIs(filtered.data[0], first)
+        self.assertEqual(self.parse.call_count, 1)
+        self.assertEqual(filter_page(PAGE, lambda raw: raw["score"] > 90)["data"], [PAGE["data"][1]])
+
+    def test_page_item_type(self):
+        """Test finding the document model of a response model."""
+        self.assertIs(page_item_type(DailyReadinessResponse), DailyReadinessModel)
+        self.assertIs(page_item_type(HeartRateResponse), HeartRateSample)
+
+
+class TestLazyRouters(unittest.TestCase):
+    """Test the routers' lazy option."""
+
+    def setUp(self):
+        self.transport = ReplayTransport()
+        self.transport.add("GET", READINESS_URL, json_body=PAGE)
+        self.client = OuraClient("test_token", transport=self.transport)
+
+    def test_get_documents_lazy(self):
+        """Test that lazy=True returns a LazyPage of validated-on-access models."""
+        page = self.client.daily_readiness.get_daily_readiness_documents(lazy=True)
+
+        self.assertIsInstance(page, LazyPage)
+        self.assertEqual(page.data.validated_count, 0)
+        self.assertEqual(page.data[1], DailyReadinessModel(**PAGE["data"][1]))
+
+    def test_stream_lazy_stops_validating_early(self):
+        """Test that a consumer stopping early leaves the rest of the page unvalidated."""
+        fetch = self.client.daily_readiness.get_daily_readiness_documents
+        pages = []
+        self.client.daily_readiness.get_daily_readiness_documents = (
+            lambda **kwargs: pages.append(fetch(**kwargs)) or pages[-1]
+        )
+
+        documents = self.client.daily_readiness.stream(lazy=True)
+
+        self.assertEqual(next(documents).id, "readiness-2024-03-01")
+        self.assertEqual(pages[0].data.validated_count, 1)
+        self.assertEqual([document.score for document in documents], [91, 80])
+
+    def test_stream_where_runs_before_validation(self):
+        """Test that only documents matching the raw predicate are validated."""
+        with patch("oura_api_client.router.parse_model", wraps=parse_model) as parse:
+            documents = list(self.client.daily_readiness.stream(where=lambda raw: raw["day"] >= "2024-03-02"))
+
+        self.assertEqual([document.day for document in documents], [date(2024, 3, 3), date(2024, 3, 2)])
+        self.assertEqual(parse.call_count, 2)
+
+    def test_stream_where_on_raw_dicts(self):
+        """Test the predicate with return_model=False and its columnar restriction."""
+        documents = list(self.client.daily_readiness.stream(return_model=False, where=lambda raw: raw["score"] > 90))
+
+        self.assertEqual(documents, [PAGE["data"][1]])
+        with self.assertRaises(ValueError):
+            self.client.heartrate.stream(columnar=True, where=lambda raw: True)
+
+    def test_raw_responses_ignore_lazy(self):
+        """Test that return_model=False still returns the decoded dict."""
+        self.assertEqual(
+            self.client.daily_readiness.get_daily_readiness_documents(return_model=False, lazy=True),
+            PAGE
+        )
+
+    def test_async_router(self):
+        """Test the lazy option on the async client."""
+        transport = AsyncReplayTransport()
+        transport.add("GET", READINESS_URL, json_body=PAGE)
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        async def collect():
+            page = await client.daily_readiness.get_daily_readiness_documents(lazy=True)
+            documents = [document async for document in client.daily_readiness.stream(lazy=True)]
+            return page, documents
+
+        page, documents = asyncio.run(collect())
+
+        self.assertIsInstance(page, LazyPage)
+        self.assertEqual([document.score for document in documents], [80, 91, 80])
+
+    def test_async_stream_where(self):
+        """Test the raw predicate on the async client."""
+        transport = AsyncReplayTransport()
+        transport.add("GET", READINESS_URL, json_body=PAGE)
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        async def collect():
+            stream = client.daily_readiness.stream(where=lambda raw: raw["score"] > 90)
+            return [document async for document in stream]
+
+        with patch("oura_api_client.router.parse_model", wraps=parse_model) as parse:
+            documents = asyncio.run(collect())
+
+        self.assertEqual([document.score for document in documents], [91])
+        self.assertEqual(parse.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,22 @@
 """Tests for pagination helpers functionality."""
 
+import asyncio
+import json
+import threading
+import time
 import unittest
 from unittest.mock import Mock, MagicMock
-from datetime import date
+from datetime import date, timedelta
 
-from oura_api_client.utils.pagination import stream_paginated_data
+from oura_api_client.exceptions import OuraAPIError
+from oura_api_client.utils.pagination import (
+    AsyncResumableStream,
+    ResumableStream,
+    StreamCursor,
+    stream_paginated_data
+)
+from oura_api_client.utils.sharding import split_date_range, stream_sharded_data
+from oura_api_client.api.client import OuraClient
 from oura_api_client.api.daily_sleep import DailySleep
 from oura_api_client.api.daily_activity import DailyActivity
 from oura_api_client.api.heartrate import HeartRateEndpoints
@@ -92,6 +104,322 @@ class TestPaginationUtils(unittest.TestCase):
             custom_param="test_value"
         )
 
+    def test_stream_paginated_data_with_prefetch(self):
+        """Test that prefetching yields the same items in the same order."""
+        page1 = MockResponse(data=[1, 2], next_token="token_page2")
+        page2 = MockResponse(data=[3, 4], next_token="token_page3")
+        page3 = MockResponse(data=[5], next_token=None)
+        mock_fetch = Mock(side_effect=[page1, page2, page3])
+
+        results = list(stream_paginated_data(
+            mock_fetch,
+            start_date="2024-01-01",
+            prefetch=2
+        ))
+
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+        self.assertEqual(mock_fetch.call_count, 3)
+        mock_fetch.assert_called_with(
+            start_date="2024-01-01",
+            end_date=None,
+            next_token="token_page3"
+        )
+
+    def test_stream_paginated_data_prefetch_propagates_errors(self):
+        """Test that errors raised by the prefetch thread reach the consumer."""
+        page1 = MockResponse(data=[1, 2], next_token="token_page2")
+        mock_fetch = Mock(side_effect=[page1, OuraAPIError("boom")])
+
+        stream = stream_paginated_data(mock_fetch, prefetch=1)
+
+        self.assertEqual(next(stream), 1)
+        self.assertEqual(next(stream), 2)
+        with self.assertRaises(OuraAPIError):
+            next(stream)
+
+    def test_stream_paginated_data_prefetch_stops_on_close(self):
+        """Test that the prefetch thread stops once the consumer stops."""
+        def fetch(start_date=None, end_date=None, next_token=None):
+            return MockResponse(data=[0], next_token="more")
+
+        mock_fetch = Mock(side_effect=fetch)
+        stream = stream_paginated_data(mock_fetch, prefetch=1)
+        next(stream)
+        stream.close()
+
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and any(
+            t.name == "oura-page-prefetch" for t in threading.enumerate()
+        ):
+            time.sleep(0.05)
+        calls = mock_fetch.call_count
+        time.sleep(0.2)
+        self.assertEqual(mock_fetch.call_count, calls)
+        self.assertLessEqual(calls, 3)
+
+
+    def test_stream_raw_dict_pages(self):
+        """Test that raw response dicts are paginated like response models."""
+        page1 = {"data": [{"id": "1"}, {"id": "2"}], "next_token": "token2"}
+        page2 = {"data": [{"id": "3"}]}
+        mock_fetch = Mock(side_effect=[page1, page2])
+
+        results = list(stream_paginated_data(mock_fetch, start_date="2024-01-01", return_model=False))
+
+        self.assertEqual([item["id"] for item in results], ["1", "2", "3"])
+        mock_fetch.assert_called_with(
+            start_date="2024-01-01", end_date=None, next_token="token2", return_model=False
+        )
+
+
+class FakePagedEndpoint:
+    """Serve dated items page by page, filtering on an inclusive date range."""
+
+    def __init__(self, start, days, items_per_day, page_size):
+        self.items = [
+            Mock(id=f"{start + timedelta(days=d)}-{i}", day=start + timedelta(days=d))
+            for d in range(days)
+            for i in range(items_per_day)
+        ]
+        self.page_size = page_size
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, start_date=None, end_date=None, next_token=None, **kwargs):
+        with self.lock:
+            self.calls.append((start_date, end_date, next_token))
+        matching = [item for item in self.items if start_date <= item.day <= end_date]
+        offset = int(next_token or 0)
+        page = matching[offset:offset + self.page_size]
+        more = offset + self.page_size < len(matching)
+        return MockResponse(data=page, next_token=str(offset + self.page_size) if more else None)
+
+
+class TestShardedStreaming(unittest.TestCase):
+    """Test parallel date-range sharding."""
+
+    def test_split_date_range(self):
+        """Test that shards are inclusive, contiguous and non-overlapping."""
+        shards = split_date_range("2024-01-01", date(2024, 1, 5), 2)
+
+        self.assertEqual(shards, [
+            (date(2024, 1, 1), date(2024, 1, 2)),
+            (date(2024, 1, 3), date(2024, 1, 4)),
+            (date(2024, 1, 5), date(2024, 1, 5)),
+        ])
+        with self.assertRaises(ValueError):
+            split_date_range("2024-01-01", "2024-01-05", 0)
+
+    def test_fixed_shard_size_preserves_order(self):
+        """Test that sharded results match a sequential stream."""
+        endpoint = FakePagedEndpoint(date(2024, 1, 1), days=20, items_per_day=3, page_size=4)
+        expected = [item.id for item in endpoint.items]
+
+        results = list(stream_sharded_data(
+            endpoint, "2024-01-01", "2024-01-20", max_workers=3, shard_days=6
+        ))
+
+        self.assertEqual([item.id for item in results], expected)
+        shard_starts = {call[0] for call in endpoint.calls}
+        self.assertEqual(shard_starts, {
+            date(2024, 1, 1), date(2024, 1, 7), date(2024, 1, 13), date(2024, 1, 19)
+        })
+
+    def test_auto_shard_size_from_page_density(self):
+        """Test that automatic sizing keeps every item exactly once, in order."""
+        endpoint = FakePagedEndpoint(date(2024, 1, 1), days=30, items_per_day=5, page_size=12)
+        expected = [item.id for item in endpoint.items]
+
+        results = list(stream_sharded_data(
+            endpoint, date(2024, 1, 1), date(2024, 1, 30), max_workers=4
+        ))
+
+        self.assertEqual([item.id for item in results], expected)
+        # The probe page covers Jan 1-3, so shards are two days wide from Jan 3
+        self.assertIn((date(2024, 1, 3), date(2024, 1, 4), None), endpoint.calls)
+
+    def test_auto_shard_size_single_page(self):
+        """Test that a range fitting in one page costs a single request."""
+        endpoint = FakePagedEndpoint(date(2024, 1, 1), days=3, items_per_day=2, page_size=10)
+
+        results = list(stream_sharded_data(endpoint, "2024-01-01", "2024-01-03"))
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(len(endpoint.calls), 1)
+
+    def test_shard_errors_propagate(self):
+        """Test that an error in one shard is raised to the consumer."""
+        endpoint = FakePagedEndpoint(date(2024, 1, 1), days=10, items_per_day=1, page_size=5)
+
+        def failing_fetch(start_date=None, end_date=None, next_token=None):
+            if start_date == date(2024, 1, 5):
+                raise OuraAPIError("boom")
+            return endpoint(start_date, end_date, next_token)
+
+        with self.assertRaises(OuraAPIError):
+            list(stream_sharded_data(
+                failing_fetch, "2024-01-01", "2024-01-10", max_workers=2, shard_days=2
+            ))
+
+    def test_router_stream_uses_shards(self):
+        """Test that stream(max_workers=...) shards the requested range."""
+        endpoint = HeartRateEndpoints(Mock())
+        fake = FakePagedEndpoint(date(2024, 1, 1), days=8, items_per_day=2, page_size=3)
+        endpoint.get_heartrate = Mock(side_effect=fake)
+
+        results = list(endpoint.stream(
+            start_date="2024-01-01", end_date="2024-01-08", max_workers=2, shard_days=4
+        ))
+
+        self.assertEqual([item.id for item in results], [item.id for item in fake.items])
+        self.assertEqual({call[0] for call in fake.calls}, {date(2024, 1, 1), date(2024, 1, 5)})
+
+    def test_columnar_shards_need_shard_days(self):
+        """Test that columnar pages are not silently streamed serially."""
+        endpoint = HeartRateEndpoints(Mock())
+        endpoint.get_heartrate = Mock()
+
+        with self.assertRaisesRegex(ValueError, "shard_days"):
+            endpoint.stream(start_date="2024-01-01", end_date="2024-01-08", max_workers=8, columnar=True)
+        endpoint.get_heartrate.assert_not_called()
+
+    def test_auto_shard_size_with_raw_dicts(self):
+        """Test that automatic sizing reads the day of raw dict items."""
+        endpoint = FakePagedEndpoint(date(2024, 1, 1), days=12, items_per_day=2, page_size=5)
+
+        def raw_fetch(start_date=None, end_date=None, next_token=None):
+            page = endpoint(start_date, end_date, next_token)
+            return {
+                "data": [{"id": item.id, "day": item.day.isoformat()} for item in page.data],
+                "next_token": page.next_token,
+            }
+
+        results = list(stream_sharded_data(raw_fetch, "2024-01-01", "2024-01-12", max_workers=3))
+
+        self.assertEqual([item["id"] for item in results], [item.id for item in endpoint.items])
+
+
+class TestResumableStreams(unittest.TestCase):
+    """Test checkpointed streams and resuming them from a cursor."""
+
+    PAGES = {
+        None: MockResponse(data=[1, 2], next_token="t2"),
+        "t2": MockResponse(data=[3, 4, 5], next_token="t3"),
+        "t3": MockResponse(data=[6], next_token=None),
+    }
+
+    def setUp(self):
+        self.calls = []
+        self.failing = set()
+
+    def get_documents(self, start_date=None, end_date=None, next_token=None):
+        self.calls.append(next_token)
+        if next_token in self.failing:
+            raise OuraAPIError("connection dropped")
+        return self.PAGES[next_token]
+
+    def test_checkpoints_after_each_page(self):
+        """Test the cursors passed to the checkpoint callback."""
+        checkpoints = []
+
+        items = list(ResumableStream(self.get_documents, start_date=date(2024, 1, 1), checkpoint=checkpoints.append))
+
+        self.assertEqual(items, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(
+            [(c.next_token, c.page_offset, c.items_yielded, c.completed) for c in checkpoints],
+            [("t2", 0, 2, False), ("t3", 0, 5, False), (None, 0, 6, True)]
+        )
+        self.assertEqual(checkpoints[0].endpoint, "get_documents")
+        self.assertEqual(checkpoints[0].start_date, "2024-01-01")
+
+    def test_resume_after_failure(self):
+        """Test that a resumed stream continues at the last checkpoint, without refetching."""
+        checkpoints = []
+        self.failing.add("t3")
+        stream = ResumableStream(self.get_documents, checkpoint=checkpoints.append)
+
+        with self.assertRaises(OuraAPIError):
+            for _ in stream:
+                pass
+
+        saved = json.loads(json.dumps(checkpoints[-1]._asdict()))
+        self.failing.clear()
+        self.calls.clear()
+        resumed = ResumableStream(self.get_documents, cursor=saved)
+
+        self.assertEqual(list(resumed), [6])
+        self.assertEqual(self.calls, ["t3"])
+        self.assertEqual(resumed.cursor.items_yielded, 6)
+
+    def test_resume_within_a_page(self):
+        """Test resuming from the position after the last item yielded."""
+        stream = ResumableStream(self.get_documents, prefetch=1)
+        consumed = [next(stream) for _ in range(3)]
+        cursor = stream.cursor
+        stream.close()
+
+        self.assertEqual((cursor.next_token, cursor.page_offset, cursor.items_yielded), ("t2", 1, 3))
+        self.assertEqual(consumed + list(ResumableStream(self.get_documents, cursor=cursor)), [1, 2, 3, 4, 5, 6])
+
+    def test_completed_cursor(self):
+        """Test that resuming a finished stream makes no requests."""
+        cursor = StreamCursor("get_documents", items_yielded=6, completed=True)
+
+        self.assertEqual(list(ResumableStream(self.get_documents, cursor=cursor)), [])
+        self.assertEqual(self.calls, [])
+
+    def test_mismatched_cursor(self):
+        """Test that cursors of other endpoints or ranges are rejected."""
+        with self.assertRaises(ValueError):
+            ResumableStream(self.get_documents, cursor=StreamCursor("get_sleep_documents"))
+        with self.assertRaises(ValueError):
+            ResumableStream(
+                self.get_documents, start_date="2024-02-01",
+                cursor=StreamCursor("get_documents", start_date="2024-01-01")
+            )
+
+    def test_router_stream(self):
+        """Test checkpointing and resuming a router's stream()."""
+        router = DailySleep(Mock())
+        router.get_daily_sleep_documents = Mock(
+            side_effect=[MockResponse(["a"], "t2"), MockResponse(["b"], None)],
+            __name__="get_daily_sleep_documents"
+        )
+        checkpoints = []
+
+        stream = router.stream(start_date="2024-01-01", end_date="2024-01-31", checkpoint=checkpoints.append)
+
+        self.assertIsInstance(stream, ResumableStream)
+        self.assertEqual(next(stream), "a")
+        self.assertEqual(stream.cursor.items_yielded, 1)
+
+        router.get_daily_sleep_documents.side_effect = [MockResponse(["a"], "t2"), MockResponse(["b"], None)]
+        stream = router.stream(cursor=stream.cursor)
+        self.assertEqual(list(stream), ["b"])
+        router.get_daily_sleep_documents.assert_called_with(
+            start_date="2024-01-01", end_date="2024-01-31", next_token="t2"
+        )
+        with self.assertRaises(ValueError):
+            router.stream(start_date="2024-01-01", end_date="2024-01-31", max_workers=4, cursor=stream.cursor)
+
+    def test_async_stream(self):
+        """Test the async resumable stream."""
+        async def get_documents(start_date=None, end_date=None, next_token=None):
+            return self.get_documents(start_date, end_date, next_token)
+
+        async def collect():
+            checkpoints = []
+            stream = AsyncResumableStream(get_documents, checkpoint=checkpoints.append)
+            first = [await stream.__anext__() for _ in range(3)]
+            await stream.aclose()
+            rest = [item async for item in AsyncResumableStream(get_documents, cursor=checkpoints[-1])]
+            return first, rest
+
+        first, rest = asyncio.run(collect())
+
+        self.assertEqual(first, [1, 2, 3])
+        self.assertEqual(rest, [3, 4, 5, 6])
+
 
 class TestEndpointStreamMethods(unittest.TestCase):
     """Test the stream methods on endpoint classes."""
@@ -187,6 +515,38 @@ class TestEndpointStreamMethods(unittest.TestCase):
         self.assertEqual(results[0].bpm, 70)
         self.assertEqual(results[1].bpm, 72)
 
+    def test_all_collection_routers_stream(self):
+        """Test that every paginated collection router exposes stream()."""
+        client = OuraClient("test_token")
+        fetchers = {
+            "sleep": "get_sleep_documents",
+            "tag": "get_tag_documents",
+            "workout": "get_workout_documents",
+            "enhanced_tag": "get_enhanced_tag_documents",
+            "daily_spo2": "get_daily_spo2_documents",
+            "sleep_time": "get_sleep_time_documents",
+            "rest_mode_period": "get_rest_mode_period_documents",
+            "ring_configuration": "get_ring_configuration_documents",
+            "daily_stress": "get_daily_stress_documents",
+            "daily_resilience": "get_daily_resilience_documents",
+            "daily_cardiovascular_age": "get_daily_cardiovascular_age_documents",
+            "vo2_max": "get_vo2_max_documents",
+        }
+
+        for name, fetcher in fetchers.items():
+            with self.subTest(router=name):
+                router = getattr(client, name)
+                page1 = MockResponse(data=["a"], next_token="token2")
+                page2 = MockResponse(data=["b"], next_token=None)
+                setattr(router, fetcher, Mock(side_effect=[page1, page2]))
+
+                results = list(router.stream(start_date="2024-01-01"))
+
+                self.assertEqual(results, ["a", "b"])
+                getattr(router, fetcher).assert_called_with(
+                    start_date="2024-01-01", end_date=None, next_token="token2"
+                )
+
     def test_session_stream(self):
         """Test Session stream method."""
         endpoint = Session(self.mock_client)
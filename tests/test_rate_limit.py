@@ -0,0 +1,165 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import bisect
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+from oura_api_client.api.client import OuraClient
+from oura_api_client.utils import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the token bucket rate limiter."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_default_budget(self):
+        """Test that the default budget matches Oura's documented limit."""
+        limiter = RateLimiter()
+
+        self.assertEqual(limiter.max_requests, 5000)
+        self.assertEqual(limiter.period, 300.0)
+        self.assertEqual(limiter.burst, 100)
+
+    def test_no_window_exceeds_budget(self):
+        """Test that a caller sending as fast as allowed never exceeds max_requests per period."""
+        for burst in (None, 5000):
+            with self.subTest(burst=burst):
+                clock = FakeClock()
+                limiter = RateLimiter(max_requests=5000, period=300.0, burst=burst, clock=clock)
+                sent = []
+                while clock.now < 900.0:
+                    clock.now += limiter.reserve()
+                    sent.append(clock.now)
+
+                busiest = max(
+                    index - bisect.bisect_left(sent, sent[index] - 300.0 + 1e-9) + 1
+                    for index in range(len(sent))
+                )
+                self.assertLessEqual(busiest, 5000)
+                self.assertGreaterEqual(len(sent), 3 * 5000)
+
+    def test_burst_then_paced(self):
+        """Test that requests beyond the burst wait for the refill rate."""
+        limiter = RateLimiter(max_requests=10, period=10.0, burst=3, clock=self.clock)
+
+        self.assertEqual([limiter.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+        self.assertAlmostEqual(limiter.reserve(), 2.0)
+
+        self.clock.now = 2.0
+        self.assertAlmostEqual(limiter.available, 0.0)
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+
+    def test_refill_is_capped_at_burst(self):
+        """Test that an idle limiter does not accumulate more than the burst."""
+        limiter = RateLimiter(max_requests=10, period=10.0, burst=2, clock=self.clock)
+        limiter.reserve()
+        self.clock.now = 1000.0
+
+        self.assertEqual(limiter.available, 2.0)
+
+    def test_disabled(self):
+        """Test that a disabled limiter never delays requests."""
+        limiter = RateLimiter(max_requests=1, period=60.0, enabled=False, clock=self.clock)
+
+        self.assertEqual([limiter.reserve() for _ in range(5)], [0.0] * 5)
+
+    def test_invalid_budget(self):
+        """Test that non-positive budgets are rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(max_requests=0)
+
+    def test_thread_safe_reservations(self):
+        """Test that concurrent reservations each get a distinct slot."""
+        limiter = RateLimiter(max_requests=100, period=100.0, burst=1, clock=self.clock)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                delay = limiter.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(round(delay) for delay in delays), list(range(400)))
+
+    @patch("time.sleep")
+    def test_acquire_sleeps_for_delay(self, mock_sleep):
+        """Test that acquire blocks for the reserved delay."""
+        limiter = RateLimiter(max_requests=2, period=1.0, burst=1, clock=self.clock)
+
+        self.assertEqual(limiter.acquire(), 0.0)
+        self.assertAlmostEqual(limiter.acquire(), 0.5)
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.5)
+
+    def test_async_acquire_does_not_block(self):
+        """Test that async_acquire waits with asyncio.sleep."""
+        limiter = RateLimiter(max_requests=2, period=1.0, burst=1, clock=self.clock)
+
+        async def run():
+            with patch("asyncio.sleep") as mock_sleep:
+                mock_sleep.return_value = None
+                await limiter.async_acquire()
+                await limiter.async_acquire()
+                return mock_sleep
+
+        mock_sleep = asyncio.run(run())
+        mock_sleep.assert_called_once()
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    """Test that client requests pass through the rate limiter."""
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_every_request_is_paced(self, mock_get, mock_sleep):
+        """Test that router calls take tokens from the client's limiter."""
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"data": [], "next_token": None}
+        mock_get.return_value = mock_response
+        clock = FakeClock()
+        client = OuraClient(
+            "test_token",
+            rate_limiter=RateLimiter(max_requests=2, period=4.0, burst=2, clock=clock)
+        )
+
+        client.daily_sleep.get_daily_sleep_documents()
+        client.heartrate.get_heartrate()
+        mock_sleep.assert_not_called()
+
+        client.tag.get_tag_documents()
+        mock_sleep.assert_called_once_with(4.0)
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_default_limiter(self):
+        """Test that clients are rate limited by default and can share a limiter."""
+        shared = RateLimiter()
+
+        self.assertIsInstance(OuraClient("test_token").rate_limiter, RateLimiter)
+        self.assertIs(OuraClient("a", rate_limiter=shared).rate_limiter, shared)
+
+
+if __name__ == "__main__":
+    unittest.main()
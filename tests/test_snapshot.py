@@ -0,0 +1,106 @@
+"""Tests for the concurrent snapshot of all collections."""
+
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.exceptions import OuraAPIError
+from oura_api_client.models.daily_sleep import DailySleepModel
+from oura_api_client.snapshot import SNAPSHOT_COLLECTIONS, Snapshot, take_snapshot
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+
+BASE_URL = "https://api.ouraring.com/v2/usercollection"
+PARAMS = {"start_date": "2024-03-01", "end_date": "2024-03-07"}
+NIGHT = {"id": "n1", "contributors": {}, "day": "2024-03-01", "timestamp": "2024-03-01T00:00:00+00:00"}
+
+
+def add_collections(transport, failing=(), params=PARAMS):
+    """Register an empty page for every collection, and one daily_sleep document."""
+    for collection in SNAPSHOT_COLLECTIONS:
+        if collection in failing:
+            continue
+        path = "vO2_max" if collection == "vo2_max" else collection
+        data = [NIGHT] if collection == "daily_sleep" else []
+        transport.add("GET", f"{BASE_URL}/{path}", params=params, json_body={"data": data, "next_token": None})
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test OuraClient.snapshot()."""
+
+    def test_every_collection(self):
+        """Test that every collection is fetched once and bundled by name."""
+        transport = ReplayTransport()
+        add_collections(transport)
+        client = OuraClient("test_token", transport=transport)
+
+        snap = client.snapshot("2024-03-01", "2024-03-07")
+
+        self.assertIsInstance(snap, Snapshot)
+        self.assertEqual(len(transport.calls), len(SNAPSHOT_COLLECTIONS))
+        self.assertEqual(snap.daily_sleep, [DailySleepModel(**NIGHT)])
+        self.assertEqual(snap.heartrate, [])
+        self.assertEqual(set(snap.timings), set(SNAPSHOT_COLLECTIONS))
+        self.assertTrue(all(seconds >= 0 for seconds in snap.timings.values()))
+        self.assertTrue(snap.ok)
+
+    def test_errors_do_not_abort_the_snapshot(self):
+        """Test that a failing collection is reported and the others are kept."""
+        transport = ReplayTransport()
+        add_collections(transport, failing=("workout",))
+        client = OuraClient("test_token", transport=transport)
+
+        snap = client.snapshot("2024-03-01", "2024-03-07", return_model=False)
+
+        self.assertEqual(list(snap.errors), ["workout"])
+        self.assertIsInstance(snap.errors["workout"], OuraAPIError)
+        self.assertEqual(snap.workout, [])
+        self.assertIn("workout", snap.timings)
+        self.assertEqual(snap.daily_sleep, [NIGHT])
+
+    def test_subset_of_collections(self):
+        """Test fetching only some collections and rejecting unknown ones."""
+        transport = ReplayTransport()
+        add_collections(transport, params=None)
+        client = OuraClient("test_token", transport=transport)
+
+        snap = client.snapshot(collections=["daily_sleep", "tag"])
+
+        self.assertEqual(set(snap.timings), {"daily_sleep", "tag"})
+        self.assertEqual(len(transport.calls), 2)
+        with self.assertRaises(ValueError):
+            client.snapshot(collections=["ring_configuration"])
+
+    def test_collections_are_fetched_concurrently(self):
+        """Test that the snapshot takes about as long as one collection."""
+        def slow_stream(**kwargs):
+            time.sleep(0.05)
+            return iter([kwargs["start_date"]])
+
+        router = SimpleNamespace(stream=slow_stream)
+        client = SimpleNamespace(**{collection: router for collection in SNAPSHOT_COLLECTIONS})
+
+        started = time.perf_counter()
+        snap = take_snapshot(client, "2024-03-01", "2024-03-07")
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(snap.sleep_time, ["2024-03-01"])
+        self.assertLess(elapsed, 0.05 * len(SNAPSHOT_COLLECTIONS) / 2)
+
+    def test_async_client(self):
+        """Test snapshot() on the async client."""
+        transport = AsyncReplayTransport()
+        add_collections(transport, failing=("heartrate",))
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        snap = asyncio.run(client.snapshot("2024-03-01", "2024-03-07"))
+
+        self.assertEqual(snap.daily_sleep, [DailySleepModel(**NIGHT)])
+        self.assertEqual(list(snap.errors), ["heartrate"])
+        self.assertEqual(len(snap.timings), len(SNAPSHOT_COLLECTIONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+"""Tests for the memory-mapped heart rate store."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+from oura_api_client import store as store_module
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models.heartrate import HeartRateColumns, HeartRateSample
+from oura_api_client.store import HeartRateStore, rollup_mean_std
+from oura_api_client.transports import ReplayTransport
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+HEARTRATE_URL = "https://api.ouraring.com/v2/usercollection/heartrate"
+SAMPLES = [
+    {"timestamp": "2024-03-01T22:00:00+00:00", "bpm": 60, "source": "awake"},
+    {"timestamp": "2024-03-01T23:55:00+00:00", "bpm": 52, "source": "sleep"},
+    {"timestamp": "2024-03-02T00:05:00+00:00", "bpm": 50, "source": "sleep"},
+    {"timestamp": "2024-03-02T08:00:00+00:00", "bpm": 75, "source": "awake"},
+    {"timestamp": "2024-03-03T12:00:00+00:00", "bpm": 130, "source": "workout"},
+]
+
+
+def at(day, hour, minute=0):
+    return datetime(2024, 3, day, hour, minute, tzinfo=timezone.utc)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestHeartRateStore(unittest.TestCase):
+    """Test appending to and querying the store."""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.store = HeartRateStore(self.path)
+        self.addCleanup(self.store.close)
+
+    def test_range_queries(self):
+        """Test half-open range queries across day partitions."""
+        self.assertEqual(self.store.append(HeartRateColumns.from_dict({"data": SAMPLES})), 5)
+
+        columns = self.store.read("2024-03-01T23:00:00Z", at(3, 12))
+
+        self.assertEqual(list(columns.bpm), [52, 50, 75])
+        self.assertEqual(columns.source_names(), ["sleep", "sleep", "awake"])
+        self.assertEqual(len(self.store.read(date(2024, 3, 3))), 1)
+        self.assertEqual(len(self.store.read()), 5)
+        self.assertEqual(len(self.store.read(at(4, 0))), 0)
+        self.assertEqual(self.store.days(), [date(2024, 3, 1), date(2024, 3, 2), date(2024, 3, 3)])
+        self.assertEqual(
+            sorted(os.listdir(self.path)),
+            ["2024-03-01.hr", "2024-03-02.hr", "2024-03-03.hr",
+             "day.rollup", "hour.rollup", "minute.rollup", "sources.txt"]
+        )
+
+    def test_views_are_backed_by_the_mapped_files(self):
+        """Test that single-day queries return views of the memory map."""
+        self.store.extend(HeartRateSample(**sample) for sample in SAMPLES)
+
+        view, = self.store.views(at(2, 0), at(2, 12))
+        columns = self.store.read(at(2, 0), at(2, 12))
+
+        self.assertIsInstance(view.base, np.memmap)
+        self.assertTrue(np.shares_memory(columns.bpm, view))
+        self.assertEqual(view["timestamp"].tolist(), [int(at(2, 0, 5).timestamp()), int(at(2, 8).timestamp())])
+        self.assertEqual(os.path.getsize(os.path.join(self.path, "2024-03-02.hr")), 2 * 11)
+
+    def test_overlapping_appends_are_skipped(self):
+        """Test that re-syncing a range does not duplicate samples."""
+        self.store.extend(SAMPLES[:3])
+
+        written = self.store.extend([HeartRateColumns.from_dict({"data": SAMPLES})])
+
+        self.assertEqual(written, 2)
+        self.assertEqual(len(self.store), 5)
+
+    def test_late_samples_are_merged(self):
+        """Test that samples older than the newest stored one for their day are kept."""
+        self.store.append({"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 70, "source": "awake"})
+
+        written = self.store.extend([
+            {"timestamp": f"2024-03-01T{hour}:00:00+00:00", "bpm": bpm, "source": "awake"}
+            for hour, bpm in (("08", 61), ("09", 62), ("10", 70), ("11", 64))
+        ])
+
+        self.assertEqual(written, 3)
+        columns = HeartRateStore(self.path).read()
+        self.assertEqual(list(columns.bpm), [61, 62, 70, 64])
+        self.assertEqual(os.path.getsize(os.path.join(self.path, "2024-03-01.hr")), 4 * 11)
+
+    def test_sources_sharing_a_timestamp(self):
+        """Test that samples are identified by timestamp and source."""
+        self.store.append({"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 95, "source": "workout"})
+
+        written = self.store.append(HeartRateColumns.from_dict({"data": [
+            {"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 70, "source": "awake"},
+            {"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 95, "source": "workout"},
+        ]}))
+
+        self.assertEqual(written, 1)
+        self.assertEqual(sorted(self.store.read().source_names()), ["awake", "workout"])
+
+    def test_reopen_with_new_sources(self):
+        """Test that unknown sources are registered and persisted."""
+        self.store.append({"timestamp": "2024-03-05T10:00:00+00:00", "bpm": 90, "source": "meditation"})
+        self.store.append({"timestamp": "2024-03-05T10:05:00+00:00", "bpm": 80, "source": "rest"})
+
+        reopened = HeartRateStore(self.path)
+
+        self.assertEqual(reopened.read().source_names(), ["meditation", "rest"])
+        self.assertEqual(reopened.append(SAMPLES[0]), 1)
+
+    def test_torn_records_are_ignored(self):
+        """Test recovering from a partially written record."""
+        self.store.append(SAMPLES[0])
+        with open(os.path.join(self.path, "2024-03-01.hr"), "ab") as partition:
+            partition.write(b"\x01\x02\x03")
+
+        self.assertEqual(len(HeartRateStore(self.path).read()), 1)
+        self.store.append(SAMPLES[1])
+        self.assertEqual(list(HeartRateStore(self.path).read().bpm), [60, 52])
+
+    def test_fed_from_stream(self):
+        """Test filling the store from a columnar heart rate stream."""
+        transport = ReplayTransport()
+        transport.add("GET", HEARTRATE_URL, json_body={"data": SAMPLES[:2], "next_token": "t2"})
+        transport.add("GET", HEARTRATE_URL, params={"next_token": "t2"}, json_body={"data": SAMPLES[2:]})
+        client = OuraClient("test_token", transport=transport)
+
+        self.store.extend(client.heartrate.stream(columnar=True))
+
+        self.assertEqual(list(self.store.read().bpm), [60, 52, 50, 75, 130])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestRollups(unittest.TestCase):
+    """Test the incrementally maintained rollup pyramid."""
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.store = HeartRateStore(self.path)
+
+    def assertRollupsMatchRawSamples(self, store):
+        for level, width in (("minute", 60), ("hour", 3600), ("day", 86400)):
+            records = np.concatenate(list(store.views()))
+            starts = records["timestamp"] // width * width
+            rows = store.rollup(level)
+            self.assertEqual(rows["start"].tolist(), sorted(set(starts.tolist())))
+            for row in rows:
+                bpm = records["bpm"][starts == row["start"]].astype("int64")
+                self.assertEqual(
+                    (row["count"], row["sum"], row["min"], row["max"], row["sumsq"]),
+                    (len(bpm), bpm.sum(), bpm.min(), bpm.max(), (bpm * bpm).sum())
+                )
+
+    def test_rollups_follow_appends(self):
+        """Test that rollups stay exact as pages arrive, in and out of order."""
+        self.store.append(HeartRateColumns.from_dict({"data": SAMPLES[2:4]}))
+        self.store.append({"timestamp": "2024-03-02T08:00:30+00:00", "bpm": 81, "source": "awake"})
+        self.store.append(HeartRateColumns.from_dict({"data": SAMPLES}))
+
+        hours = self.store.rollup("hour", at(2, 0), at(3, 0))
+
+        self.assertEqual(hours["count"].tolist(), [1, 2])
+        self.assertEqual((hours["min"][1], hours["max"][1], hours["sum"][1]), (75, 81, 156))
+        self.assertEqual(len(self.store.rollup("day")), 3)
+        self.assertRollupsMatchRawSamples(self.store)
+
+    def test_rollups_include_late_samples(self):
+        """Test that merging late samples updates the buckets they fall in."""
+        self.store.append(HeartRateColumns.from_dict({"data": SAMPLES[3:]}))
+        self.store.append(HeartRateColumns.from_dict({"data": SAMPLES}))
+        self.store.append({"timestamp": "2024-03-02T08:00:00+00:00", "bpm": 99, "source": "workout"})
+
+        self.assertEqual(self.store.rollup("hour", at(2, 8), at(2, 9))["count"].tolist(), [2])
+        self.assertRollupsMatchRawSamples(self.store)
+        self.assertRollupsMatchRawSamples(HeartRateStore(self.path))
+
+    def test_mean_and_deviation(self):
+        """Test per-bucket statistics from the rollup sums."""
+        self.store.extend([
+            {"timestamp": "2024-03-01T10:00:00+00:00", "bpm": 60, "source": "awake"},
+            {"timestamp": "2024-03-01T10:30:00+00:00", "bpm": 80, "source": "awake"},
+        ])
+
+        mean, std = rollup_mean_std(self.store.rollup("hour"))
+
+        self.assertEqual(mean.tolist(), [70.0])
+        self.assertEqual(std.tolist(), [10.0])
+
+    def test_missing_levels_are_rebuilt(self):
+        """Test that opening a store builds rollups from the stored samples."""
+        self.store.append(HeartRateColumns.from_dict({"data": SAMPLES}))
+        os.remove(os.path.join(self.path, "hour.rollup"))
+
+        reopened = HeartRateStore(self.path)
+
+        self.assertRollupsMatchRawSamples(reopened)
+        self.assertEqual(len(HeartRateStore(self.path, rollups=["day"]).rollup("day")), 3)
+
+    def test_unknown_levels(self):
+        """Test that unknown or unmaintained levels are rejected."""
+        with self.assertRaises(ValueError):
+            HeartRateStore(self.path, rollups=["week"])
+        with self.assertRaises(ValueError):
+            HeartRateStore(self.path, rollups=["day"]).rollup("hour")
+
+
+class TestHeartRateStoreWithoutNumpy(unittest.TestCase):
+    """Test the NumPy requirement."""
+
+    def test_requires_numpy(self):
+        """Test the error raised when NumPy is not installed."""
+        with patch.object(store_module, "np", None):
+            with self.assertRaisesRegex(ImportError, r"oura-api-client\[numpy\]"):
+                HeartRateStore(tempfile.gettempdir())
+
+
+if __name__ == "__main__":
+    unittest.main()
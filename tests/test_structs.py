@@ -0,0 +1,124 @@
+"""Tests for the msgspec Struct model backend."""
+
+import asyncio
+import json
+import os
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models import adapters
+from oura_api_client.models.daily_activity import DailyActivityResponse
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE_URL = "https://api.ouraring.com/v2/usercollection"
+ACTIVITY_PAGE = {
+    "data": [{
+        "id": "activity-1",
+        "day": "2024-03-01",
+        "score": 82,
+        "class_5_min": "0011",
+        "contributors": {"stay_active": 90},
+        "met": {"interval": 60.0, "items": [1.2, 1.4], "timestamp": "2024-03-01T04:00:00+00:00"},
+        "timestamp": "2024-03-01T04:00:00+00:00",
+    }],
+    "next_token": None,
+}
+
+
+@unittest.skipIf(msgspec is None, "msgspec is not installed")
+class TestStructBackend(unittest.TestCase):
+    """Test routers returning msgspec Structs."""
+
+    def setUp(self):
+        from oura_api_client.models import structs
+
+        self.structs = structs
+        self.transport = ReplayTransport()
+        self.transport.add("GET", f"{BASE_URL}/daily_activity", json_body=ACTIVITY_PAGE)
+        self.client = OuraClient("test_token", transport=self.transport, model_backend="struct")
+
+    def test_documents_decode_to_structs(self):
+        """Test that list endpoints return the generated Structs."""
+        response = self.client.daily_activity.get_daily_activity_documents()
+
+        self.assertIsInstance(response, self.structs.DailyActivityResponse)
+        activity = response.data[0]
+        self.assertIsInstance(activity, self.structs.DailyActivityModel)
+        self.assertEqual(activity.day, date(2024, 3, 1))
+        self.assertEqual(activity.contributors.stay_active, 90)
+        self.assertIsNone(activity.contributors.recovery_time)
+        self.assertEqual(activity.met.items, [1.2, 1.4])
+
+    def test_stream_yields_structs(self):
+        """Test that stream() walks Struct pages."""
+        documents = list(self.client.daily_activity.stream())
+
+        self.assertEqual([document.id for document in documents], ["activity-1"])
+        self.assertIsInstance(documents[0], self.structs.DailyActivityModel)
+
+    def test_raw_responses_are_unaffected(self):
+        """Test that return_model=False still returns the decoded dict."""
+        self.assertEqual(
+            self.client.daily_activity.get_daily_activity_documents(return_model=False),
+            ACTIVITY_PAGE
+        )
+
+    def test_structs_match_pydantic_models(self):
+        """Test that both backends read the same values from a page."""
+        struct_page = adapters.parse_struct(DailyActivityResponse, json.dumps(ACTIVITY_PAGE).encode())
+        model_page = adapters.parse_model(DailyActivityResponse, ACTIVITY_PAGE)
+
+        self.assertEqual(adapters.parse_struct(DailyActivityResponse, ACTIVITY_PAGE), struct_page)
+        self.assertEqual(struct_page.data[0].score, model_page.data[0].score)
+        self.assertEqual(struct_page.data[0].day, model_page.data[0].day)
+
+    def test_async_client(self):
+        """Test the struct backend on the async client."""
+        transport = AsyncReplayTransport()
+        transport.add("GET", f"{BASE_URL}/daily_activity", json_body=ACTIVITY_PAGE)
+        client = AsyncOuraClient("test_token", transport=transport, model_backend="struct")
+
+        response = asyncio.run(client.daily_activity.get_daily_activity_documents())
+
+        self.assertIsInstance(response, self.structs.DailyActivityResponse)
+
+    def test_generated_module_is_current(self):
+        """Test that models/structs.py matches the generator output for the spec."""
+        import parse_openapi
+
+        with open(os.path.join(ROOT, "openapi_spec.json")) as spec_file:
+            schemas = json.load(spec_file)["components"]["schemas"]
+        with open(os.path.join(ROOT, parse_openapi.STRUCTS_PATH)) as structs_file:
+            self.assertEqual(parse_openapi.generate_struct_models(schemas), structs_file.read())
+
+
+class TestModelBackendOption(unittest.TestCase):
+    """Test choosing the model backend."""
+
+    def test_pydantic_is_default(self):
+        """Test that clients return pydantic models by default."""
+        self.assertEqual(OuraClient("test_token").model_backend, "pydantic")
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with self.assertRaises(ValueError):
+            OuraClient("test_token", model_backend="attrs")
+
+    def test_struct_backend_requires_msgspec(self):
+        """Test the error raised when msgspec is not installed."""
+        with patch.object(adapters, "msgspec", None):
+            with self.assertRaisesRegex(ImportError, r"oura-api-client\[msgspec\]"):
+                OuraClient("test_token", model_backend="struct")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Tests for the day-aligned join of the daily collections."""
+
+import asyncio
+import threading
+import time
+import unittest
+from datetime import date
+
+from oura_api_client.aio.client import AsyncOuraClient
+from oura_api_client.api.client import OuraClient
+from oura_api_client.models.daily_sleep import DailySleepModel
+from oura_api_client.summary import (
+    DAILY_SUMMARY_COLLECTIONS,
+    DailySummary,
+    async_merge_daily_documents,
+    merge_daily_documents
+)
+from oura_api_client.transports import AsyncReplayTransport, ReplayTransport
+
+BASE_URL = "https://api.ouraring.com/v2/usercollection"
+PARAMS = {"start_date": "2024-03-01", "end_date": "2024-03-03"}
+
+
+def doc(day, **fields):
+    return dict({"id": f"{day}-{len(fields)}", "day": day}, **fields)
+
+
+class TestMergeDailyDocuments(unittest.TestCase):
+    """Test merge-joining sorted document streams."""
+
+    def test_rows_align_on_day_with_gaps(self):
+        """Test that each day gets one row and missing documents are None."""
+        rows = list(merge_daily_documents({
+            "sleep": iter([doc("2024-03-01"), doc("2024-03-03")]),
+            "readiness": iter([doc("2024-03-02")]),
+            "stress": iter([]),
+        }))
+
+        self.assertEqual([row.day for row in rows], [date(2024, 3, 1), date(2024, 3, 2), date(2024, 3, 3)])
+        self.assertEqual(rows[0].sleep["day"], "2024-03-01")
+        self.assertIsNone(rows[0].readiness)
+        self.assertEqual(rows[1].readiness["day"], "2024-03-02")
+        self.assertIsNone(rows[1].sleep)
+        self.assertTrue(all(row.stress is None for row in rows))
+
+    def test_models_and_duplicate_days(self):
+        """Test model documents and keeping the last document of a repeated day."""
+        first = DailySleepModel(id="a", contributors={}, day="2024-03-01", timestamp="2024-03-01T00:00:00Z")
+        rescored = DailySleepModel(id="b", contributors={}, day="2024-03-01", timestamp="2024-03-01T00:00:00Z")
+
+        rows = list(merge_daily_documents({"sleep": iter([first, rescored])}))
+
+        self.assertEqual(rows, [DailySummary(date(2024, 3, 1), sleep=rescored)])
+
+    def test_streams_are_started_concurrently(self):
+        """Test that the first documents of all streams are fetched in parallel."""
+        started = []
+
+        def slow_stream(day):
+            started.append(threading.current_thread().name)
+            time.sleep(0.2)
+            yield doc(day)
+
+        begin = time.monotonic()
+        rows = list(merge_daily_documents({
+            field: slow_stream("2024-03-01") for field in DAILY_SUMMARY_COLLECTIONS.values()
+        }))
+
+        self.assertLess(time.monotonic() - begin, 0.2 * len(DAILY_SUMMARY_COLLECTIONS) / 2)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(len(started), 7)
+        self.assertIsNotNone(rows[0].cardiovascular_age)
+
+    def test_stream_errors_propagate(self):
+        """Test that a failing collection stops the join with its error."""
+        def failing():
+            yield doc("2024-03-01")
+            raise RuntimeError("boom")
+
+        rows = merge_daily_documents({"sleep": failing(), "activity": iter([doc("2024-03-02")])})
+
+        with self.assertRaises(RuntimeError):
+            list(rows)
+
+    def test_async_merge(self):
+        """Test the async merge-join."""
+        async def stream(*days):
+            for day in days:
+                yield doc(day)
+
+        async def collect():
+            streams = {"sleep": stream("2024-03-01", "2024-03-02"), "spo2": stream("2024-03-02")}
+            return [row async for row in async_merge_daily_documents(streams)]
+
+        rows = asyncio.run(collect())
+
+        self.assertEqual([(row.day.day, row.sleep is not None, row.spo2 is not None) for row in rows],
+                         [(1, True, False), (2, True, True)])
+
+
+class TestClientDailySummary(unittest.TestCase):
+    """Test client.daily_summary() against every daily collection."""
+
+    def add_collections(self, transport):
+        for collection in DAILY_SUMMARY_COLLECTIONS:
+            transport.add("GET", f"{BASE_URL}/{collection}", params=PARAMS, json_body={
+                "data": [doc("2024-03-01", score=70), doc("2024-03-03", score=90)] if collection != "daily_spo2" else [],
+                "next_token": None,
+            })
+
+    def test_daily_summary(self):
+        """Test joining raw documents of the seven collections."""
+        transport = ReplayTransport()
+        self.add_collections(transport)
+        client = OuraClient("test_token", transport=transport)
+
+        rows = list(client.daily_summary("2024-03-01", "2024-03-03", return_model=False))
+
+        self.assertEqual([row.day for row in rows], [date(2024, 3, 1), date(2024, 3, 3)])
+        self.assertEqual(rows[1].readiness["score"], 90)
+        self.assertIsNone(rows[0].spo2)
+        self.assertEqual(len(transport.calls), 7)
+
+    def test_async_daily_summary(self):
+        """Test the async client's daily_summary()."""
+        transport = AsyncReplayTransport()
+        self.add_collections(transport)
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        async def collect():
+            return [row async for row in client.daily_summary("2024-03-01", "2024-03-03", return_model=False)]
+
+        rows = asyncio.run(collect())
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0].activity["score"], 70)
+
+
+if __name__ == "__main__":
+    unittest.main()
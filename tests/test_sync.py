@@ -0,0 +1,193 @@
+"""Tests for the incremental sync engine."""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+from oura_api_client.models.daily_sleep import DailySleepModel, SleepContributors
+from oura_api_client.models.heartrate import HeartRateSample
+from oura_api_client.models.ring_configuration import RingConfigurationModel
+from oura_api_client.sync import OuraSync
+
+TODAY = date(2024, 6, 15)
+
+
+def daily_sleep(day, score=80):
+    return DailySleepModel(
+        id=f"sleep-{day}",
+        contributors=SleepContributors(),
+        day=date.fromisoformat(day),
+        score=score,
+        timestamp=f"{day}T00:00:00+00:00"
+    )
+
+
+class TestOuraSync(unittest.TestCase):
+    """Test incremental synchronization into SQLite."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.daily_sleep.stream.return_value = [
+            daily_sleep("2024-06-10"), daily_sleep("2024-06-11")
+        ]
+        self.sync = OuraSync(
+            self.client,
+            collections=["daily_sleep"],
+            history_start="2024-06-01",
+            recheck_days=2,
+            today=lambda: TODAY
+        )
+
+    def tearDown(self):
+        self.sync.close()
+
+    def test_first_sync_fetches_full_history(self):
+        """Test that a never-synced collection starts at history_start."""
+        result = self.sync.sync()
+
+        self.assertEqual(result, {"daily_sleep": 2})
+        self.client.daily_sleep.stream.assert_called_once_with(
+            start_date=date(2024, 6, 1), end_date=TODAY, max_workers=1, return_model=False
+        )
+        self.assertEqual(self.sync.high_water_mark("daily_sleep"), TODAY)
+
+    def test_incremental_sync_uses_recheck_window(self):
+        """Test that later syncs fetch only recent days plus the re-check window."""
+        self.sync.sync()
+        self.sync._today = lambda: date(2024, 6, 20)
+
+        self.sync.sync()
+
+        self.client.daily_sleep.stream.assert_called_with(
+            start_date=date(2024, 6, 13), end_date=date(2024, 6, 20), max_workers=1,
+            return_model=False
+        )
+        self.assertEqual(self.sync.high_water_mark("daily_sleep"), date(2024, 6, 20))
+
+    def test_rescored_documents_are_replaced(self):
+        """Test that re-fetched documents replace their previous version."""
+        self.sync.sync()
+        self.client.daily_sleep.stream.return_value = [daily_sleep("2024-06-11", score=91)]
+
+        self.sync.sync()
+
+        documents = self.sync.documents("daily_sleep")
+        self.assertEqual(len(documents), 2)
+        self.assertEqual(documents[1]["score"], 91)
+        self.assertEqual(DailySleepModel(**documents[1]).day, date(2024, 6, 11))
+
+    def test_documents_removed_upstream_are_dropped(self):
+        """Test that documents deleted or re-created under a new ID in the window disappear."""
+        self.client.daily_sleep.stream.return_value = [
+            daily_sleep("2024-06-10"), daily_sleep("2024-06-13"), daily_sleep("2024-06-14")
+        ]
+        self.sync.sync()
+        merged = daily_sleep("2024-06-14").model_copy(update={"id": "sleep-merged"})
+        self.client.daily_sleep.stream.return_value = [merged]
+
+        self.sync.sync()
+
+        self.assertEqual(
+            [document["id"] for document in self.sync.documents("daily_sleep")],
+            ["sleep-2024-06-10", "sleep-merged"]
+        )
+
+    def test_documents_date_filter(self):
+        """Test reading a date range back from the store."""
+        self.sync.sync()
+
+        documents = self.sync.documents("daily_sleep", start_date=date(2024, 6, 11))
+
+        self.assertEqual([document["id"] for document in documents], ["sleep-2024-06-11"])
+        self.assertEqual(self.sync.count("daily_sleep"), 2)
+
+    def test_interrupted_sync_keeps_high_water_mark(self):
+        """Test that a failed sync does not advance the high-water mark."""
+        def failing_stream(**kwargs):
+            yield daily_sleep("2024-06-10")
+            raise RuntimeError("connection lost")
+
+        self.client.daily_sleep.stream.side_effect = failing_stream
+
+        with self.assertRaises(RuntimeError):
+            self.sync.sync()
+        self.assertIsNone(self.sync.high_water_mark("daily_sleep"))
+
+    def test_interrupted_resync_keeps_previous_documents(self):
+        """Test that the window's documents are only replaced once the whole window is fetched."""
+        self.sync.sync()
+
+        def failing_stream(**kwargs):
+            raise RuntimeError("connection lost")
+            yield
+
+        self.client.daily_sleep.stream.side_effect = failing_stream
+        self.sync._today = lambda: date(2024, 6, 11)
+
+        with self.assertRaises(RuntimeError):
+            self.sync.sync()
+        self.assertEqual(self.sync.count("daily_sleep"), 2)
+
+    def test_heartrate_and_undated_collections(self):
+        """Test collections keyed by timestamp and collections without dates."""
+        self.client.heartrate.stream.return_value = [
+            HeartRateSample(timestamp=datetime(2024, 6, 14, 12, tzinfo=timezone.utc), bpm=60, source="awake")
+        ]
+        self.client.ring_configuration.stream.return_value = [
+            RingConfigurationModel(id="ring-1", firmware_version="2.0")
+        ]
+
+        result = self.sync.sync(["heartrate", "ring_configuration"])
+
+        self.assertEqual(result, {"heartrate": 1, "ring_configuration": 1})
+        self.client.ring_configuration.stream.assert_called_once_with(return_model=False)
+        self.assertEqual(self.sync.documents("heartrate")[0]["bpm"], 60)
+        self.assertEqual(self.sync.documents("heartrate", start_date="2024-06-14")[0]["source"], "awake")
+
+    def test_heartrate_samples_are_keyed_by_source(self):
+        """Test that samples of different sources sharing a timestamp are both kept."""
+        timestamp = datetime(2024, 6, 14, 12, tzinfo=timezone.utc)
+        self.client.heartrate.stream.return_value = [
+            HeartRateSample(timestamp=timestamp, bpm=60, source="awake"),
+            HeartRateSample(timestamp=timestamp, bpm=95, source="workout"),
+        ]
+
+        self.sync.sync(["heartrate"])
+
+        self.assertEqual(sorted(sample["source"] for sample in self.sync.documents("heartrate")), ["awake", "workout"])
+
+    def test_raw_documents_are_stored_as_returned(self):
+        """Test that raw dicts from the routers are stored without conversion."""
+        raw = {"id": "sleep-2024-06-12", "day": "2024-06-12", "score": 77, "extra_field": 1}
+        self.client.daily_sleep.stream.return_value = [raw]
+
+        self.sync.sync()
+
+        self.assertEqual(self.sync.documents("daily_sleep"), [raw])
+
+    def test_unknown_collection(self):
+        """Test that unknown collections are rejected."""
+        with self.assertRaises(ValueError):
+            OuraSync(self.client, collections=["personal_info"])
+        with self.assertRaises(ValueError):
+            self.sync.sync_collection("personal_info")
+
+    def test_state_persists_in_database_file(self):
+        """Test that documents and high-water marks survive reopening the store."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "oura.sqlite")
+            with OuraSync(self.client, path, collections=["daily_sleep"], today=lambda: TODAY) as sync:
+                sync.sync()
+
+            with OuraSync(self.client, path, collections=["daily_sleep"], today=lambda: TODAY) as sync:
+                self.assertEqual(sync.count("daily_sleep"), 2)
+                self.assertEqual(sync.high_water_mark("daily_sleep"), TODAY)
+                sync.reset()
+                self.assertEqual(sync.count("daily_sleep"), 0)
+                self.assertIsNone(sync.high_water_mark("daily_sleep"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,254 @@
+"""Tests for the compact time series decoded from sleep and session documents."""
+
+import json
+import math
+from datetime import datetime, timezone
+import unittest
+from array import array
+from unittest.mock import patch
+
+from oura_api_client.models.daily_activity import DailyActivityModel
+from oura_api_client.models.session import SessionModel
+from oura_api_client.models.sleep import SleepModel
+from oura_api_client.models.time_series import CategorySeries, SampleSeries, TimeSeriesData
+from oura_api_client.utils.arrays import digit_codes
+
+START = 1709326800  # 2024-03-01T21:00:00Z
+HEART_RATE = {"interval": 300.0, "items": [None, 52, 50.5], "timestamp": "2024-03-01T23:00:00.000+02:00"}
+
+
+def sleep_document(**fields):
+    document = {
+        "id": "sleep-1",
+        "day": "2024-03-02",
+        "contributors": {},
+        "bedtime_start": "2024-03-01T23:00:00+02:00",
+        "heart_rate": HEART_RATE,
+        "hrv": None,
+        "movement_30_sec": "1123",
+        "sleep_phase_5_min": "4221",
+    }
+    document.update(fields)
+    return document
+
+
+class TestSleepSeries(unittest.TestCase):
+    """Test decoding the sleep time series."""
+
+    def test_fields_stay_raw_until_decoded(self):
+        """Test that validation keeps the raw values and round-trips them."""
+        sleep = SleepModel(**sleep_document())
+
+        self.assertEqual(sleep.heart_rate, HEART_RATE)
+        self.assertEqual(sleep.model_dump()["heart_rate"], HEART_RATE)
+        self.assertEqual(sleep, SleepModel(**sleep_document()))
+
+    def test_heart_rate_series(self):
+        """Test decoding samples into a float64 array with NaN for missing values."""
+        series = SleepModel(**sleep_document()).heart_rate_series()
+
+        self.assertEqual(len(series), 3)
+        self.assertTrue(math.isnan(series.items[0]))
+        self.assertEqual(list(series.items[1:]), [52.0, 50.5])
+        self.assertEqual(series.items.dtype.name, "float64")
+        self.assertEqual(list(series.timestamps()), [START, START + 300, START + 600])
+
+    def test_json_string_samples(self):
+        """Test that samples given as a JSON string decode like objects."""
+        sleep = SleepModel(**sleep_document(hrv=json.dumps(HEART_RATE)))
+
+        self.assertEqual(sleep.hrv_series().timestamp, START)
+        self.assertEqual(list(sleep.hrv_series().items[1:]), [52.0, 50.5])
+
+    def test_category_series(self):
+        """Test decoding the digit strings into uint8 codes from bedtime_start."""
+        sleep = SleepModel(**sleep_document())
+
+        phases = sleep.sleep_phase_series()
+        movement = sleep.movement_series()
+
+        self.assertEqual(list(phases.codes), [4, 2, 2, 1])
+        self.assertEqual(phases.codes.dtype.name, "uint8")
+        self.assertEqual(phases.label_names(), ["awake", "light", "light", "deep"])
+        self.assertEqual(list(phases.timestamps())[-1], START + 900)
+        self.assertEqual(movement.interval, 30)
+        self.assertEqual(movement.label_names()[-1], "tossing_and_turning")
+
+    def test_missing_series(self):
+        """Test that missing fields decode to None."""
+        sleep = SleepModel(**sleep_document(heart_rate=None, bedtime_start=None))
+
+        self.assertIsNone(sleep.heart_rate_series())
+        self.assertIsNone(sleep.hrv_series())
+        self.assertIsNone(sleep.sleep_phase_series())
+
+    def test_without_numpy(self):
+        """Test that the series fall back to array.array without NumPy."""
+        with patch("oura_api_client.utils.arrays.np", None):
+            sleep = SleepModel(**sleep_document())
+            series = sleep.heart_rate_series()
+            phases = sleep.sleep_phase_series()
+
+        self.assertIsInstance(series.items, array)
+        self.assertEqual(series.items.typecode, "d")
+        self.assertTrue(math.isnan(series.items[0]))
+        self.assertEqual(list(series.timestamps()), [START, START + 300, START + 600])
+        self.assertEqual(phases.codes, array("B", [4, 2, 2, 1]))
+
+
+class TestSessionSeries(unittest.TestCase):
+    """Test decoding the session time series."""
+
+    def test_session_series(self):
+        """Test the heart rate and HRV samples of a session."""
+        session = SessionModel(
+            id="session-1",
+            day="2024-03-01",
+            start_datetime="2024-03-01T23:00:00+02:00",
+            end_datetime="2024-03-01T23:15:00+02:00",
+            type="meditation",
+            heart_rate=HEART_RATE,
+            heart_rate_variability={"interval": 5, "items": [40, None], "timestamp": START},
+        )
+
+        self.assertEqual(list(session.heart_rate_series().timestamps()), [START, START + 300, START + 600])
+        self.assertEqual(list(session.heart_rate_variability_series().timestamps()), [START, START + 5])
+        self.assertEqual(session.heart_rate_variability_series().items[0], 40.0)
+
+
+class TestSeriesHelpers(unittest.TestCase):
+    """Test the series constructors."""
+
+    def test_digit_codes(self):
+        """Test decoding digit strings."""
+        self.assertEqual(list(digit_codes("0123456789")), list(range(10)))
+        self.assertEqual(len(digit_codes("")), 0)
+
+    def test_constructors(self):
+        """Test building series directly."""
+        self.assertIsNone(SampleSeries.from_value(None))
+        self.assertIsNone(CategorySeries.from_string(None, 300, START))
+        self.assertEqual(CategorySeries.from_string("12", 300, START).labels, ())
+
+
+class TestActivitySeries(unittest.TestCase):
+    """Test decoding the daily activity classes and MET samples."""
+
+    def setUp(self):
+        self.activity = DailyActivityModel(
+            id="activity-1",
+            day="2024-03-01",
+            timestamp="2024-03-01T23:00:00+02:00",
+            class_5_min="0011233345",
+            met={"interval": 60, "items": [1.0, None, 2.5], "timestamp": "2024-03-01T23:00:00.000+02:00"},
+        )
+
+    def test_activity_classes(self):
+        """Test decoding class_5_min into uint8 codes from the day's timestamp."""
+        classes = self.activity.activity_class_series()
+
+        self.assertEqual(list(classes.codes), [0, 0, 1, 1, 2, 3, 3, 3, 4, 5])
+        self.assertEqual(classes.codes.dtype.name, "uint8")
+        self.assertEqual(classes.timestamps()[1], START + 300)
+        self.assertEqual(classes.label_names()[-1], "high")
+
+    def test_activity_minutes(self):
+        """Test the minutes per activity class, with and without NumPy."""
+        expected = {"non_wear": 10.0, "rest": 10.0, "inactive": 5.0, "low": 15.0, "medium": 5.0, "high": 5.0}
+
+        self.assertEqual(self.activity.activity_minutes(), expected)
+        with patch("oura_api_client.models.time_series.np", None), \
+                patch("oura_api_client.utils.arrays.np", None):
+            self.assertEqual(self.activity.activity_minutes(), expected)
+
+    def test_met_series(self):
+        """Test that MET samples align with their computed timestamps."""
+        met = self.activity.met_series()
+
+        self.assertTrue(math.isnan(met.items[1]))
+        self.assertEqual(list(met.timestamps()), [START, START + 60, START + 120])
+
+    def test_missing_fields(self):
+        """Test documents without classes or MET samples."""
+        activity = DailyActivityModel(id="activity-2", day="2024-03-02", timestamp="2024-03-02T04:00:00+00:00")
+
+        self.assertIsNone(activity.activity_class_series())
+        self.assertIsNone(activity.met_series())
+        self.assertEqual(sum(activity.activity_minutes().values()), 0)
+
+
+class TestTimeSeriesData(unittest.TestCase):
+    """Test the array-backed TimeSeriesData model."""
+
+    def setUp(self):
+        self.series = TimeSeriesData(interval=60, items=[1, None, 3, 4], timestamp="2024-03-01T21:00:00Z")
+
+    def test_items_are_a_float64_buffer(self):
+        """Test that items are stored contiguously with NaN for None."""
+        self.assertIsInstance(self.series.items, array)
+        self.assertEqual(memoryview(self.series.items).format, "d")
+        self.assertTrue(math.isnan(self.series.items[1]))
+        self.assertEqual(self.series.timestamp, START)
+
+    def test_numpy_view_shares_memory(self):
+        """Test that to_numpy() does not copy the items."""
+        values = self.series.to_numpy()
+
+        self.series.items[0] = 7.0
+
+        self.assertEqual(values[0], 7.0)
+
+    def test_timestamps_and_pairs(self):
+        """Test computing sample times from the interval."""
+        self.assertEqual(list(self.series.timestamps()), [START, START + 60, START + 120, START + 180])
+
+        pairs = self.series.to_pairs()
+
+        self.assertEqual(pairs.shape, (4, 2))
+        self.assertEqual(list(pairs[3]), [START + 180, 4.0])
+
+    def test_slice(self):
+        """Test slicing by time range, end excluded."""
+        middle = self.series.slice(START + 30, START + 180)
+        tail = self.series.slice(datetime.fromtimestamp(START + 120, timezone.utc))
+
+        self.assertIsInstance(middle, TimeSeriesData)
+        self.assertEqual(middle.timestamp, START + 60)
+        self.assertEqual(middle.model_dump()["items"], [None, 3.0])
+        self.assertEqual(list(tail.items), [3.0, 4.0])
+        self.assertEqual(len(self.series.slice(end=START)), 0)
+        self.assertEqual(len(self.series.slice(START + 600)), 0)
+
+    def test_serialization_round_trip(self):
+        """Test that missing samples serialize back to null."""
+        dumped = self.series.model_dump()
+
+        self.assertEqual(dumped["items"], [1.0, None, 3.0, 4.0])
+        self.assertEqual(TimeSeriesData(**dumped), self.series)
+        self.assertIn('"items":[1.0,null,3.0,4.0]', self.series.model_dump_json())
+
+    def test_without_numpy(self):
+        """Test the pure array fallbacks."""
+        with patch("oura_api_client.models.time_series.np", None), \
+                patch("oura_api_client.utils.arrays.np", None):
+            pairs = list(self.series.to_pairs())
+            with self.assertRaises(ImportError):
+                self.series.to_numpy()
+
+        self.assertEqual(pairs[0], (START, 1.0))
+
+    def test_sample_series_share_the_time_methods(self):
+        """Test slicing the series decoded from sleep documents."""
+        sleep = SleepModel(**sleep_document())
+
+        phases = sleep.sleep_phase_series().slice(START + 300, START + 900)
+        heart_rate = sleep.heart_rate_series().slice(START + 300)
+
+        self.assertEqual(list(phases.codes), [2, 2])
+        self.assertEqual(phases.label_names(), ["light", "light"])
+        self.assertEqual(list(heart_rate.items), [52.0, 50.5])
+        self.assertEqual(heart_rate.to_pairs()[0][0], START + 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+"""Tests for the pluggable HTTP transports."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+import urllib3
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from oura_api_client.api.client import OuraClient
+from oura_api_client.aio import AsyncOuraClient
+from oura_api_client.models.tag import TagResponse
+from oura_api_client.exceptions import (
+    OuraAPIError, OuraNotFoundError, OuraRateLimitError,
+    OuraTimeoutError, OuraConnectionError
+)
+from oura_api_client.transports import (
+    RequestsTransport,
+    Urllib3Transport,
+    HttpxTransport,
+    ReplayTransport,
+    AsyncReplayTransport,
+    RecordingTransport,
+    TransportResponse
+)
+from oura_api_client.utils import RetryConfig
+
+TAG_URL = "https://api.ouraring.com/v2/usercollection/tag"
+
+
+def _tag(day):
+    return {
+        "id": f"tag-{day}",
+        "day": day,
+        "text": "coffee",
+        "timestamp": f"{day}T08:00:00+00:00",
+        "tags": ["coffee"],
+    }
+
+
+class TestTransportResponse(unittest.TestCase):
+    """Test the library-neutral response object."""
+
+    def test_ok_and_json(self):
+        response = TransportResponse(200, b'{"a": 1}', {"Content-Type": "application/json"})
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json(), {"a": 1})
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertFalse(TransportResponse(404).ok)
+
+
+class TestDefaultTransport(unittest.TestCase):
+    """Test the default requests based transport."""
+
+    def test_default_transport_wraps_pooled_session(self):
+        client = OuraClient("test_token")
+        self.assertIsInstance(client.transport, RequestsTransport)
+        self.assertIs(client.http_session, client.transport.session)
+
+    def test_close_keeps_caller_session_open(self):
+        session = MagicMock()
+        RequestsTransport(session).close()
+        session.close.assert_not_called()
+
+    def test_custom_transport_has_no_session(self):
+        client = OuraClient("test_token", transport=ReplayTransport())
+        self.assertIsNone(client.http_session)
+
+
+class TestReplayTransport(unittest.TestCase):
+    """Test routers, retry and error mapping over the replay transport."""
+
+    def setUp(self):
+        self.transport = ReplayTransport()
+        self.client = OuraClient("test_token", transport=self.transport)
+
+    def test_router_over_replay(self):
+        self.transport.add(
+            "GET", TAG_URL, params={"start_date": "2024-03-01"},
+            json_body={"data": [_tag("2024-03-01")], "next_token": None}
+        )
+
+        response = self.client.tag.get_tag_documents(start_date="2024-03-01")
+
+        self.assertIsInstance(response, TagResponse)
+        self.assertEqual(response.data[0].text, "coffee")
+        self.assertEqual(self.transport.calls[0]["params"], {"start_date": "2024-03-01"})
+
+    def test_stream_over_replay(self):
+        self.transport.add("GET", "https://api.ouraring.com/v2/usercollection/heartrate",
+                           json_body={"data": [{"timestamp": "2024-03-01T00:00:00+00:00",
+                                                "bpm": 60, "source": "rest"}],
+                                      "next_token": "next"})
+        self.transport.add("GET", "https://api.ouraring.com/v2/usercollection/heartrate",
+                           params={"next_token": "next"},
+                           json_body={"data": [{"timestamp": "2024-03-01T00:05:00+00:00",
+                                                "bpm": 62, "source": "rest"}],
+                                      "next_token": None})
+
+        bpms = [sample.bpm for sample in self.client.heartrate.stream()]
+
+        self.assertEqual(bpms, [60, 62])
+
+    @patch("time.sleep")
+    def test_retry_over_replay(self, mock_sleep):
+        self.transport.add("GET", TAG_URL, status_code=500, json_body={"error": "boom"})
+        self.transport.add("GET", TAG_URL, json_body={"data": [], "next_token": None})
+        self.client.retry_config = RetryConfig(max_retries=2, base_delay=0.01, jitter=False)
+
+        response = self.client.tag.get_tag_documents()
+
+        self.assertEqual(response.data, [])
+        self.assertEqual(len(self.transport.calls), 2)
+        mock_sleep.assert_called_once()
+
+    def test_error_mapping_over_replay(self):
+        self.transport.add("GET", f"{TAG_URL}/missing", status_code=404, reason="Not Found",
+                           json_body={"error": "Document not found"})
+        self.transport.add("GET", TAG_URL, status_code=429, headers={"retry-after": "900"},
+                           json_body={"error": "Rate limited"})
+
+        with self.assertRaises(OuraNotFoundError) as cm:
+            self.client.tag.get_tag_document("missing")
+        self.assertEqual(cm.exception.message, "Document not found")
+
+        with self.assertRaises(OuraRateLimitError) as cm:
+            self.client.tag.get_tag_documents()
+        self.assertEqual(cm.exception.retry_after, 900)
+
+    def test_unrecorded_request(self):
+        with self.assertRaises(OuraAPIError) as cm:
+            self.client.tag.get_tag_documents()
+        self.assertIn("No recorded response", cm.exception.message)
+
+    def test_record_save_and_load(self):
+        recorder = RecordingTransport(self.transport)
+        self.transport.add("GET", TAG_URL, json_body={"data": [_tag("2024-03-01")], "next_token": None})
+        OuraClient("test_token", transport=recorder).tag.get_tag_documents()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "tags.json")
+            recorder.save(path)
+            replayed = OuraClient("test_token", transport=ReplayTransport.load(path))
+            response = replayed.tag.get_tag_documents()
+
+        self.assertEqual(len(recorder.recordings), 1)
+        self.assertEqual(response.data[0].id, "tag-2024-03-01")
+
+
+class TestUrllib3Transport(unittest.TestCase):
+    """Test the urllib3 transport."""
+
+    def setUp(self):
+        self.pool_manager = MagicMock()
+        self.client = OuraClient(
+            "test_token",
+            transport=Urllib3Transport(pool_manager=self.pool_manager),
+            retry_config=RetryConfig(enabled=False)
+        )
+
+    def test_request(self):
+        raw = MagicMock(status=200, data=json.dumps({"data": [], "next_token": None}).encode(),
+                        headers={}, reason="OK")
+        self.pool_manager.request.return_value = raw
+
+        self.client.tag.get_tag_documents(start_date="2024-03-01", end_date="2024-03-02")
+
+        args, kwargs = self.pool_manager.request.call_args
+        self.assertEqual(args, ("GET", f"{TAG_URL}?start_date=2024-03-01&end_date=2024-03-02"))
+        self.assertIsNone(kwargs["body"])
+        self.assertFalse(kwargs["retries"])
+
+    def test_json_body(self):
+        self.pool_manager.request.return_value = MagicMock(status=204, data=b"", headers={}, reason="")
+
+        result = self.client._make_request("/test", method="POST", json_data={"a": 1})
+
+        self.assertEqual(result, {})
+        self.assertEqual(self.pool_manager.request.call_args.kwargs["body"], b'{"a": 1}')
+
+    def test_caller_pool_manager_is_not_cleared(self):
+        self.client.close()
+        self.pool_manager.clear.assert_not_called()
+
+    def test_error_mapping(self):
+        self.pool_manager.request.side_effect = urllib3.exceptions.ReadTimeoutError(None, TAG_URL, "slow")
+        with self.assertRaises(OuraTimeoutError):
+            self.client.tag.get_tag_documents()
+
+        self.pool_manager.request.side_effect = urllib3.exceptions.ProtocolError("reset")
+        with self.assertRaises(OuraConnectionError):
+            self.client.tag.get_tag_documents()
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttpxTransport(unittest.TestCase):
+    """Test the synchronous httpx transport."""
+
+    def test_request_and_errors(self):
+        def handler(request):
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"error": "Document not found"})
+            return httpx.Response(200, json={"data": [_tag("2024-03-01")], "next_token": None})
+
+        transport = HttpxTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        client = OuraClient("test_token", transport=transport)
+
+        self.assertEqual(len(client.tag.get_tag_documents().data), 1)
+        with self.assertRaises(OuraNotFoundError):
+            client.tag.get_tag_document("missing")
+        client.close()
+        self.assertFalse(transport.client.is_closed)
+        transport.client.close()
+
+    def test_owned_client_is_closed(self):
+        transport = HttpxTransport()
+        transport.close()
+        self.assertTrue(transport.client.is_closed)
+
+
+class TestAsyncReplayTransport(unittest.IsolatedAsyncioTestCase):
+    """Test the async client over the replay transport."""
+
+    async def test_async_router_over_replay(self):
+        transport = AsyncReplayTransport()
+        transport.add("GET", TAG_URL, json_body={"data": [_tag("2024-03-01")], "next_token": None})
+        client = AsyncOuraClient("test_token", transport=transport)
+
+        response = await client.tag.get_tag_documents()
+
+        self.assertEqual(response.data[0].id, "tag-2024-03-01")
+        self.assertEqual(transport.calls[0]["method"], "GET")
+
+
+if __name__ == "__main__":
+    unittest.main()